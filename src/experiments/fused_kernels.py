@@ -0,0 +1,233 @@
+import math
+from importlib.util import find_spec
+
+import numpy as np
+
+from src.utils.alignment_stats import AlignmentStats
+from src.utils.precision import (
+    finalize_stats,
+    resolve_precision,
+    score_dtype,
+    score_stats_accumulator,
+)
+from src.experiments.gaussian.score import gaussian_scores
+from src.experiments.laplace.score import laplace_scores
+from src.experiments.gmm.score import gmm_scores
+
+# numba itself is imported on first use of the numba backend, so importing
+# the runners stays cheap.
+NUMBA_AVAILABLE = find_spec("numba") is not None
+
+
+# ============================================================================
+# Backend selection
+# ============================================================================
+#
+#   "numpy" : reference path — materialize V (D, N) and form V Vᵀ / N.
+#   "numba" : fused JIT kernel — each sample's score is evaluated in
+#             registers and folded straight into per-chunk Gram sums, so V
+#             never touches memory; chunks run in parallel with `prange`.
+#   "auto"  : "numba" when it is importable, otherwise "numpy"; always
+#             "numpy" under a float32 precision policy, which the float64
+#             numba kernels do not implement.
+#
+# Sampling stays outside the kernels: the samplers' NumPy Generator streams
+# are what make runs reproducible, and every backend sees identical x.
+BACKENDS = ("numpy", "numba", "auto")
+
+_SCORE_FUNCTIONS = {
+    "gaussian": gaussian_scores,
+    "laplace": laplace_scores,
+    "gmm": gmm_scores,
+}
+
+
+def resolve_backend(backend):
+    """Map a `backend=` argument to "numpy" or "numba"."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Expected one of {BACKENDS}.")
+    if backend == "auto":
+        return "numba" if NUMBA_AVAILABLE else "numpy"
+    if backend == "numba" and not NUMBA_AVAILABLE:
+        raise ImportError("backend='numba' requires the optional numba package.")
+    return backend
+
+
+def _check_family(family):
+    if family not in _SCORE_FUNCTIONS:
+        raise ValueError(
+            f"Unknown family '{family}'. Expected one of {tuple(_SCORE_FUNCTIONS)}."
+        )
+
+
+# ============================================================================
+# Numba kernels
+# ============================================================================
+#
+# Per-sample score functions write v(x_i) into a length-D scratch vector
+# using the same formulas as the NumPy kernels in experiments/*/score.py.
+# `_build_kernel` wraps one of them in a parallel chunked accumulator.
+_KERNELS = {}
+_ELEMENTS = {}
+
+
+def _numba_elements():
+    """Per-sample score functions, defined (and numba imported) on first use."""
+    if _ELEMENTS:
+        return _ELEMENTS
+
+    from numba import njit
+
+    @njit(inline="always")
+    def _gaussian_elem(xi, p, v):
+        r = xi - p[0]
+        v[0] = r / p[1] ** 2
+        v[1] = (r * r - p[1] ** 2) / p[1] ** 3
+
+    @njit(inline="always")
+    def _laplace_elem(xi, p, v):
+        r = xi - p[0]
+        v[0] = np.sign(r) / p[1]
+        v[1] = -1.0 / p[1] + abs(r) / p[1] ** 2
+
+    @njit(inline="always")
+    def _gmm_elem(xi, p, v):
+        mu1, mu2, sigma, w, eps = p[0], p[1], p[2], p[3], p[4]
+        norm_const = 1.0 / (math.sqrt(2.0 * math.pi) * sigma)
+        z1 = (xi - mu1) / sigma
+        z2 = (xi - mu2) / sigma
+        phi1 = norm_const * math.exp(-0.5 * z1 * z1)
+        phi2 = norm_const * math.exp(-0.5 * z2 * z2)
+        px = max(w * phi1 + (1.0 - w) * phi2, eps)
+        v[0] = (w * phi1) / px * (xi - mu1) / sigma**2
+        v[1] = ((1.0 - w) * phi2) / px * (xi - mu2) / sigma**2
+        v[2] = (phi1 - phi2) / px
+
+    _ELEMENTS.update({
+        "gaussian": (_gaussian_elem, 2),
+        "laplace": (_laplace_elem, 2),
+        "gmm": (_gmm_elem, 3),
+    })
+    return _ELEMENTS
+
+
+def _build_kernel(elem, D):
+    from numba import njit, prange
+
+    @njit(parallel=True)
+    def kernel(x, params, chunk_size):
+        n = x.shape[0]
+        num_chunks = max(1, (n + chunk_size - 1) // chunk_size)
+        sums = np.zeros((num_chunks, D))
+        grams = np.zeros((num_chunks, D, D))
+
+        for c in prange(num_chunks):
+            v = np.empty(D)
+            stop = min(n, (c + 1) * chunk_size)
+            for i in range(c * chunk_size, stop):
+                elem(x[i], params, v)
+                for a in range(D):
+                    sums[c, a] += v[a]
+                    for b in range(a, D):
+                        grams[c, a, b] += v[a] * v[b]
+
+        score_sum = sums.sum(axis=0)
+        gram_sum = grams.sum(axis=0)
+        for a in range(D):
+            for b in range(a + 1, D):
+                gram_sum[b, a] = gram_sum[a, b]
+        return score_sum, gram_sum
+
+    return kernel
+
+
+def _numba_kernel(family):
+    """Compile (once per process) the fused kernel of a family."""
+    if family not in _KERNELS:
+        elem, D = _numba_elements()[family]
+        _KERNELS[family] = _build_kernel(elem, D)
+    return _KERNELS[family]
+
+
+# ============================================================================
+# Public entry points
+# ============================================================================
+def fused_score_stats(family, x, *params, backend="auto", chunk_size=65_536,
+                      precision=None):
+    """
+    Score statistics of a one-dimensional family in a single pass over x.
+
+    Parameters
+    ----------
+    family : str
+        "gaussian" (μ, σ), "laplace" (μ, b) or "gmm" (μ1, μ2, σ, w[, eps]).
+    x : np.ndarray
+        Samples, shape (N,).
+    *params :
+        Model parameters, in the order of the family's score function.
+    backend : str
+        "numba", "numpy" or "auto" (see `BACKENDS`). The NumPy path
+        streams chunks through one reused `out=` buffer.
+    chunk_size : int
+        Samples per chunk (per parallel task for numba).
+    precision : str or None
+        Precision policy of the NumPy path (see `src.utils.precision`);
+        None uses the global policy. The numba kernels always accumulate
+        in float64, so "auto" takes the NumPy path under a float32 policy
+        and an explicit "numba" rejects it.
+
+    Returns
+    -------
+    AlignmentStats
+        `second_moment()` gives the empirical C.
+    """
+    _check_family(family)
+    precision = resolve_precision(precision)
+    if backend == "auto" and precision != "float64":
+        backend = "numpy"
+    backend = resolve_backend(backend)
+
+    if backend == "numba":
+        if precision != "float64":
+            raise ValueError("backend='numba' only supports precision='float64'.")
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        p = np.array(params + ((1e-12,) if family == "gmm" and len(params) == 4 else ()),
+                     dtype=np.float64)
+        score_sum, gram_sum = _numba_kernel(family)(x, p, int(chunk_size))
+        return AlignmentStats(x.size, score_sum, gram_sum)
+
+    dtype = score_dtype(precision)
+    x = np.ascontiguousarray(x, dtype=dtype)
+    score_fn = _SCORE_FUNCTIONS[family]
+    D = 3 if family == "gmm" else 2
+    stats = score_stats_accumulator(D, precision)
+    buf = np.empty(D * min(chunk_size, x.size), dtype=dtype)
+    for start in range(0, x.size, chunk_size):
+        xb = x[start:start + chunk_size]
+        stats.update(score_fn(xb, *params, out=buf[:D * xb.size].reshape(D, xb.size)))
+    return finalize_stats(stats)
+
+
+def score_second_moment(family, x, *params, backend="numpy", precision=None,
+                        chunk_size=None):
+    """
+    E[v vᵀ] over the samples x, as used by the experiment runners.
+
+    backend="numpy" with float64 precision and chunk_size=None keeps the
+    reference computation V Vᵀ / N on the full score matrix (bit-identical
+    to earlier releases); float32 policies, "numba" / "auto" and an explicit
+    chunk_size use `fused_score_stats` (default chunk: 65 536 samples).
+    """
+    _check_family(family)
+    precision = resolve_precision(precision)
+    chunk = {} if chunk_size is None else {"chunk_size": int(chunk_size)}
+    if precision != "float64":
+        return fused_score_stats(
+            family, x, *params, backend=backend, precision=precision, **chunk
+        ).second_moment()
+    if resolve_backend(backend) == "numpy" and chunk_size is None:
+        V = _SCORE_FUNCTIONS[family](x, *params)
+        return (V @ V.T) / float(len(x))
+    return fused_score_stats(
+        family, x, *params, backend=backend, precision=precision, **chunk
+    ).second_moment()
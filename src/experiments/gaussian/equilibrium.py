@@ -2,18 +2,21 @@ import numpy as np
 
 from .model import gaussian_sample
 from .score import gaussian_scores
-from src.utils.alignment_core import (
-    compute_alignment_operator,
-    alignment_scalar_numpy,
-    compute_phi,
-)
+from src.experiments.fused_kernels import score_second_moment
+from src.utils.alignment_core import AlignmentResult
+from src.utils.precision import resolve_precision
+from src.utils.profiles import resolve_setting
+from src.utils.quadrature import check_estimator, gauss_hermite_outer
 
 
 def compute_gaussian_equilibrium(
-    num_samples: int = 200_000,
+    num_samples: int = None,
     mu: float = 0.0,
     sigma: float = 1.0,
     seed: int = 123,
+    estimator: str = "monte_carlo",
+    backend: str = "numpy",
+    precision: str = None,
 ):
     """
     Compute the Fisher-equilibrium experiment for a univariate Gaussian model.
@@ -32,10 +35,18 @@ def compute_gaussian_equilibrium(
            amplitude φ = max{√A, 0}.
 
     Args:
-        num_samples (int): Number of Monte Carlo samples from the model.
+        num_samples (int|None): Number of Monte Carlo samples from the model
+            (None: active scale profile, see `src.utils.profiles`).
         mu (float): Mean parameter μ of the Gaussian model.
         sigma (float): Standard deviation σ > 0 of the Gaussian model.
         seed (int): Random seed for reproducible sampling.
+        estimator (str): "monte_carlo" (sample average) or "quadrature"
+            (Gauss–Hermite, exact for the polynomial Gaussian scores; the
+            sample count and seed are then unused).
+        backend (str): Monte Carlo accumulation of C — "numpy"
+            (materialized V Vᵀ / N), "numba" (fused JIT kernel) or "auto".
+        precision (str | None): Precision policy for the Monte Carlo C
+            (see `src.utils.precision`); None uses the global policy.
 
     Returns:
         dict: Dictionary with the following entries:
@@ -48,20 +59,27 @@ def compute_gaussian_equilibrium(
             - "mu":   Mean parameter used.
             - "sigma": Standard deviation used.
             - "num_samples": Number of samples used.
+            - "seed": Random seed used.
+            - "estimator": Estimator used for C.
+            - "precision": Precision policy used for C.
     """
+    check_estimator(estimator)
+    precision = resolve_precision(precision)
+    num_samples = resolve_setting("num_samples", num_samples)
+    chunk_size = resolve_setting("chunk_size")
 
     # ------------------------------------------------------------------
     # 1. Sample from the Gaussian model: x ~ N(μ, σ²)
-    # ------------------------------------------------------------------
-    x = gaussian_sample(mu, sigma, num_samples, seed)
-
-    # ------------------------------------------------------------------
-    # 2. Compute score vectors v(x | θ) for each sample.
+    #    (Monte Carlo only; the quadrature estimator needs no samples.)
+    #
+    # 2. Score vectors v(x | θ) for each sample.
     #    For the univariate Gaussian with θ = (μ, σ), the score typically
     #    has dimension 2: v = (∂μ log p, ∂σ log p)^T evaluated at θ.
-    #    gaussian_scores must return an array of shape (D, N).
+    #    They are evaluated in step 4, where the selected backend either
+    #    materializes V (2, N) or fuses them with the accumulation.
     # ------------------------------------------------------------------
-    V = gaussian_scores(x, mu, sigma)  # shape: (2, N)
+    if estimator == "monte_carlo":
+        x = gaussian_sample(mu, sigma, num_samples, seed)
 
     # ------------------------------------------------------------------
     # 3. Analytic Fisher matrix G for univariate Gaussian N(μ, σ²).
@@ -84,36 +102,39 @@ def compute_gaussian_equilibrium(
     #    C = E_q[ v v^T ] ≈ (1 / N) Σ_n v_n v_n^T
     #
     #    Aquí V tiene forma (D, N), así que V @ V.T ∈ R^{D×D}.
+    #
+    #    With estimator="quadrature" the expectation is taken exactly with
+    #    a Gauss–Hermite rule instead of the sample average.
     # ------------------------------------------------------------------
-    C = (V @ V.T) / float(num_samples)
+    if estimator == "quadrature":
+        C = gauss_hermite_outer(gaussian_scores, (mu, sigma), mu, sigma)
+    else:
+        C = score_second_moment(
+            "gaussian", x, mu, sigma, backend=backend, precision=precision,
+            chunk_size=chunk_size,
+        )
 
     # ------------------------------------------------------------------
     # 5. Alignment diagnostic via H = G^{-1/2} C G^{-1/2}.
     #
-    #    alignment_scalar_numpy(G, C) devuelve:
-    #        A   = Σ_i (λ_i - 1)
+    #    AlignmentResult(G, C) calcula una sola vez, al primer acceso:
+    #        H   = G^{-1/2} C G^{-1/2}
     #        λ_i = eigenvalues(H)
-    #
-    #    compute_phi(A) devuelve φ = max{√A, 0}.
+    #        A   = Σ_i (λ_i - 1)
+    #        φ   = max{√A, 0}
     # ------------------------------------------------------------------
-    A_q, eigvals = alignment_scalar_numpy(G, C)
-    phi_q = compute_phi(A_q)
-
-    # También devolvemos H explícitamente para análisis posterior.
-    H = compute_alignment_operator(G, C)
+    result = AlignmentResult(G, C, structure="diagonal")
 
     # ------------------------------------------------------------------
     # 6. Empaquetar todo en un diccionario para trazabilidad
     #    y uso directo en notebooks/figuras.
     # ------------------------------------------------------------------
     return {
-        "G": G,
-        "C": C,
-        "H": H,
-        "lambdas": eigvals,
-        "A": A_q,
-        "phi": phi_q,
+        **result.to_dict(),
         "mu": mu,
         "sigma": sigma,
         "num_samples": num_samples,
+        "seed": seed,
+        "estimator": estimator,
+        "precision": precision,
     }
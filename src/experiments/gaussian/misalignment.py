@@ -2,11 +2,11 @@ import numpy as np
 
 from .model import gaussian_sample
 from .score import gaussian_scores
-from src.utils.alignment_core import (
-    compute_alignment_operator,
-    alignment_scalar_numpy,
-    compute_phi,
-)
+from src.experiments.fused_kernels import score_second_moment
+from src.utils.alignment_core import AlignmentResult
+from src.utils.precision import resolve_precision
+from src.utils.profiles import resolve_setting
+from src.utils.quadrature import check_estimator, gauss_hermite_outer
 
 
 def compute_gaussian_misalignment(
@@ -14,8 +14,11 @@ def compute_gaussian_misalignment(
     sigma_model: float = 1.0,
     mu_data: float = 1.0,
     sigma_data: float = 1.0,
-    num_samples: int = 200_000,
+    num_samples: int = None,
     seed: int = 321,
+    estimator: str = "monte_carlo",
+    backend: str = "numpy",
+    precision: str = None,
 ):
     """
     Compute the misalignment experiment for a univariate Gaussian model.
@@ -42,8 +45,15 @@ def compute_gaussian_misalignment(
         sigma_model (float):  Model σ parameter.
         mu_data (float):      Data mean parameter μ for q(x).
         sigma_data (float):   Data σ parameter.
-        num_samples (int):    Monte Carlo sample count.
+        num_samples (int|None): Monte Carlo sample count (None: active
+                              scale profile, see `src.utils.profiles`).
         seed (int):           RNG seed for reproducibility.
+        estimator (str):      "monte_carlo" or "quadrature" (Gauss–Hermite
+                              over q, exact and sample-free).
+        backend (str):        "numpy", "numba" (fused JIT kernel) or
+                              "auto" for the Monte Carlo C.
+        precision (str|None): Precision policy for the Monte Carlo C
+                              (None: global policy).
 
     Returns:
         dict: {
@@ -58,18 +68,24 @@ def compute_gaussian_misalignment(
             "mu_data": data μ,
             "sigma_data": data σ,
             "num_samples": number of samples,
+            "seed": random seed,
+            "estimator": estimator used for C,
+            "precision": precision policy used for C,
         }
     """
+    check_estimator(estimator)
+    precision = resolve_precision(precision)
+    num_samples = resolve_setting("num_samples", num_samples)
+    chunk_size = resolve_setting("chunk_size")
 
     # -----------------------------------------------------------
     # 1. Generate data *from q(x)* = N(mu_data, sigma_data²)
+    #    (Monte Carlo only; the quadrature estimator needs no samples.)
+    # 2. Scores v(x|θ) under the *model* distribution p(x|θ) are
+    #    evaluated by the selected backend in step 4.
     # -----------------------------------------------------------
-    x = gaussian_sample(mu_data, sigma_data, num_samples, seed)
-
-    # -----------------------------------------------------------
-    # 2. Compute scores v(x|θ) under the *model* distribution p(x|θ)
-    # -----------------------------------------------------------
-    V = gaussian_scores(x, mu_model, sigma_model)  # shape: (2, N)
+    if estimator == "monte_carlo":
+        x = gaussian_sample(mu_data, sigma_data, num_samples, seed)
 
     # -----------------------------------------------------------
     # 3. Analytic Fisher matrix for univariate Gaussian
@@ -87,30 +103,32 @@ def compute_gaussian_misalignment(
     # 4. Empirical score covariance under q:
     #        C = E_q[v v^T]
     # -----------------------------------------------------------
-    C = (V @ V.T) / float(num_samples)
+    if estimator == "quadrature":
+        C = gauss_hermite_outer(
+            gaussian_scores, (mu_model, sigma_model), mu_data, sigma_data
+        )
+    else:
+        C = score_second_moment(
+            "gaussian", x, mu_model, sigma_model, backend=backend,
+            precision=precision, chunk_size=chunk_size,
+        )
 
     # -----------------------------------------------------------
     # 5. Alignment diagnostics (eigenvalues λ_i, scalar A, amplitude φ)
     # -----------------------------------------------------------
-    A_q, eigvals = alignment_scalar_numpy(G, C)
-    phi_q = compute_phi(A_q)
-
-    # Full alignment operator H for inspection or plotting
-    H = compute_alignment_operator(G, C)
+    result = AlignmentResult(G, C, structure="diagonal")
 
     # -----------------------------------------------------------
     # 6. Output dictionary for reproducibility
     # -----------------------------------------------------------
     return {
-        "G": G,
-        "C": C,
-        "H": H,
-        "lambdas": eigvals,
-        "A": A_q,
-        "phi": phi_q,
+        **result.to_dict(),
         "mu_model": mu_model,
         "sigma_model": sigma_model,
         "mu_data": mu_data,
         "sigma_data": sigma_data,
         "num_samples": num_samples,
+        "seed": seed,
+        "estimator": estimator,
+        "precision": precision,
     }
@@ -1,5 +1,8 @@
 import numpy as np
 
+from src.utils.rng_streams import SampleStream
+
+
 def gaussian_sample(mu: float, sigma: float, num_samples: int, seed: int | None = None):
     """
     Draw samples from a univariate Gaussian distribution N(mu, sigma^2).
@@ -27,4 +30,26 @@ def gaussian_sample(mu: float, sigma: float, num_samples: int, seed: int | None
         x = gaussian_sample(mu=0.0, sigma=1.0, num_samples=1000, seed=42)
     """
     rng = np.random.default_rng(seed)
-    return rng.normal(mu, sigma, size=num_samples)
+    return _draw_gaussian((rng,), num_samples, mu, sigma)
+
+
+def _draw_gaussian(gens, n, mu, sigma):
+    return gens[0].normal(mu, sigma, size=n)
+
+
+def gaussian_stream(mu: float, sigma: float, num_samples: int,
+                    seed: int | None = None, block_size: int | None = None):
+    """
+    Chunk-invariant version of `gaussian_sample`.
+
+    `gaussian_stream(...).iter_chunks(chunk)` yields the samples in chunks
+    whose concatenation does not depend on the chunk size or on how the
+    index range is split across workers. With block_size=None it equals
+    `gaussian_sample(mu, sigma, num_samples, seed)` bit for bit; an integer
+    block_size switches to independent Philox streams per block (see
+    `src.utils.rng_streams`).
+    """
+    return SampleStream(
+        lambda gens, n: _draw_gaussian(gens, n, mu, sigma),
+        [("normal", 1)], num_samples, seed, block_size,
+    )
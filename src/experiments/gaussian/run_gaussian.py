@@ -1,8 +1,9 @@
 from .equilibrium import compute_gaussian_equilibrium
 from .misalignment import compute_gaussian_misalignment
+from src.utils.profiles import profile_scope
 
 
-def run_all_gaussian():
+def run_all_gaussian(profile=None):
     """
     Run the two canonical Gaussian experiments:
 
@@ -12,6 +13,11 @@ def run_all_gaussian():
     This function simply orchestrates the two computations and returns
     their full result dictionaries.
 
+    Args:
+        profile (str|None): Scale profile for both runs ("smoke", "paper",
+                            "production"; None: active profile, see
+                            `src.utils.profiles`).
+
     Returns:
         tuple(dict, dict):
             - eq:  Output dictionary from compute_gaussian_equilibrium()
@@ -23,8 +29,9 @@ def run_all_gaussian():
         - It intentionally performs no analysis itself; downstream code
           inspects fields like A, φ, eigenvalues, etc.
     """
-    eq = compute_gaussian_equilibrium()
-    mis = compute_gaussian_misalignment()
+    with profile_scope(profile):
+        eq = compute_gaussian_equilibrium()
+        mis = compute_gaussian_misalignment()
     return eq, mis
 
 
@@ -1,21 +1,24 @@
 import numpy as np
 
-from .model import gmm_sample
+from .model import gmm_pdf, gmm_sample
 from .score import gmm_scores
-from src.utils.alignment_core import (
-    compute_alignment_operator,
-    alignment_scalar_numpy,
-    compute_phi,
-)
+from src.experiments.fused_kernels import score_second_moment
+from src.utils.alignment_core import AlignmentResult
+from src.utils.precision import resolve_precision
+from src.utils.profiles import resolve_setting
+from src.utils.quadrature import check_estimator, expected_score_outer
 
 
 def compute_gmm_equilibrium(
-    num_samples: int = 200_000,
+    num_samples: int = None,
     mu1: float = 0.0,
     mu2: float = 4.0,
     sigma: float = 1.0,
     w: float = 0.5,
     seed: int = 555,
+    estimator: str = "monte_carlo",
+    backend: str = "numpy",
+    precision: str = None,
 ):
     """
     Compute the Fisher-equilibrium alignment diagnostics for a
@@ -38,12 +41,21 @@ def compute_gmm_equilibrium(
         - φ = 0
 
     Args:
-        num_samples (int): Number of Monte Carlo samples.
+        num_samples (int|None): Number of Monte Carlo samples (None: active
+            scale profile, see `src.utils.profiles`).
         mu1 (float): Mean of first Gaussian component.
         mu2 (float): Mean of second Gaussian component.
         sigma (float): Shared standard deviation.
         w (float): Mixture weight for component 1. (1-w for component 2)
         seed (int): Random seed for sampling.
+        estimator (str): "monte_carlo" or "quadrature". The quadrature
+            estimator integrates E_p[v v^T] once with adaptive
+            Gauss–Kronrod; since q = p it serves as both G and C, so the
+            equilibrium check is exact (A = 0 to quadrature tolerance).
+        backend (str): "numpy", "numba" (fused JIT kernel) or "auto" for
+            the Monte Carlo G and C.
+        precision (str | None): Precision policy for the Monte Carlo G and
+            C (see `src.utils.precision`); None uses the global policy.
 
     Returns:
         dict with fields:
@@ -53,50 +65,75 @@ def compute_gmm_equilibrium(
             "lambdas": eigenvalues of H
             "A": scalar alignment diagnostic
             "phi": rectified amplitude
-            "mu1", "mu2", "sigma", "w", "num_samples": metadata
+            "mu1", "mu2", "sigma", "w", "num_samples", "seed": metadata
+            "estimator": estimator used for G and C
+            "precision": precision policy used for G and C
     """
+    check_estimator(estimator)
+    precision = resolve_precision(precision)
+    num_samples = resolve_setting("num_samples", num_samples)
+    chunk_size = resolve_setting("chunk_size")
 
     # ------------------------------------------------------------------
-    # 1. Sample from the model distribution p(x|θ)
-    # ------------------------------------------------------------------
-    x_model = gmm_sample(mu1, mu2, sigma, w, num_samples, seed=seed)
-
-    # Compute scores under the same model p
-    V_model = gmm_scores(x_model, mu1, mu2, sigma, w)
-
-    # Empirical Fisher estimate (score variance under model)
-    G = (V_model @ V_model.T) / float(num_samples)
-
-    # ------------------------------------------------------------------
-    # 2. Independent dataset from the same model for empirical curvature
+    # 1–2. Fisher metric G under p and score covariance C under q = p
     # ------------------------------------------------------------------
-    x_data = gmm_sample(mu1, mu2, sigma, w, num_samples, seed=seed + 1)
-    V_data = gmm_scores(x_data, mu1, mu2, sigma, w)
-
-    # Empirical covariance under q(x) = p(x|θ)
-    C = (V_data @ V_data.T) / float(num_samples)
+    if estimator == "quadrature":
+        G = expected_score_outer(
+            gmm_scores, (mu1, mu2, sigma, w),
+            lambda t: gmm_pdf(t, mu1, mu2, sigma, w),
+            breakpoints=[mu1, mu2],
+        )
+        C = G.copy()
+    else:
+        G, C = _monte_carlo_G_C(
+            num_samples, mu1, mu2, sigma, w, seed, backend, precision, chunk_size
+        )
 
     # ------------------------------------------------------------------
     # 3. Alignment diagnostics
     # ------------------------------------------------------------------
-    A_q, eigvals = alignment_scalar_numpy(G, C)
-    phi_q = compute_phi(A_q)
-
-    H = compute_alignment_operator(G, C)
+    result = AlignmentResult(G, C)
 
     # ------------------------------------------------------------------
     # 4. Output results
     # ------------------------------------------------------------------
     return {
-        "G": G,
-        "C": C,
-        "H": H,
-        "lambdas": eigvals,
-        "A": A_q,
-        "phi": phi_q,
+        **result.to_dict(),
         "mu1": mu1,
         "mu2": mu2,
         "sigma": sigma,
         "w": w,
         "num_samples": num_samples,
+        "seed": seed,
+        "estimator": estimator,
+        "precision": precision,
     }
+
+
+def _monte_carlo_G_C(num_samples, mu1, mu2, sigma, w, seed, backend, precision,
+                     chunk_size=None):
+    """Sample-based G and C for the GMM equilibrium experiment."""
+
+    # ------------------------------------------------------------------
+    # 1. Sample from the model distribution p(x|θ)
+    # ------------------------------------------------------------------
+    x_model = gmm_sample(mu1, mu2, sigma, w, num_samples, seed=seed)
+
+    # Empirical Fisher estimate (score variance under the same model p)
+    G = score_second_moment(
+        "gmm", x_model, mu1, mu2, sigma, w, backend=backend, precision=precision,
+        chunk_size=chunk_size,
+    )
+
+    # ------------------------------------------------------------------
+    # 2. Independent dataset from the same model for empirical curvature
+    # ------------------------------------------------------------------
+    x_data = gmm_sample(mu1, mu2, sigma, w, num_samples, seed=seed + 1)
+
+    # Empirical covariance under q(x) = p(x|θ)
+    C = score_second_moment(
+        "gmm", x_data, mu1, mu2, sigma, w, backend=backend, precision=precision,
+        chunk_size=chunk_size,
+    )
+
+    return G, C
@@ -0,0 +1,302 @@
+import numpy as np
+
+from .model import gmm_mixture_sample
+from .score import _as_mixture, _log_responsibilities, gmm_mixture_scores, gmm_score_stats
+from src.utils.alignment_core import AlignmentResult
+from src.utils.alignment_stats import AlignmentStats
+
+
+# =============================================================================
+# EM sufficient statistics
+# =============================================================================
+#
+# For a diagonal-covariance mixture the M-step only needs, per component k,
+#
+#     N_k  = Σ_n r_nk,     S_k = Σ_n r_nk x_n,     Q_k = Σ_n r_nk x_n²
+#
+# (elementwise in the d coordinates). They are additive over chunks, so a
+# full E-step is one streaming pass over x with bounded memory.
+
+def _init_mixture(x, num_components, chunk_size, seed):
+    """Means drawn from the first chunk, shared scale, uniform weights."""
+    head = np.asarray(x[:chunk_size], dtype=np.float64)
+    if head.ndim == 1:
+        head = head[:, None]
+    rng = np.random.default_rng(seed)
+    idx = rng.choice(len(head), size=num_components, replace=False)
+    means = head[idx]
+    scales = np.broadcast_to(head.std(axis=0), means.shape).copy()
+    weights = np.full(num_components, 1.0 / num_components)
+    return means, scales, weights
+
+
+def _chunk_em_stats(x, means, scales, weights, score_stats=None):
+    """
+    E-step sufficient statistics (and optionally score statistics) of one
+    chunk, from a single evaluation of the log responsibilities.
+    """
+    if score_stats is not None:
+        V, r, log_p = gmm_mixture_scores(
+            x, means, scales, weights, return_responsibilities=True
+        )
+        score_stats.update(V)
+        x = _as_mixture(x, means, scales, weights)[0]
+    else:
+        x, means, scales, weights = _as_mixture(x, means, scales, weights)
+        log_r, log_p = _log_responsibilities(x, means, scales, weights)
+        r = np.exp(log_r)
+
+    return r.sum(axis=1), r @ x, r @ (x * x), float(log_p.sum())
+
+
+def _m_step(Nk, Sk, Qk, total, min_scale):
+    """Closed-form M-step from accumulated sufficient statistics."""
+    Nk_safe = np.maximum(Nk, 1e-300)[:, None]
+    means = Sk / Nk_safe
+    var = Qk / Nk_safe - means**2
+    scales = np.sqrt(np.maximum(var, min_scale**2))
+    weights = Nk / total
+    return means, scales, weights
+
+
+def _squeeze(means, scales, univariate):
+    return (means[:, 0], scales[:, 0]) if univariate else (means, scales)
+
+
+# =============================================================================
+# Batch EM (one streaming pass per iteration)
+# =============================================================================
+def fit_gmm_em(
+    x,
+    num_components: int = 2,
+    means=None,
+    scales=None,
+    weights=None,
+    max_iter: int = 200,
+    tol: float = 1e-8,
+    chunk_size: int = 65_536,
+    min_scale: float = 1e-6,
+    score_stats: bool = True,
+    seed: int = 0,
+):
+    """
+    Fit a K-component diagonal-covariance Gaussian mixture by EM, streaming
+    over x in chunks (x may be an in-memory array or a memmap).
+
+    Each iteration is a single pass over the data: the log responsibilities
+    computed by the score kernel (`gmm_mixture_scores`) give both the EM
+    sufficient statistics and — with `score_stats=True` — the score
+    statistics at the current parameters. Iteration stops when the mean
+    log-likelihood improves by less than `tol` or after `max_iter` passes;
+    either way the parameters returned are the ones the last pass was
+    evaluated at (no M-step follows it), so `result["stats"]` is exactly the
+    score statistics of the fitted model on x and no further data pass is
+    needed for the alignment diagnostics.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Samples, shape (N,) or (N, d).
+    num_components : int
+        K, used when `means` is not given.
+    means, scales, weights : np.ndarray or None
+        Optional initial parameters (as in `gmm_mixture_scores`).
+    max_iter : int
+        Maximum number of EM passes.
+    tol : float
+        Convergence threshold on the change of the mean log-likelihood.
+    chunk_size : int
+        Samples per chunk.
+    min_scale : float
+        Floor on every component standard deviation.
+    score_stats : bool
+        Accumulate AlignmentStats of the scores during each pass.
+    seed : int
+        Seed for the initial means.
+
+    Returns
+    -------
+    dict:
+        "means", "scales", "weights": fitted parameters ((K,) for
+                                      univariate x, (K, d) otherwise)
+        "log_likelihood":  mean log-likelihood per pass
+        "num_iter":        number of passes
+        "converged":       whether `tol` was reached
+        "stats":           AlignmentStats of the scores at the fitted θ
+                           (None if score_stats=False)
+    """
+    n = len(x)
+    univariate = np.ndim(x) == 1
+
+    if means is None:
+        means, scales, weights = _init_mixture(x, num_components, chunk_size, seed)
+    else:
+        _, means, scales, weights = _as_mixture(x[:1], means, scales, weights)
+        means, scales = means.copy(), scales.copy()
+
+    history = []
+    converged = False
+    stats = None
+
+    for iteration in range(max_iter):
+        if score_stats:
+            K, d = means.shape
+            stats = AlignmentStats.zeros(2 * K * d + K)
+
+        Nk = Sk = Qk = 0.0
+        loglik = 0.0
+        for start in range(0, n, chunk_size):
+            nk, sk, qk, ll = _chunk_em_stats(
+                x[start:start + chunk_size], means, scales, weights, stats
+            )
+            Nk, Sk, Qk, loglik = Nk + nk, Sk + sk, Qk + qk, loglik + ll
+
+        history.append(loglik / n)
+        if len(history) > 1 and abs(history[-1] - history[-2]) < tol:
+            converged = True
+            break
+        if iteration == max_iter - 1:
+            # Out of passes: keep θ of this pass so it matches `stats`
+            break
+
+        means, scales, weights = _m_step(Nk, Sk, Qk, n, min_scale)
+
+    out_means, out_scales = _squeeze(means, scales, univariate)
+    return {
+        "means": out_means,
+        "scales": out_scales,
+        "weights": weights,
+        "log_likelihood": np.array(history),
+        "num_iter": len(history),
+        "converged": converged,
+        "stats": stats,
+    }
+
+
+# =============================================================================
+# Stepwise (mini-batch) EM
+# =============================================================================
+def fit_gmm_stepwise(
+    x,
+    num_components: int = 2,
+    means=None,
+    scales=None,
+    weights=None,
+    batch_size: int = 4_096,
+    num_epochs: int = 1,
+    kappa: float = 0.6,
+    min_scale: float = 1e-6,
+    seed: int = 0,
+):
+    """
+    Stepwise (online) EM for data too large for many full passes.
+
+    Normalized sufficient statistics are updated after every mini-batch,
+
+        s ← (1 − ρ_t) s + ρ_t ŝ_batch,     ρ_t = (t + 2)^{-κ},  κ ∈ (½, 1],
+
+    followed by an M-step, so a single epoch over x often lands close to the
+    batch-EM solution. Batches are taken in order (chunk-friendly for
+    memmaps) from a per-epoch random permutation of batch offsets.
+
+    Returns
+    -------
+    dict:
+        "means", "scales", "weights": fitted parameters
+        "num_steps": number of mini-batch updates
+    """
+    n = len(x)
+    univariate = np.ndim(x) == 1
+    rng = np.random.default_rng(seed)
+
+    if means is None:
+        means, scales, weights = _init_mixture(x, num_components, batch_size, seed)
+    else:
+        _, means, scales, weights = _as_mixture(x[:1], means, scales, weights)
+        means, scales = means.copy(), scales.copy()
+
+    # Normalized statistics of the initial model
+    s_N = weights.copy()
+    s_S = weights[:, None] * means
+    s_Q = weights[:, None] * (scales**2 + means**2)
+
+    t = 0
+    for _ in range(num_epochs):
+        for start in rng.permutation(np.arange(0, n, batch_size)):
+            xb = x[start:start + batch_size]
+            nk, sk, qk, _ = _chunk_em_stats(xb, means, scales, weights)
+            m = float(len(xb))
+
+            rho = (t + 2.0) ** (-kappa)
+            s_N = (1 - rho) * s_N + rho * nk / m
+            s_S = (1 - rho) * s_S + rho * sk / m
+            s_Q = (1 - rho) * s_Q + rho * qk / m
+            means, scales, weights = _m_step(s_N, s_S, s_Q, s_N.sum(), min_scale)
+            t += 1
+
+    out_means, out_scales = _squeeze(means, scales, univariate)
+    return {
+        "means": out_means,
+        "scales": out_scales,
+        "weights": weights,
+        "num_steps": t,
+    }
+
+
+# =============================================================================
+# Fit-then-diagnose
+# =============================================================================
+def compute_gmm_fit_alignment(
+    x,
+    num_components: int = 2,
+    num_model_samples: int = 200_000,
+    chunk_size: int = 65_536,
+    seed: int = 888,
+    **fit_kwargs,
+):
+    """
+    Fit a K-component mixture to x and compute the alignment diagnostics of
+    the fitted model on the same data.
+
+    C comes from the score statistics of the final EM pass (no extra pass
+    over x). As for the other GMM experiments, G is the empirical Fisher
+    matrix from samples of the fitted model. At the MLE the mean score
+    vanishes, so C is also the score covariance.
+
+    The K softmax logits are only identified up to a common shift (their
+    scores sum to zero), so the last logit is pinned at η_K = 0 and its row
+    and column are dropped from G and C before forming H.
+
+    Returns
+    -------
+    dict with "G", "C", "H", "lambdas", "A", "phi", "means", "scales",
+    "weights", "mean_score", "log_likelihood", "num_iter", "converged",
+    "num_samples".
+    """
+    fit = fit_gmm_em(
+        x, num_components=num_components, chunk_size=chunk_size,
+        score_stats=True, seed=seed, **fit_kwargs
+    )
+    stats = fit["stats"]
+    keep = slice(0, stats.dim - 1)
+    C = stats.second_moment()[keep, keep]
+
+    x_model = gmm_mixture_sample(
+        fit["means"], fit["scales"], fit["weights"], num_model_samples, seed=seed + 1
+    )
+    G = gmm_score_stats(
+        x_model, fit["means"], fit["scales"], fit["weights"], chunk_size=chunk_size
+    ).second_moment()[keep, keep]
+
+    result = AlignmentResult(G, C)
+    return {
+        **result.to_dict(),
+        "means": fit["means"],
+        "scales": fit["scales"],
+        "weights": fit["weights"],
+        "mean_score": stats.mean()[keep],
+        "log_likelihood": fit["log_likelihood"],
+        "num_iter": fit["num_iter"],
+        "converged": fit["converged"],
+        "num_samples": len(x),
+    }
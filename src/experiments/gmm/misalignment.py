@@ -1,11 +1,11 @@
 import numpy as np
-from .model import gmm_sample
+from .model import gmm_pdf, gmm_sample
 from .score import gmm_scores
-from src.utils.alignment_core import (
-    compute_alignment_operator,
-    alignment_scalar_numpy,
-    compute_phi,
-)
+from src.experiments.fused_kernels import score_second_moment
+from src.utils.alignment_core import AlignmentResult
+from src.utils.precision import resolve_precision
+from src.utils.profiles import resolve_setting
+from src.utils.quadrature import check_estimator, expected_score_outer
 
 
 def compute_gmm_misalignment(
@@ -17,8 +17,11 @@ def compute_gmm_misalignment(
     mu2_data: float = 5.0,
     sigma_data: float = 1.0,
     w_data: float = 0.7,
-    num_samples: int = 200_000,
+    num_samples: int = None,
     seed: int = 777,
+    estimator: str = "monte_carlo",
+    backend: str = "numpy",
+    precision: str = None,
 ):
     """
     Compute the Gaussian Mixture Model (GMM) misalignment experiment.
@@ -48,7 +51,14 @@ def compute_gmm_misalignment(
 
     Args:
         Parameters define the model mixture and the data mixture separately.
-        num_samples controls Monte Carlo precision.
+        num_samples controls Monte Carlo precision (None: active scale
+        profile, see `src.utils.profiles`).
+        estimator selects "monte_carlo" sampling or sample-free adaptive
+        Gauss–Kronrod "quadrature" for both G and C.
+        backend selects "numpy", "numba" (fused JIT kernel) or "auto" for
+        the Monte Carlo G and C.
+        precision selects the score precision policy for the Monte Carlo
+        G and C (None: global policy, see `src.utils.precision`).
 
     Returns:
         dict containing:
@@ -59,49 +69,59 @@ def compute_gmm_misalignment(
             - A: scalar alignment deviation
             - phi: rectified amplitude
             - all mixture parameters for traceability
+            - estimator: estimator used for G and C
+            - precision: precision policy used for G and C
     """
+    check_estimator(estimator)
+    precision = resolve_precision(precision)
+    num_samples = resolve_setting("num_samples", num_samples)
+    chunk_size = resolve_setting("chunk_size")
+    theta_model = (mu1_model, mu2_model, sigma_model, w_model)
 
-    # -----------------------------------------------------------
-    # 1. Empirical Fisher matrix from model distribution p(x|θ_model)
-    # -----------------------------------------------------------
-    x_model = gmm_sample(
-        mu1_model, mu2_model, sigma_model, w_model,
-        num_samples, seed=seed
-    )
-    V_model = gmm_scores(
-        x_model, mu1_model, mu2_model, sigma_model, w_model
-    )
-    G = (V_model @ V_model.T) / float(num_samples)
+    if estimator == "quadrature":
+        # Deterministic E_p[v v^T] and E_q[v v^T], split at the component
+        # means of both mixtures.
+        breakpoints = [mu1_model, mu2_model, mu1_data, mu2_data]
+        G = expected_score_outer(
+            gmm_scores, theta_model, lambda t: gmm_pdf(t, *theta_model),
+            breakpoints=breakpoints,
+        )
+        C = expected_score_outer(
+            gmm_scores, theta_model,
+            lambda t: gmm_pdf(t, mu1_data, mu2_data, sigma_data, w_data),
+            breakpoints=breakpoints,
+        )
+    else:
+        # -----------------------------------------------------------
+        # 1. Empirical Fisher matrix from model distribution p(x|θ_model)
+        # -----------------------------------------------------------
+        x_model = gmm_sample(*theta_model, num_samples, seed=seed)
+        G = score_second_moment(
+            "gmm", x_model, *theta_model, backend=backend, precision=precision,
+            chunk_size=chunk_size,
+        )
 
-    # -----------------------------------------------------------
-    # 2. Empirical covariance from data distribution q(x)
-    # -----------------------------------------------------------
-    x_data = gmm_sample(
-        mu1_data, mu2_data, sigma_data, w_data,
-        num_samples, seed=seed + 1
-    )
-    V_data = gmm_scores(
-        x_data, mu1_model, mu2_model, sigma_model, w_model
-    )
-    C = (V_data @ V_data.T) / float(num_samples)
+        # -----------------------------------------------------------
+        # 2. Empirical covariance from data distribution q(x)
+        # -----------------------------------------------------------
+        x_data = gmm_sample(
+            mu1_data, mu2_data, sigma_data, w_data,
+            num_samples, seed=seed + 1
+        )
+        C = score_second_moment(
+            "gmm", x_data, *theta_model, backend=backend, precision=precision,
+            chunk_size=chunk_size,
+        )
 
     # -----------------------------------------------------------
     # 3. Alignment diagnostics
     # -----------------------------------------------------------
-    A_q, eigvals = alignment_scalar_numpy(G, C)
-    phi_q = compute_phi(A_q)
-    H = compute_alignment_operator(G, C)
-
+    result = AlignmentResult(G, C)
     # -----------------------------------------------------------
     # 4. Package results
     # -----------------------------------------------------------
     return {
-        "G": G,
-        "C": C,
-        "H": H,
-        "lambdas": eigvals,
-        "A": A_q,
-        "phi": phi_q,
+        **result.to_dict(),
         "mu1_model": mu1_model,
         "mu2_model": mu2_model,
         "sigma_model": sigma_model,
@@ -111,4 +131,7 @@ def compute_gmm_misalignment(
         "sigma_data": sigma_data,
         "w_data": w_data,
         "num_samples": num_samples,
+        "seed": seed,
+        "estimator": estimator,
+        "precision": precision,
     }
@@ -1,5 +1,8 @@
 import numpy as np
 
+from src.utils.rng_streams import SampleStream
+
+
 def gmm_sample(
     mu1: float,
     mu2: float,
@@ -41,16 +44,107 @@ def gmm_sample(
           should ensure correct values.
     """
 
-    # RNG instance
+    # RNG instance (assignments and noise drawn one after the other)
     rng = np.random.default_rng(seed)
+    return _draw_gmm((rng, rng), num_samples, mu1, mu2, sigma, w)
+
 
+def _draw_gmm(gens, n, mu1, mu2, sigma, w):
     # Bernoulli assignments: True = component 1, False = component 2
-    z = rng.uniform(size=num_samples) < w
+    z = gens[0].uniform(size=n) < w
 
     # Gaussian noise for each selected component
-    eps = rng.normal(loc=0.0, scale=sigma, size=num_samples)
+    eps = gens[1].normal(loc=0.0, scale=sigma, size=n)
 
     # Component-wise means applied using np.where
-    x = np.where(z, mu1 + eps, mu2 + eps)
+    return np.where(z, mu1 + eps, mu2 + eps)
+
+
+def gmm_stream(mu1: float, mu2: float, sigma: float, w: float, num_samples: int,
+               seed: int | None = None, block_size: int | None = None):
+    """
+    Chunk-invariant version of `gmm_sample` (identical to it for
+    block_size=None). Assignments and noise are separate streams; in the
+    legacy layout the noise stream starts N uniform draws into the
+    generator, reached by jump-ahead.
+    """
+    return SampleStream(
+        lambda gens, n: _draw_gmm(gens, n, mu1, mu2, sigma, w),
+        [("uniform", 1), ("normal", 1)], num_samples, seed, block_size,
+    )
+
+
+def gmm_pdf(x, mu1: float, mu2: float, sigma: float, w: float):
+    """
+    Evaluate the two-component mixture density
+
+        p(x) = w * N(x | mu1, sigma^2) + (1 - w) * N(x | mu2, sigma^2).
+
+    Used as the weight function of the deterministic quadrature estimator.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    norm_const = 1.0 / (np.sqrt(2.0 * np.pi) * sigma)
+    return norm_const * (
+        w * np.exp(-0.5 * ((x - mu1) / sigma) ** 2)
+        + (1.0 - w) * np.exp(-0.5 * ((x - mu2) / sigma) ** 2)
+    )
+
+
+def gmm_mixture_sample(means, scales, weights, num_samples, seed=None):
+    """
+    Draw samples from a K-component, diagonal-covariance Gaussian mixture:
+
+        p(x) = Σ_k w_k N(x | μ_k, diag(σ_k²))
+
+    Args:
+        means (np.ndarray): Component means, shape (K,) or (K, d).
+        scales (float | np.ndarray): Standard deviations, scalar, (K,) or (K, d).
+        weights (np.ndarray): Mixture weights, shape (K,), summing to one.
+        num_samples (int): Number of samples to generate.
+        seed (int | None): Optional RNG seed for reproducibility.
+
+    Returns:
+        np.ndarray:
+            Samples of shape (num_samples,) for univariate means, or
+            (num_samples, d) otherwise.
+    """
+    rng = np.random.default_rng(seed)
+    return _draw_mixture((rng, rng), num_samples, *_mixture_layout(means, scales, weights))
+
 
-    return x
+def _mixture_layout(means, scales, weights):
+    means = np.asarray(means, dtype=np.float64)
+    univariate = means.ndim == 1
+    if univariate:
+        means = means[:, None]
+    K, d = means.shape
+
+    scales = np.asarray(scales, dtype=np.float64)
+    if scales.ndim == 1:
+        scales = scales[:, None]
+    scales = np.broadcast_to(scales, (K, d))
+    return means, scales, np.asarray(weights, dtype=np.float64), univariate
+
+
+def _draw_mixture(gens, n, means, scales, weights, univariate):
+    K, d = means.shape
+
+    # Component assignments, then Gaussian noise around the chosen mean
+    z = gens[0].choice(K, size=n, p=weights)
+    eps = gens[1].normal(size=(n, d))
+    x = means[z] + scales[z] * eps
+
+    return x[:, 0] if univariate else x
+
+
+def gmm_mixture_stream(means, scales, weights, num_samples, seed=None, block_size=None):
+    """
+    Chunk-invariant version of `gmm_mixture_sample` (identical to it for
+    block_size=None; see `gmm_stream`).
+    """
+    layout = _mixture_layout(means, scales, weights)
+    d = layout[0].shape[1]
+    return SampleStream(
+        lambda gens, n: _draw_mixture(gens, n, *layout),
+        [("uniform", 1), ("normal", d)], num_samples, seed, block_size,
+    )
@@ -1,8 +1,9 @@
 from .equilibrium import compute_gmm_equilibrium
 from .misalignment import compute_gmm_misalignment
+from src.utils.profiles import profile_scope
 
 
-def run_all_gmm():
+def run_all_gmm(profile=None):
     """
     Execute the two canonical Gaussian Mixture Model (GMM) experiments:
 
@@ -25,6 +26,11 @@ def run_all_gmm():
     This function simply orchestrates both computations and returns their
     corresponding diagnostic dictionaries. It performs no numerical work itself.
 
+    Args:
+        profile (str|None): Scale profile for both runs ("smoke", "paper",
+                            "production"; None: active profile, see
+                            `src.utils.profiles`).
+
     Returns:
         tuple(dict, dict):
             - eq:  Output of compute_gmm_equilibrium()
@@ -36,8 +42,9 @@ def run_all_gmm():
             - figure generation
             - quick sanity checks via CLI
     """
-    eq = compute_gmm_equilibrium()
-    mis = compute_gmm_misalignment()
+    with profile_scope(profile):
+        eq = compute_gmm_equilibrium()
+        mis = compute_gmm_misalignment()
     return eq, mis
 
 
@@ -1,7 +1,7 @@
 import numpy as np
 
 
-def _gaussian_pdf(x, mu, sigma):
+def _gaussian_pdf(x, mu, sigma, out=None):
     """
     Evaluate the univariate Gaussian density N(mu, sigma^2) at the points x.
 
@@ -9,14 +9,23 @@ def _gaussian_pdf(x, mu, sigma):
     -----
     This function returns the pointwise probability density, not the log-density.
     It is used internally for computing mixture responsibilities and score
-    components in the GMM model.
+    components in the GMM model. With `out` the density is written in place.
     """
     norm_const = 1.0 / (np.sqrt(2.0 * np.pi) * sigma)
-    z = (x - mu) / sigma
-    return norm_const * np.exp(-0.5 * z**2)
+    if out is None:
+        z = (x - mu) / sigma
+        return norm_const * np.exp(-0.5 * z**2)
 
+    np.subtract(x, mu, out=out)
+    out /= sigma
+    np.square(out, out=out)
+    out *= -0.5
+    np.exp(out, out=out)
+    out *= norm_const
+    return out
 
-def gmm_scores(x, mu1, mu2, sigma, w, eps=1e-12):
+
+def gmm_scores(x, mu1, mu2, sigma, w, eps=1e-12, out=None, work=None):
     """
     Compute the score function (gradient of the log-likelihood) for a
     two-component univariate Gaussian mixture model:
@@ -41,6 +50,14 @@ def gmm_scores(x, mu1, mu2, sigma, w, eps=1e-12):
     eps : float, optional
         Lower bound applied to the mixture density to avoid numerical
         underflow when computing responsibilities and ratios.
+    out : np.ndarray, optional
+        Preallocated (3, N) output buffer (float64, or float32 for reduced
+        precision), filled in place.
+    work : np.ndarray, optional
+        Preallocated (3, N) scratch space, by default of the dtype of
+        `out`, for the component
+        densities and the mixture density. Passing both buffers makes the
+        call allocation-free.
 
     Returns
     -------
@@ -73,24 +90,221 @@ def gmm_scores(x, mu1, mu2, sigma, w, eps=1e-12):
       used in information geometry and curvature-based model evaluation.
     """
     x = np.asarray(x)
+    n = x.shape[0]
+    if out is None:
+        out = np.empty((3, n))
+    if work is None:
+        work = np.empty((3, n), dtype=out.dtype)
+    v_mu1, v_mu2, v_w = out
+    phi1, phi2, p = work
 
     # Component densities
-    phi1 = _gaussian_pdf(x, mu1, sigma)
-    phi2 = _gaussian_pdf(x, mu2, sigma)
+    _gaussian_pdf(x, mu1, sigma, out=phi1)
+    _gaussian_pdf(x, mu2, sigma, out=phi2)
+
+    # Mixture density (with stability floor); v_w row used as scratch
+    np.multiply(phi1, w, out=p)
+    np.multiply(phi2, 1.0 - w, out=v_w)
+    p += v_w
+    np.maximum(p, eps, out=p)
 
-    # Mixture density (with stability floor)
-    p = w * phi1 + (1.0 - w) * phi2
-    p = np.maximum(p, eps)
+    # Score component for the mixture weight
+    np.subtract(phi1, phi2, out=v_w)
+    v_w /= p
 
-    # Component responsibilities
-    r1 = (w * phi1) / p
-    r2 = ((1.0 - w) * phi2) / p
+    # Component responsibilities (overwrite the densities)
+    phi1 *= w
+    phi1 /= p
+    phi2 *= 1.0 - w
+    phi2 /= p
 
     # Score components for the means
-    v_mu1 = r1 * (x - mu1) / (sigma**2)
-    v_mu2 = r2 * (x - mu2) / (sigma**2)
+    np.subtract(x, mu1, out=v_mu1)
+    v_mu1 *= phi1
+    v_mu1 /= sigma**2
+    np.subtract(x, mu2, out=v_mu2)
+    v_mu2 *= phi2
+    v_mu2 /= sigma**2
 
-    # Score component for the mixture weight
-    v_w = (phi1 - phi2) / p
+    return out
+
+
+# =============================================================================
+# K-component mixtures in log space
+# =============================================================================
+
+def _as_mixture(x, means, scales, weights):
+    """
+    Normalize mixture inputs to the multivariate layout.
+
+    Returns x as (N, d), means and scales as (K, d) and weights as (K,).
+    Univariate inputs (x of shape (N,), means of shape (K,)) map to d = 1,
+    and a scalar or (K,) scale is broadcast to every dimension.
+    """
+    means = np.asarray(means, dtype=np.float64)
+    if means.ndim == 1:
+        means = means[:, None]
+    K, d = means.shape
+
+    scales = np.asarray(scales, dtype=np.float64)
+    if scales.ndim == 1:
+        scales = scales[:, None]          # one scale per component
+    scales = np.broadcast_to(scales, (K, d))
+    weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), (K,))
+
+    x = np.asarray(x, dtype=np.float64)
+    if x.ndim == 1:
+        x = x[:, None]
+
+    return x, means, scales, weights
+
+
+def gmm_log_responsibilities(x, means, scales, weights):
+    """
+    Evaluate all K components of a diagonal-covariance Gaussian mixture as a
+    single (K, N) array in log space.
+
+        log φ_k(x) = Σ_j [ -½ ((x_j − μ_kj) / σ_kj)² − log σ_kj − ½ log 2π ]
+        log p(x)   = logsumexp_k ( log w_k + log φ_k(x) )
+        log r_k(x) = log w_k + log φ_k(x) − log p(x)
+
+    Unlike `gmm_scores`, no density is ever formed in linear space, so
+    well-separated components do not underflow and no `eps` floor is needed.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Samples, shape (N,) or (N, d).
+    means : np.ndarray
+        Component means, shape (K,) or (K, d).
+    scales : float or np.ndarray
+        Component standard deviations, scalar, (K,) or (K, d).
+    weights : np.ndarray
+        Mixture weights, shape (K,), summing to one.
+
+    Returns
+    -------
+    tuple:
+        log_r : np.ndarray of shape (K, N)
+            Log responsibilities.
+        log_p : np.ndarray of shape (N,)
+            Log mixture density.
+    """
+    return _log_responsibilities(*_as_mixture(x, means, scales, weights))
+
+
+def _log_responsibilities(x, means, scales, weights):
+    """`gmm_log_responsibilities` on inputs already passed through `_as_mixture`."""
+    z = (x[None, :, :] - means[:, None, :]) / scales[:, None, :]      # (K, N, d)
+    log_phi = (
+        -0.5 * np.sum(z * z, axis=2)
+        - np.sum(np.log(scales), axis=1)[:, None]
+        - 0.5 * means.shape[1] * np.log(2.0 * np.pi)
+    )                                                                 # (K, N)
+
+    log_joint = np.log(weights)[:, None] + log_phi
+    m = np.max(log_joint, axis=0)
+    log_p = m + np.log(np.sum(np.exp(log_joint - m[None, :]), axis=0))
+
+    return log_joint - log_p[None, :], log_p
+
+
+def gmm_mixture_scores(x, means, scales, weights, return_responsibilities=False,
+                       out=None):
+    """
+    Score block of a K-component (optionally multivariate, diagonal
+    covariance) Gaussian mixture
+
+        p(x) = Σ_k w_k N(x | μ_k, diag(σ_k²)).
+
+    The weights are parameterized by softmax logits η (w = softmax(η)),
+    which keeps the score bounded and avoids the constrained-w
+    parameterization of the two-component `gmm_scores`:
+
+        ∂/∂μ_kj log p = r_k (x_j − μ_kj) / σ_kj²
+        ∂/∂σ_kj log p = r_k ( (x_j − μ_kj)² / σ_kj³ − 1 / σ_kj )
+        ∂/∂η_k  log p = r_k − w_k
+
+    Responsibilities r_k come from `gmm_log_responsibilities`.
+
+    Parameters
+    ----------
+    x, means, scales, weights :
+        As in `gmm_log_responsibilities`.
+    return_responsibilities : bool
+        Also return the (K, N) responsibilities and the (N,) log density,
+        so callers such as EM can reuse them without a second pass.
+    out : np.ndarray, optional
+        Preallocated (2·K·d + K, N) float64 buffer. Each parameter block is
+        filled in place through a (K, d, N) view, so the buffer's rows must
+        be contiguous along N (any row slice of a C-ordered array is).
+
+    Returns
+    -------
+    np.ndarray of shape (2·K·d + K, N)
+        Rows ordered as [means (K·d, row-major), scales (K·d), logits (K)].
+    (optionally) r : np.ndarray of shape (K, N), log_p : np.ndarray (N,)
+    """
+    x, means, scales, weights = _as_mixture(x, means, scales, weights)
+    log_r, log_p = _log_responsibilities(x, means, scales, weights)
+
+    K, d = means.shape
+    n = x.shape[0]
+    r = np.exp(log_r)                                                 # (K, N)
+
+    V = np.empty((2 * K * d + K, n)) if out is None else out
+    v_mean = V[:K * d].reshape(K, d, n)
+    v_scale = V[K * d:2 * K * d].reshape(K, d, n)
+    if not (np.shares_memory(v_mean, V) and np.shares_memory(v_scale, V)):
+        raise ValueError("out rows must be contiguous along the sample axis.")
+
+    inv_var = (1.0 / scales**2)[:, :, None]                           # (K, d, 1)
+
+    # diff = x − μ_k, laid out as (K, d, N)
+    np.subtract(x.T[None, :, :], means[:, :, None], out=v_mean)
+
+    np.square(v_mean, out=v_scale)
+    v_scale *= inv_var / scales[:, :, None]
+    v_scale -= (1.0 / scales)[:, :, None]
+    v_scale *= r[:, None, :]
+
+    v_mean *= inv_var
+    v_mean *= r[:, None, :]
+
+    np.subtract(r, weights[:, None], out=V[2 * K * d:])
+
+    if return_responsibilities:
+        return V, r, log_p
+    return V
+
+
+def gmm_score_stats(x, means, scales, weights, chunk_size=65_536, moments=False,
+                    precision=None):
+    """
+    Accumulate the mixture score statistics over x in fixed-size chunks.
+
+    Only one chunk of (K, chunk_size, d) temporaries is alive at a time, so
+    memory stays bounded for arbitrarily long inputs (including memmaps),
+    e.g. K = 64 mixtures over 10^8 points. Under a float32 `precision`
+    policy the score buffer is float32 (responsibilities are still formed
+    in float64 log space).
+
+    Returns
+    -------
+    AlignmentStats
+        Running count, score sum and Gram sum; `second_moment()` gives C.
+    """
+    from src.utils.precision import finalize_stats, score_dtype, score_stats_accumulator
+
+    K, d = _as_mixture(x[:1], means, scales, weights)[1].shape
+    D = 2 * K * d + K
+
+    stats = score_stats_accumulator(D, precision, moments=moments)
+    n = len(x)
+    buf = np.empty(D * min(chunk_size, n), dtype=score_dtype(precision))
+    for start in range(0, n, chunk_size):
+        xb = x[start:start + chunk_size]
+        out = buf[:D * len(xb)].reshape(D, len(xb))
+        stats.update(gmm_mixture_scores(xb, means, scales, weights, out=out))
 
-    return np.vstack([v_mu1, v_mu2, v_w])
+    return finalize_stats(stats)
@@ -1,18 +1,21 @@
 import numpy as np
-from .model import laplace_sample
+from .model import laplace_pdf, laplace_sample
 from .score import laplace_scores
-from src.utils.alignment_core import (
-    compute_alignment_operator,
-    alignment_scalar_numpy,
-    compute_phi,
-)
+from src.experiments.fused_kernels import score_second_moment
+from src.utils.alignment_core import AlignmentResult
+from src.utils.precision import resolve_precision
+from src.utils.profiles import resolve_setting
+from src.utils.quadrature import check_estimator, expected_score_outer
 
 
 def compute_laplace_equilibrium(
-    num_samples: int = 200_000,
+    num_samples: int = None,
     mu: float = 0.0,
     b: float = 1.0,
     seed: int = 111,
+    estimator: str = "monte_carlo",
+    backend: str = "numpy",
+    precision: str = None,
 ):
     """
     Compute the Fisher-equilibrium diagnostic for the univariate Laplace model:
@@ -39,10 +42,17 @@ def compute_laplace_equilibrium(
         5. Compute eigenvalues λ_i, A, φ
 
     Args:
-        num_samples (int): Monte Carlo sample count.
+        num_samples (int|None): Monte Carlo sample count (None: active scale
+            profile, see `src.utils.profiles`).
         mu (float): Laplace location parameter.
         b (float): Laplace scale parameter (> 0).
         seed (int): RNG seed.
+        estimator (str): "monte_carlo" or "quadrature" (adaptive
+            Gauss–Kronrod split at the kink x = μ; sample-free).
+        backend (str): "numpy", "numba" (fused JIT kernel) or "auto" for
+            the Monte Carlo C.
+        precision (str | None): Precision policy for the Monte Carlo C
+            (see `src.utils.precision`); None uses the global policy.
 
     Returns:
         dict containing:
@@ -53,17 +63,22 @@ def compute_laplace_equilibrium(
             "A"        – scalar deviation (A < 0)
             "phi"      – rectified amplitude (always 0 here)
             parameters – metadata for reproducibility
+            "estimator" – estimator used for C
+            "precision" – precision policy used for C
     """
+    check_estimator(estimator)
+    precision = resolve_precision(precision)
+    num_samples = resolve_setting("num_samples", num_samples)
+    chunk_size = resolve_setting("chunk_size")
 
     # ---------------------------------------------------
     # 1. Sample from Laplace distribution q=p
+    #    (Monte Carlo only; the quadrature estimator needs no samples.)
+    # 2. Laplace scores v = (v_μ, v_b) are evaluated by the selected
+    #    backend in step 4.
     # ---------------------------------------------------
-    x = laplace_sample(mu, b, num_samples, seed)
-
-    # ---------------------------------------------------
-    # 2. Compute Laplace scores v = (v_μ, v_b)
-    # ---------------------------------------------------
-    V = laplace_scores(x, mu, b)
+    if estimator == "monte_carlo":
+        x = laplace_sample(mu, b, num_samples, seed)
 
     # ---------------------------------------------------
     # 3. Fisher information for univariate Laplace:
@@ -81,22 +96,28 @@ def compute_laplace_equilibrium(
     # ---------------------------------------------------
     # 4. Empirical score covariance C under q = p
     # ---------------------------------------------------
-    C = (V @ V.T) / float(num_samples)
+    if estimator == "quadrature":
+        C = expected_score_outer(
+            laplace_scores, (mu, b), lambda t: laplace_pdf(t, mu, b),
+            breakpoints=[mu],
+        )
+    else:
+        C = score_second_moment(
+            "laplace", x, mu, b, backend=backend, precision=precision,
+            chunk_size=chunk_size,
+        )
 
     # ---------------------------------------------------
     # 5. Alignment diagnostics
     # ---------------------------------------------------
-    A_q, eigvals = alignment_scalar_numpy(G, C)
-    phi_q = compute_phi(A_q)  # will be 0 because A < 0
+    result = AlignmentResult(G, C, structure="diagonal")
 
     return {
-        "G": G,
-        "C": C,
-        "H": compute_alignment_operator(G, C),
-        "lambdas": eigvals,
-        "A": A_q,
-        "phi": phi_q,
+        **result.to_dict(),
         "mu": mu,
         "b": b,
         "num_samples": num_samples,
+        "seed": seed,
+        "estimator": estimator,
+        "precision": precision,
     }
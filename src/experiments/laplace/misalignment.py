@@ -1,7 +1,11 @@
 import numpy as np
-from .model import laplace_sample
+from .model import laplace_pdf, laplace_sample
 from .score import laplace_scores
-from src.utils.alignment_core import compute_alignment_operator, alignment_scalar_numpy, compute_phi
+from src.experiments.fused_kernels import score_second_moment
+from src.utils.alignment_core import AlignmentResult
+from src.utils.precision import resolve_precision
+from src.utils.profiles import resolve_setting
+from src.utils.quadrature import check_estimator, expected_score_outer
 
 
 def compute_laplace_misalignment(
@@ -9,8 +13,11 @@ def compute_laplace_misalignment(
     b_model: float = 1.0,
     mu_data: float = 0.0,
     b_data: float = 0.5,
-    num_samples: int = 200_000,
+    num_samples: int = None,
     seed: int = 222,
+    estimator: str = "monte_carlo",
+    backend: str = "numpy",
+    precision: str = None,
 ):
     """
     Compute the misalignment diagnostics for the Laplace distribution.
@@ -43,8 +50,15 @@ def compute_laplace_misalignment(
         b_model (float): Scale parameter of model p.
         mu_data (float): Location parameter of data q.
         b_data (float): Scale parameter of data q.
-        num_samples (int): Number of Monte Carlo samples.
+        num_samples (int|None): Number of Monte Carlo samples (None: active
+            scale profile, see `src.utils.profiles`).
         seed (int): Random seed.
+        estimator (str): "monte_carlo" or "quadrature" (adaptive
+            Gauss–Kronrod split at the kinks μ_model and μ_data).
+        backend (str): "numpy", "numba" (fused JIT kernel) or "auto" for
+            the Monte Carlo C.
+        precision (str | None): Precision policy for the Monte Carlo C
+            (see `src.utils.precision`); None uses the global policy.
 
     Returns:
         dict containing:
@@ -55,17 +69,22 @@ def compute_laplace_misalignment(
             - A     : scalar deviation
             - phi   : rectified coherence amplitude
             - parameters for reproducibility
+            - estimator : estimator used for C
+            - precision : precision policy used for C
     """
+    check_estimator(estimator)
+    precision = resolve_precision(precision)
+    num_samples = resolve_setting("num_samples", num_samples)
+    chunk_size = resolve_setting("chunk_size")
 
     # --------------------------------------------------------
     # 1. Sample from data distribution q(x | μ_data, b_data)
+    #    (Monte Carlo only; the quadrature estimator needs no samples.)
+    # 2. Score vectors under *model* parameters p(x|θ_model) are
+    #    evaluated by the selected backend in step 4.
     # --------------------------------------------------------
-    x = laplace_sample(mu_data, b_data, num_samples, seed)
-
-    # --------------------------------------------------------
-    # 2. Compute score vectors under *model* parameters p(x|θ_model)
-    # --------------------------------------------------------
-    V = laplace_scores(x, mu_model, b_model)
+    if estimator == "monte_carlo":
+        x = laplace_sample(mu_data, b_data, num_samples, seed)
 
     # --------------------------------------------------------
     # 3. Analytic Fisher information for Laplace model p(x|θ)
@@ -83,24 +102,31 @@ def compute_laplace_misalignment(
     # --------------------------------------------------------
     # 4. Empirical covariance matrix under q
     # --------------------------------------------------------
-    C = (V @ V.T) / float(num_samples)
+    if estimator == "quadrature":
+        C = expected_score_outer(
+            laplace_scores, (mu_model, b_model),
+            lambda t: laplace_pdf(t, mu_data, b_data),
+            breakpoints=[mu_model, mu_data],
+        )
+    else:
+        C = score_second_moment(
+            "laplace", x, mu_model, b_model, backend=backend, precision=precision,
+            chunk_size=chunk_size,
+        )
 
     # --------------------------------------------------------
     # 5. Alignment diagnostics
     # --------------------------------------------------------
-    A_q, eigvals = alignment_scalar_numpy(G, C)
-    phi_q = compute_phi(A_q)
+    result = AlignmentResult(G, C, structure="diagonal")
 
     return {
-        "G": G,
-        "C": C,
-        "H": compute_alignment_operator(G, C),
-        "lambdas": eigvals,
-        "A": A_q,
-        "phi": phi_q,
+        **result.to_dict(),
         "mu_model": mu_model,
         "b_model": b_model,
         "mu_data": mu_data,
         "b_data": b_data,
         "num_samples": num_samples,
+        "seed": seed,
+        "estimator": estimator,
+        "precision": precision,
     }
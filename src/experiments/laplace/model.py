@@ -1,5 +1,8 @@
 import numpy as np
 
+from src.utils.rng_streams import SampleStream
+
+
 def laplace_sample(mu: float, b: float, num_samples: int, seed: int | None = None):
     """
     Draw samples from a univariate Laplace (double exponential) distribution:
@@ -31,9 +34,34 @@ def laplace_sample(mu: float, b: float, num_samples: int, seed: int | None = Non
     """
 
     rng = np.random.default_rng(seed)
+    return _draw_laplace((rng,), num_samples, mu, b)
+
 
+def _draw_laplace(gens, n, mu, b):
     # Uniform noise in (-0.5, 0.5)
-    u = rng.uniform(-0.5, 0.5, size=num_samples)
+    u = gens[0].uniform(-0.5, 0.5, size=n)
 
     # Inverse CDF transform for Laplace distribution
     return mu - b * np.sign(u) * np.log(1 - 2 * np.abs(u))
+
+
+def laplace_stream(mu: float, b: float, num_samples: int,
+                   seed: int | None = None, block_size: int | None = None):
+    """
+    Chunk-invariant version of `laplace_sample` (identical to it for
+    block_size=None; see `gaussian_stream` and `src.utils.rng_streams`).
+    The uniform stream lets workers jump ahead in O(1).
+    """
+    return SampleStream(
+        lambda gens, n: _draw_laplace(gens, n, mu, b),
+        [("uniform", 1)], num_samples, seed, block_size,
+    )
+
+
+def laplace_pdf(x, mu: float, b: float):
+    """
+    Evaluate the Laplace density p(x | μ, b) = exp(-|x - μ| / b) / (2b).
+
+    Used as the weight function of the deterministic quadrature estimator.
+    """
+    return np.exp(-np.abs(np.asarray(x) - mu) / b) / (2.0 * b)
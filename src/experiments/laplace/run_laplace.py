@@ -1,8 +1,9 @@
 from .equilibrium import compute_laplace_equilibrium
 from .misalignment import compute_laplace_misalignment
+from src.utils.profiles import profile_scope
 
 
-def run_all_laplace():
+def run_all_laplace(profile=None):
     """
     Execute the two canonical Laplace experiments:
 
@@ -26,13 +27,19 @@ def run_all_laplace():
     It does not perform mathematical logic by itself, but serves as the
     unified interface for Laplace-related experiments in the pipeline.
 
+    Args:
+        profile (str|None): Scale profile for both runs ("smoke", "paper",
+                            "production"; None: active profile, see
+                            `src.utils.profiles`).
+
     Returns:
         tuple(dict, dict):
             - eq:  output of compute_laplace_equilibrium()
             - mis: output of compute_laplace_misalignment()
     """
-    eq = compute_laplace_equilibrium()
-    mis = compute_laplace_misalignment()
+    with profile_scope(profile):
+        eq = compute_laplace_equilibrium()
+        mis = compute_laplace_misalignment()
     return eq, mis
 
 
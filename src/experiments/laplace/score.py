@@ -1,7 +1,7 @@
 import numpy as np
 
 
-def laplace_scores(x: np.ndarray, mu: float, b: float) -> np.ndarray:
+def laplace_scores(x: np.ndarray, mu: float, b: float, out=None) -> np.ndarray:
     """
     Compute the score (gradient of log-likelihood) for the univariate Laplace distribution:
 
@@ -28,6 +28,8 @@ def laplace_scores(x: np.ndarray, mu: float, b: float) -> np.ndarray:
         x (np.ndarray): Input samples of shape (N,).
         mu (float): Location parameter μ of the Laplace distribution.
         b (float): Scale parameter b > 0.
+        out (np.ndarray | None): Optional preallocated (2, N) float64
+            buffer, filled in place and returned.
 
     Returns:
         np.ndarray: Score matrix of shape (2, N):
@@ -35,11 +37,21 @@ def laplace_scores(x: np.ndarray, mu: float, b: float) -> np.ndarray:
             - Row 1: score w.r.t. b
     """
 
-    # Score with respect to μ: derivative of -|x - μ| / b
-    v_mu = np.sign(x - mu) / b
+    if out is None:
+        out = np.empty((2, np.shape(x)[0]))
+    v_mu, v_b = out[0], out[1]
+
+    # Residual x − μ, computed once in the μ row
+    np.subtract(x, mu, out=v_mu)
 
     # Score with respect to b:
     #   ∂b log p = -1/b + |x - μ| / b^2
-    v_b = -1.0 / b + np.abs(x - mu) / (b**2)
+    np.abs(v_mu, out=v_b)
+    v_b /= b**2
+    v_b += -1.0 / b
+
+    # Score with respect to μ: derivative of -|x - μ| / b
+    np.sign(v_mu, out=v_mu)
+    v_mu /= b
 
-    return np.vstack([v_mu, v_b])  # shape: (2, N)
+    return out  # shape: (2, N)
@@ -5,8 +5,15 @@ from torch.utils.data import DataLoader
 from torchvision import datasets, transforms
 
 from .model import build_mnist_model
-from .score import compute_scores
-from src.utils.alignment_core import compute_alignment_operator
+from .score import compute_scores, parameter_blocks
+from src.utils.alignment_core import (
+    AlignmentResult,
+    alignment_regularization_path,
+    compute_block_alignment,
+)
+from src.utils.array_backend import to_numpy
+from src.utils.precision import resolve_precision
+from src.utils.profiles import profile_scope, resolve_setting
 
 
 # =============================================================
@@ -45,16 +52,146 @@ def _get_dataloaders(batch_size, seed):
     return train_loader, test_loader
 
 
+# =============================================================
+#  GRADIENT OUTER-PRODUCT ACCUMULATION
+# =============================================================
+
+class _OuterProductSum:
+    """
+    Running sums Σ g_s g_sᵀ over the index slices s of score vectors g,
+    kept on the device under a precision policy (see `src.utils.precision`).
+
+    "float64" folds every outer product into float64 sums. The float32
+    policies cast g to float32 and sum `block_size` outer products at a
+    time in float32. The block sums are then combined pairwise (binary
+    counter) or with a Kahan-compensated running sum, like
+    `Float32ScoreStats`. `mean()` always returns float64 tensors.
+    """
+
+    def __init__(self, slices, device, precision="float64", block_size=32):
+        self.slices = slices
+        self.device = device
+        self.precision = precision
+        self.block_size = int(block_size)
+        self.dtype = torch.float64 if precision == "float64" else torch.float32
+        self.count = 0
+        self._fill = 0
+        self._block = self._zeros(self.dtype)
+        self._partials = []                   # pairwise: (level, sums)
+        self._sums = self._zeros(torch.float32)
+        self._comp = self._zeros(torch.float32)
+
+    def _zeros(self, dtype):
+        return [
+            torch.zeros((s.stop - s.start,) * 2, dtype=dtype, device=self.device)
+            for s in self.slices
+        ]
+
+    def add(self, g):
+        g = g.to(self.dtype)
+        for M, s in zip(self._block, self.slices):
+            M.addr_(g[s], g[s])
+        self.count += 1
+        if self.precision != "float64":
+            self._fill += 1
+            if self._fill == self.block_size:
+                self._flush()
+
+    def _flush(self):
+        block, self._block, self._fill = self._block, self._zeros(self.dtype), 0
+        if self.precision == "float32_pairwise":
+            level = 0
+            while self._partials and self._partials[-1][0] == level:
+                _, previous = self._partials.pop()
+                block = [a + b for a, b in zip(previous, block)]
+                level += 1
+            self._partials.append((level, block))
+            return
+
+        for k, M in enumerate(block):
+            y = M - self._comp[k]
+            t = self._sums[k] + y
+            self._comp[k] = (t - self._sums[k]) - y
+            self._sums[k] = t
+
+    def mean(self):
+        """Float64 averages of the outer products, one per slice."""
+        if self.precision == "float64":
+            return [M / float(self.count) for M in self._block]
+        if self._fill:
+            self._flush()
+        if self.precision == "float32_pairwise":
+            totals = self._zeros(torch.float64)
+            for _, sums in reversed(self._partials):      # smallest first
+                for T, M in zip(totals, sums):
+                    T += M
+        else:
+            totals = [
+                S.to(torch.float64) - c for S, c in zip(self._sums, self._comp)
+            ]
+        return [T / float(self.count) for T in totals]
+
+
+def _accumulate_outer(model, loss_fn, loader, num_batches, device, blocks=None,
+                      precision="float64"):
+    """
+    Average the outer products g g^T of batch gradients over `num_batches`
+    batches, restarting the loader if it is exhausted.
+
+    Args:
+        model, loss_fn: Network and loss defining the score g = ∂L/∂θ.
+        loader: Iterable of (x, y) batches.
+        num_batches (int): Number of gradient evaluations.
+        device (torch.device): Device for forward/backward passes.
+        blocks (list[tuple[str, slice]] or None):
+            If given, only the diagonal blocks g_b g_b^T are accumulated
+            (see `parameter_blocks`); the dense D×D matrix is never formed.
+        precision (str): Precision policy of the accumulation
+            ("float64", "float32_pairwise" or "float32_kahan").
+
+    Returns:
+        torch.Tensor (D, D) in float64 on `device`, or list of (D_b, D_b)
+        tensors when `blocks` is given. The gradients never leave the
+        device; `torch.addr` folds each outer product into the sum.
+    """
+    it = iter(loader)
+    acc = None
+
+    for _ in range(num_batches):
+        try:
+            x, y = next(it)
+        except StopIteration:
+            it = iter(loader)
+            x, y = next(it)
+
+        x, y = x.to(device), y.to(device)
+        g = compute_scores(model, loss_fn, x, y).detach()
+
+        if acc is None:
+            slices = [slice(0, g.numel())] if blocks is None else [s for _, s in blocks]
+            acc = _OuterProductSum(slices, g.device, precision)
+        acc.add(g)
+
+    means = acc.mean()
+    return means[0] if blocks is None else means
+
+
 # =============================================================
 #  MAIN MNIST ALIGNMENT EXPERIMENT
 # =============================================================
 
 def run_mnist_alignment(
-    batch_size=128,
-    num_batches_train=200,
-    num_batches_eval=100,
+    batch_size=None,
+    num_batches_train=None,
+    num_batches_eval=None,
     lr=1e-2,
     seed=123,
+    layerwise=False,
+    groups=None,
+    max_workers=None,
+    eps_path=None,
+    precision=None,
+    profile=None,
 ):
     """
     Run the full MNIST Fisher–Empirical alignment pipeline.
@@ -73,6 +210,33 @@ def run_mnist_alignment(
         8. Extract eigenvalues λ_i, scalar invariant A = Σ(λ - 1),
            and rectified amplitude φ.
 
+    Layer-wise mode (`layerwise=True`):
+        Gradients are partitioned by parameter tensor (`fc1.weight`,
+        `fc1.bias`, `fc2.weight`, `fc2.bias`) or by the prefixes given in
+        `groups`, and only the diagonal blocks of G and C are accumulated.
+        Each block's H_b, spectrum and A_b are computed in parallel
+        threads; the totals correspond to the block-diagonal operator
+        H = diag(H_1, ..., H_B).
+
+    G and C are accumulated as float64 tensors on the training device and
+    H, its spectrum and the regularization path are computed there with
+    torch's linear algebra (see `src.utils.array_backend`); arrays are
+    converted to NumPy once, in the output package.
+
+    Regularization sensitivity (`eps_path`):
+        If a sequence of ε values is given, A(ε) and φ(ε) for the
+        eigenvalue-floor regularizer are evaluated from a single
+        eigendecomposition of G (global mode only).
+
+    Scale (`profile`) and precision (`precision`):
+        batch_size, num_batches_train and num_batches_eval left as None
+        are taken from the scale profile (`profile`, or the active one;
+        see `src.utils.profiles`): 128 / 200 / 100 under "paper".
+        precision=None uses the global policy, which defaults to the
+        profile's precision. The float32 policies accumulate the gradient
+        outer products of G and C in float32 blocks on the device. H and
+        its spectrum are always computed in float64.
+
     Notes:
         • This is a *stochastic*, *GPU-dependent* experiment.
         • It is **not** appropriate for unit tests.
@@ -80,13 +244,22 @@ def run_mnist_alignment(
 
     Returns:
         dict with:
-            - G, C, H: alignment objects
+            - G, C, H: alignment objects (global mode only)
             - lambdas: eigenvalues of H
             - A, phi: scalar diagnostics
+            - layer_names, layer_sizes, layer_A, layer_phi,
+              lambdas_<layer>: per-block breakdown (layer-wise mode only)
+            - eps_path, A_path, phi_path: regularization path (if requested)
             - train_loss_curve, test_loss_curve: monitoring
             - experiment settings
     """
 
+    with profile_scope(profile):
+        batch_size = resolve_setting("batch_size", batch_size)
+        num_batches_train = resolve_setting("num_batches_train", num_batches_train)
+        num_batches_eval = resolve_setting("num_batches_eval", num_batches_eval)
+        precision = resolve_precision(precision)
+
     # ---------------------------------------------------------
     # DEVICE + SEEDS
     # ---------------------------------------------------------
@@ -154,65 +327,57 @@ def run_mnist_alignment(
     #  FISHER ESTIMATION (Model distribution p)
     # =========================================================
     model.train()
-    train_loader_G, _ = _get_dataloaders(batch_size, seed + 1)
-    train_iter_G = iter(train_loader_G)
-
-    # First gradient defines dimensionality
-    x0, y0 = next(train_iter_G)
-    x0, y0 = x0.to(device), y0.to(device)
-    g0 = compute_scores(model, loss_fn, x0, y0)
-
-    g0_np = g0.detach().cpu().numpy().astype(np.float64)
-    D = g0_np.shape[0]              # dimension of gradient vector
-
-    G = np.zeros((D, D), dtype=np.float64)
-    count_G = 0
-
-    # First outer product
-    G += np.outer(g0_np, g0_np)
-    count_G += 1
-
-    # Next batches
-    for _ in range(num_batches_eval - 1):
-        try:
-            x, y = next(train_iter_G)
-        except StopIteration:
-            train_iter_G = iter(train_loader_G)
-            x, y = next(train_iter_G)
-
-        x, y = x.to(device), y.to(device)
-        g = compute_scores(model, loss_fn, x, y)
-        g_np = g.detach().cpu().numpy().astype(np.float64)
-
-        G += np.outer(g_np, g_np)
-        count_G += 1
+    blocks = parameter_blocks(model, groups) if layerwise else None
 
-    G /= float(count_G)
+    train_loader_G, _ = _get_dataloaders(batch_size, seed + 1)
+    G = _accumulate_outer(
+        model, loss_fn, train_loader_G, num_batches_eval, device, blocks, precision
+    )
 
     # =========================================================
     #  EMPIRICAL COVARIANCE (Empirical distribution q)
     # =========================================================
     _, test_loader_C = _get_dataloaders(batch_size, seed + 2)
-    test_iter_C = iter(test_loader_C)
-
-    C = np.zeros((D, D), dtype=np.float64)
-    count_C = 0
-
-    for _ in range(num_batches_eval):
-        try:
-            x, y = next(test_iter_C)
-        except StopIteration:
-            test_iter_C = iter(test_loader_C)
-            x, y = next(test_iter_C)
-
-        x, y = x.to(device), y.to(device)
-        g = compute_scores(model, loss_fn, x, y)
-        g_np = g.detach().cpu().numpy().astype(np.float64)
+    C = _accumulate_outer(
+        model, loss_fn, test_loader_C, num_batches_eval, device, blocks, precision
+    )
 
-        C += np.outer(g_np, g_np)
-        count_C += 1
+    settings = {
+        "train_loss_curve": np.array(train_losses, dtype=np.float32),
+        "test_loss_curve": np.array(test_losses, dtype=np.float32),
+        "batch_size": batch_size,
+        "num_batches_train": num_batches_train,
+        "num_batches_eval": num_batches_eval,
+        "lr": lr,
+        "seed": seed,
+        "precision": precision,
+    }
 
-    C /= float(count_C)
+    # =========================================================
+    #  LAYER-WISE ALIGNMENT (Block-diagonal)
+    # =========================================================
+    if layerwise:
+        names = [name for name, _ in blocks]
+        out = compute_block_alignment(
+            G, C, names=names, eps=1e-3, max_workers=max_workers
+        )
+
+        per_layer = {
+            f"lambdas_{name}": to_numpy(b["lambdas"])
+            for name, b in zip(names, out["blocks"])
+        }
+
+        return {
+            "lambdas": to_numpy(out["lambdas"]),
+            "A": out["A"],
+            "phi": out["phi"],
+            "layer_names": np.array(names),
+            "layer_sizes": np.array([s.stop - s.start for _, s in blocks]),
+            "layer_A": np.array([b["A"] for b in out["blocks"]]),
+            "layer_phi": np.array([b["phi"] for b in out["blocks"]]),
+            **per_layer,
+            **settings,
+        }
 
     # =========================================================
     #  ALIGNMENT OPERATOR (High-dimensional)
@@ -220,27 +385,25 @@ def run_mnist_alignment(
     G = 0.5 * (G + G.T)
     C = 0.5 * (C + C.T)
 
-    H = compute_alignment_operator(G, C, eps=1e-3)
-    eigvals = np.linalg.eigvalsh(H)
+    result = AlignmentResult(G, C, eps=1e-3)
 
-    A_q = float(np.sum(eigvals - 1.0))
-    phi_q = float(np.sqrt(A_q) if A_q > 0 else 0.0)
+    if eps_path is not None:
+        path = alignment_regularization_path(G, C, eps_path, spectra=False)
+        settings.update({
+            "eps_path": to_numpy(path["eps"]),
+            "A_path": to_numpy(path["A"]),
+            "phi_path": to_numpy(path["phi"]),
+        })
 
     # =========================================================
     #  OUTPUT PACKAGE
     # =========================================================
     return {
-        "G": G,
-        "C": C,
-        "H": H,
-        "lambdas": eigvals,
-        "A": A_q,
-        "phi": phi_q,
-        "train_loss_curve": np.array(train_losses, dtype=np.float32),
-        "test_loss_curve": np.array(test_losses, dtype=np.float32),
-        "batch_size": batch_size,
-        "num_batches_train": num_batches_train,
-        "num_batches_eval": num_batches_eval,
-        "lr": lr,
-        "seed": seed,
+        "G": to_numpy(G),
+        "C": to_numpy(C),
+        "H": to_numpy(result.H),
+        "lambdas": to_numpy(result.eigvals),
+        "A": result.A,
+        "phi": float(result.phi),
+        **settings,
     }
@@ -58,3 +58,61 @@ def compute_scores(model, loss_fn, x, y):
 
     # Detach and clone ensure independence from autograd graph
     return g.detach().clone()
+
+
+def parameter_blocks(model, groups=None):
+    """
+    Partition the flattened gradient vector returned by `compute_scores`
+    into named index ranges.
+
+    By default every parameter tensor forms its own block, e.g. for the
+    MNIST MLP: `fc1.weight`, `fc1.bias`, `fc2.weight`, `fc2.bias`.
+    Passing `groups` merges tensors into coarser blocks such as whole
+    modules.
+
+    Args:
+        model (torch.nn.Module):
+            Model whose parameters define the gradient layout.
+        groups (dict[str, list[str]] or None):
+            Optional mapping from block name to parameter-name prefixes,
+            e.g. {"fc1": ["fc1."], "fc2": ["fc2."]}. Every trainable
+            parameter must match exactly one group.
+
+    Returns:
+        list[tuple[str, slice]]:
+            (block name, slice into the flattened gradient) pairs, in the
+            order of `model.parameters()`. Grouped blocks must be
+            contiguous in that order.
+    """
+    spans = []
+    offset = 0
+    for name, p in model.named_parameters():
+        if not p.requires_grad:
+            continue
+        spans.append((name, offset, offset + p.numel()))
+        offset += p.numel()
+
+    if groups is None:
+        return [(name, slice(a, b)) for name, a, b in spans]
+
+    blocks = []
+    for group, prefixes in groups.items():
+        members = [
+            (a, b) for name, a, b in spans
+            if any(name.startswith(prefix) for prefix in prefixes)
+        ]
+        if not members:
+            raise ValueError(f"Group '{group}' matches no parameters.")
+        start, stop = members[0][0], members[-1][1]
+        if sum(b - a for a, b in members) != stop - start:
+            raise ValueError(f"Group '{group}' is not contiguous in parameter order.")
+        blocks.append((group, slice(start, stop)))
+
+    blocks.sort(key=lambda item: item[1].start)
+    edges = [0] + [s.stop for _, s in blocks]
+    if [s.start for _, s in blocks] != edges[:-1] or edges[-1] != offset:
+        raise ValueError(
+            "Parameter groups must cover every trainable parameter exactly once."
+        )
+
+    return blocks
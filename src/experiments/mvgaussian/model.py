@@ -0,0 +1,62 @@
+import numpy as np
+
+from src.utils.rng_streams import SampleStream
+
+
+def mvgaussian_sample(mu, cov, num_samples: int, seed: int | None = None):
+    """
+    Draw samples from a d-dimensional Gaussian distribution N(mu, cov).
+
+    Args:
+        mu (np.ndarray): Mean vector, shape (d,).
+        cov (np.ndarray): Covariance, either a full (d, d) SPD matrix or a
+            vector of per-dimension variances of shape (d,).
+        num_samples (int): Number of samples to generate.
+        seed (int | None): Optional random seed for deterministic output.
+
+    Returns:
+        np.ndarray: Samples of shape (num_samples, d).
+
+    Notes:
+        - Uses numpy.random.default_rng and a Cholesky factor of cov, so
+          the cost is O(d³ + N·d²) (O(N·d) for diagonal covariances).
+        - No validation is done on cov; upstream logic is expected to
+          ensure positive definiteness.
+
+    Example:
+        x = mvgaussian_sample(np.zeros(3), np.ones(3), 1000, seed=42)
+    """
+    rng = np.random.default_rng(seed)
+    return _draw_mvgaussian((rng,), num_samples, *_mvgaussian_factor(mu, cov))
+
+
+def _mvgaussian_factor(mu, cov):
+    """Mean and either per-dimension scales (d,) or a Cholesky factor."""
+    mu = np.asarray(mu, dtype=np.float64)
+    cov = np.asarray(cov, dtype=np.float64)
+    if cov.ndim == 1:
+        return mu, np.sqrt(cov)
+    return mu, np.linalg.cholesky(cov)
+
+
+def _draw_mvgaussian(gens, n, mu, factor):
+    z = gens[0].standard_normal(size=(n, mu.size))
+    if factor.ndim == 1:
+        return mu + z * factor
+    return mu + z @ factor.T
+
+
+def mvgaussian_stream(mu, cov, num_samples: int, seed: int | None = None,
+                      block_size: int | None = None):
+    """
+    Chunk-invariant version of `mvgaussian_sample`: `iter_chunks(chunk)`
+    yields (chunk, d) arrays whose concatenation equals
+    `mvgaussian_sample(mu, cov, num_samples, seed)` for block_size=None,
+    whatever the chunking (see `src.utils.rng_streams`). The Cholesky
+    factor is computed once for the whole stream.
+    """
+    mu, factor = _mvgaussian_factor(mu, cov)
+    return SampleStream(
+        lambda gens, n: _draw_mvgaussian(gens, n, mu, factor),
+        [("normal", mu.size)], num_samples, seed, block_size,
+    )
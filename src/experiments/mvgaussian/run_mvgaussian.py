@@ -0,0 +1,37 @@
+from .equilibrium import compute_mvgaussian_equilibrium
+from .misalignment import compute_mvgaussian_misalignment
+from src.utils.profiles import profile_scope
+
+
+def run_all_mvgaussian(profile=None):
+    """
+    Run the two canonical multivariate Gaussian experiments:
+
+        1. Fisher-equilibrium case (q = p)
+        2. Misalignment case (q ≠ p, shifted mean)
+
+    This mirrors `run_all_gaussian` for the d-dimensional family and
+    returns both result dictionaries without further analysis.
+
+    Args:
+        profile (str|None): Scale profile for both runs ("smoke", "paper",
+                            "production"; None: active profile, see
+                            `src.utils.profiles`).
+
+    Returns:
+        tuple(dict, dict):
+            - eq:  Output dictionary from compute_mvgaussian_equilibrium()
+            - mis: Output dictionary from compute_mvgaussian_misalignment()
+    """
+    with profile_scope(profile):
+        eq = compute_mvgaussian_equilibrium()
+        mis = compute_mvgaussian_misalignment()
+    return eq, mis
+
+
+if __name__ == "__main__":
+    # If run as a script, execute both experiments and print diagnostics.
+    eq, mis = run_all_mvgaussian()
+
+    print("Multivariate Gaussian equilibrium A =", eq["A"])
+    print("Multivariate Gaussian misalignment A =", mis["A"])
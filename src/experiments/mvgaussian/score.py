@@ -0,0 +1,244 @@
+import numpy as np
+
+
+# =============================================================================
+# Parameterizations
+# =============================================================================
+#
+# "diagonal":  θ = (μ_1..μ_d, σ_1..σ_d)              D = 2d
+#              model N(μ, diag(σ²))
+#
+# "full":      θ = (μ_1..μ_d, vech(Σ))               D = d + d(d+1)/2
+#              model N(μ, Σ), vech(Σ) = lower-triangular entries Σ_ij, i ≥ j,
+#              row-major (Σ_00, Σ_10, Σ_11, Σ_20, ...)
+PARAMETERIZATIONS = ("diagonal", "full")
+
+# Samples per score chunk when neither the caller nor the scale profile
+# sets one (the "smoke" and "paper" profiles leave chunk_size unset).
+DEFAULT_CHUNK_SIZE = 16_384
+
+
+def _check_parameterization(parameterization):
+    if parameterization not in PARAMETERIZATIONS:
+        raise ValueError(
+            f"Unknown parameterization '{parameterization}'. "
+            f"Expected one of {PARAMETERIZATIONS}."
+        )
+
+
+def _diag_std(cov):
+    """Per-dimension standard deviations from a variance vector or matrix."""
+    cov = np.asarray(cov, dtype=np.float64)
+    return np.sqrt(cov if cov.ndim == 1 else np.diag(cov))
+
+
+def num_parameters(dim, parameterization="diagonal"):
+    """Dimension D of θ for a d-dimensional Gaussian."""
+    _check_parameterization(parameterization)
+    if parameterization == "diagonal":
+        return 2 * dim
+    return dim + dim * (dim + 1) // 2
+
+
+# =============================================================================
+# Scores
+# =============================================================================
+def mvgaussian_scores(x, mu, cov, parameterization="diagonal", out=None):
+    """
+    Compute the score of a d-dimensional Gaussian model for every sample.
+
+    Diagonal parameterization θ = (μ, σ):
+
+        ∂/∂μ_j log p = (x_j − μ_j) / σ_j²
+        ∂/∂σ_j log p = ((x_j − μ_j)² − σ_j²) / σ_j³
+
+    Full parameterization θ = (μ, vech Σ), with P = Σ^{-1}, u = P (x − μ):
+
+        ∂/∂μ     log p = u
+        ∂/∂Σ_ij  log p = (1 − ½ δ_ij) (u_i u_j − P_ij)
+
+    (the factor accounts for Σ_ij and Σ_ji being one parameter).
+
+    Args:
+        x (np.ndarray): Samples, shape (N, d).
+        mu (np.ndarray): Model mean, shape (d,).
+        cov (np.ndarray): Model covariance, (d,) variances or (d, d).
+        parameterization (str): "diagonal" or "full".
+        out (np.ndarray | None): Optional preallocated (D, N) float64
+            buffer, filled in place and returned.
+
+    Returns:
+        np.ndarray: Score matrix of shape (D, N).
+    """
+    _check_parameterization(parameterization)
+    x = np.asarray(x, dtype=np.float64)
+    mu = np.asarray(mu, dtype=np.float64)
+    d = mu.size
+    if out is None:
+        out = np.empty((num_parameters(d, parameterization), x.shape[0]))
+
+    if parameterization == "diagonal":
+        sigma = _diag_std(cov)[:, None]
+        v_mu, v_sigma = out[:d], out[d:]
+        np.subtract(x.T, mu[:, None], out=v_mu)                    # r^T (d, N)
+        np.square(v_mu, out=v_sigma)
+        v_sigma -= sigma**2
+        v_sigma /= sigma**3
+        v_mu /= sigma**2
+        return out
+
+    r = x - mu                                                      # (N, d)
+
+    cov = np.asarray(cov, dtype=np.float64)
+    if cov.ndim == 1:
+        cov = np.diag(cov)
+    P = np.linalg.inv(cov)
+    P = 0.5 * (P + P.T)
+    u = r @ P                                                        # (N, d)
+
+    I, J = np.tril_indices(d)
+    factor = np.where(I == J, 0.5, 1.0)
+
+    out[:d] = u.T
+    v_cov = out[d:]
+    np.multiply(out[I], out[J], out=v_cov)
+    v_cov -= P[I, J][:, None]
+    v_cov *= factor[:, None]
+    return out
+
+
+def mvgaussian_score_stats(x, mu, cov, parameterization="diagonal",
+                           chunk_size=DEFAULT_CHUNK_SIZE, moments=False, precision=None):
+    """
+    Accumulate score statistics over x in fixed-size chunks, so the
+    (D, N) score matrix is never materialized for large D·N.
+
+    `precision` selects the score dtype and reduction of the Gram sums
+    (see `src.utils.precision`; None uses the global policy).
+
+    Returns
+    -------
+    AlignmentStats
+        `second_moment()` gives the empirical covariance C.
+    """
+    from src.utils.precision import finalize_stats, score_dtype, score_stats_accumulator
+
+    D = num_parameters(np.asarray(mu).size, parameterization)
+    stats = score_stats_accumulator(D, precision, moments=moments)
+    buf = np.empty(D * min(chunk_size, len(x)), dtype=score_dtype(precision))
+    for start in range(0, len(x), chunk_size):
+        xb = x[start:start + chunk_size]
+        out = buf[:D * len(xb)].reshape(D, len(xb))
+        stats.update(mvgaussian_scores(xb, mu, cov, parameterization, out=out))
+    return finalize_stats(stats)
+
+
+# =============================================================================
+# Analytic Fisher information
+# =============================================================================
+def mvgaussian_fisher(mu, cov, parameterization="diagonal"):
+    """
+    Analytic Fisher information matrix of N(μ, Σ), in structured form.
+
+    Diagonal parameterization:
+
+        G = diag(1/σ², 2/σ²)                       → returned as a (2d,) vector
+
+    Full parameterization (μ and vech Σ blocks are orthogonal):
+
+        G_μμ = Σ^{-1}
+        G_(ij),(kl) = ½ w_ij w_kl (P_ik P_jl + P_il P_jk),
+                      w = 1/√2 on the diagonal of Σ, √2 off it
+                                                    → returned as [G_μμ, G_ΣΣ]
+
+    Both representations are accepted directly by `compute_alignment_operator`
+    and use its O(D) / per-block kernels.
+
+    Args:
+        mu (np.ndarray): Mean, shape (d,) (only its size is used).
+        cov (np.ndarray): Covariance, (d,) variances or (d, d).
+        parameterization (str): "diagonal" or "full".
+
+    Returns:
+        np.ndarray or list[np.ndarray]: Structured Fisher matrix.
+    """
+    _check_parameterization(parameterization)
+
+    if parameterization == "diagonal":
+        sigma2 = _diag_std(cov) ** 2
+        return np.concatenate([1.0 / sigma2, 2.0 / sigma2])
+
+    cov = np.asarray(cov, dtype=np.float64)
+    if cov.ndim == 1:
+        cov = np.diag(cov)
+    P = np.linalg.inv(cov)
+    P = 0.5 * (P + P.T)
+
+    I, J = np.tril_indices(np.asarray(mu).size)
+    w = np.where(I == J, 1.0 / np.sqrt(2.0), np.sqrt(2.0))
+    G_cov = 0.5 * np.outer(w, w) * (
+        P[np.ix_(I, I)] * P[np.ix_(J, J)] + P[np.ix_(I, J)] * P[np.ix_(J, I)]
+    )
+
+    return [P, 0.5 * (G_cov + G_cov.T)]
+
+
+def dense_fisher(G):
+    """Materialize a structured Fisher matrix as a dense (D, D) array."""
+    if isinstance(G, (list, tuple)):
+        D = sum(b.shape[0] for b in G)
+        out = np.zeros((D, D))
+        start = 0
+        for b in G:
+            n = b.shape[0]
+            out[start:start + n, start:start + n] = b
+            start += n
+        return out
+    G = np.asarray(G)
+    return np.diag(G) if G.ndim == 1 else G
+
+
+# =============================================================================
+# Exact score covariance (diagonal model, independent Gaussian data)
+# =============================================================================
+def mvgaussian_expected_covariance(mu_model, sigma_model, mu_data, sigma_data):
+    """
+    Exact C = E_q[v v^T] for the diagonal parameterization when the data are
+    q = N(mu_data, diag(sigma_data²)).
+
+    With r_j = x_j − μ_j ~ N(Δ_j, τ_j²), the per-dimension raw moments
+    E[r], E[r²], E[r³], E[r⁴] give every entry in closed form; entries that
+    couple different dimensions factorize as E[v_a] E[v_b]. This is the
+    correctness oracle for Monte Carlo and fast alignment paths.
+
+    Returns:
+        np.ndarray: Dense C of shape (2d, 2d), ordered as (μ, σ).
+    """
+    s = np.asarray(sigma_model, dtype=np.float64)
+    delta = np.asarray(mu_data, dtype=np.float64) - np.asarray(mu_model, dtype=np.float64)
+    tau2 = np.asarray(sigma_data, dtype=np.float64) ** 2
+    delta, s, tau2 = np.broadcast_arrays(delta, s, tau2)
+
+    m1 = delta
+    m2 = delta**2 + tau2
+    m3 = delta**3 + 3 * delta * tau2
+    m4 = delta**4 + 6 * delta**2 * tau2 + 3 * tau2**2
+
+    # First moments of v_μ and v_σ
+    e_mu = m1 / s**2
+    e_sig = (m2 - s**2) / s**3
+    mean = np.concatenate([e_mu, e_sig])
+
+    # Within-dimension second moments
+    mu_mu = m2 / s**4
+    mu_sig = (m3 - s**2 * m1) / s**5
+    sig_sig = (m4 - 2 * s**2 * m2 + s**4) / s**6
+
+    C = np.outer(mean, mean)
+    d = s.size
+    idx = np.arange(d)
+    C[idx, idx] = mu_mu
+    C[d + idx, d + idx] = sig_sig
+    C[idx, d + idx] = mu_sig
+    C[d + idx, idx] = mu_sig
+    return C
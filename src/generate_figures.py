@@ -1,111 +1,175 @@
+import argparse
+import importlib
 import os
+import time
 
 from src.utils.experiment_io import (
+    AsyncWriter,
     get_fig_dirs,
     get_results_dir,
+    result_path,
     save_results,
-    save_spectrum,
 )
-
-from src.experiments.gaussian.run_gaussian import run_all_gaussian
-from src.experiments.laplace.run_laplace import run_all_laplace
-from src.experiments.gmm.run_gmm import run_all_gmm
-from src.experiments.mnist.run_mnist import run_mnist_alignment
-
-
-def main():
-
-    fig_dirs = get_fig_dirs()        # now two directories
-    res_dir = get_results_dir()
-
-    print("Guardando figuras en:")
-    for d in fig_dirs:
-        print("  →", d)
-
-    print("Guardando resultados en:", res_dir)
-    for d in fig_dirs:
-        os.makedirs(d, exist_ok=True)
-    os.makedirs(res_dir, exist_ok=True)
-
-    # =========================================================
-    # GAUSSIAN
-    # =========================================================
-    print("\n[1/4] Gaussian experiments...")
-
-    g_eq, g_mis = run_all_gaussian()
-
-    save_spectrum(
-        g_eq["lambdas"],
-        filename="gaussian_equilibrium.png",
-        title="Gaussian – Equilibrium Spectrum"
+from src.utils.profiles import PROFILE_ENV, PROFILES, get_profile, profile_scope
+from src.utils.run_index import RunIndex, new_run_id
+
+
+# =========================================================
+# Experiment registry
+# =========================================================
+#
+# Runners are imported only when their experiment is selected, so e.g.
+# `--only gaussian` never loads torch / torchvision (MNIST) or matplotlib
+# (`--no-plots`).
+#
+#   name → (label, runner module, runner function,
+#           [(result name, spectrum title), ...], save_results options)
+EXPERIMENTS = {
+    "gaussian": (
+        "Gaussian experiments",
+        "src.experiments.gaussian.run_gaussian", "run_all_gaussian",
+        [("gaussian_equilibrium", "Gaussian – Equilibrium Spectrum"),
+         ("gaussian_misalignment", "Gaussian – Misalignment Spectrum")],
+        {},
+    ),
+    "laplace": (
+        "Laplace experiments",
+        "src.experiments.laplace.run_laplace", "run_all_laplace",
+        [("laplace_equilibrium", "Laplace – Equilibrium Spectrum"),
+         ("laplace_misalignment", "Laplace – Misalignment Spectrum")],
+        {},
+    ),
+    "gmm": (
+        "GMM experiments",
+        "src.experiments.gmm.run_gmm", "run_all_gmm",
+        [("gmm_equilibrium", "GMM – Equilibrium Spectrum"),
+         ("gmm_misalignment", "GMM – Misalignment Spectrum")],
+        {},
+    ),
+    "mnist": (
+        "MNIST alignment experiment",
+        "src.experiments.mnist.run_mnist", "run_mnist_alignment",
+        [("mnist_alignment", "MNIST – Alignment Spectrum")],
+        # Packed schema (G, C as upper triangles, H re-derivable on load)
+        # in the memory-mappable directory layout
+        {"packed": True, "eps": 1e-3, "layout": "npy_dir"},
+    ),
+}
+
+
+def load_runner(name):
+    """Import and return the runner of a registered experiment."""
+    _, module, function, _, _ = EXPERIMENTS[name]
+    return getattr(importlib.import_module(module), function)
+
+
+def _experiment_list(value):
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in EXPERIMENTS]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(
+            f"unknown experiment(s) {unknown or value!r}; choose from {', '.join(EXPERIMENTS)}"
+        )
+    return names
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.generate_figures",
+        description="Run the alignment experiments, save results and spectrum figures.",
     )
-    save_spectrum(
-        g_mis["lambdas"],
-        filename="gaussian_misalignment.png",
-        title="Gaussian – Misalignment Spectrum"
+    parser.add_argument(
+        "--only", type=_experiment_list, default=list(EXPERIMENTS),
+        metavar="NAMES",
+        help=f"comma-separated subset of: {', '.join(EXPERIMENTS)} (default: all)",
     )
-
-    save_results(g_eq, "gaussian_equilibrium.npz")
-    save_results(g_mis, "gaussian_misalignment.npz")
-
-    # =========================================================
-    # LAPLACE
-    # =========================================================
-    print("\n[2/4] Laplace experiments...")
-
-    l_eq, l_mis = run_all_laplace()
-
-    save_spectrum(
-        l_eq["lambdas"],
-        filename="laplace_equilibrium.png",
-        title="Laplace – Equilibrium Spectrum"
+    parser.add_argument(
+        "--no-plots", dest="plots", action="store_false",
+        help="skip spectrum figures (matplotlib is then never imported)",
     )
-    save_spectrum(
-        l_mis["lambdas"],
-        filename="laplace_misalignment.png",
-        title="Laplace – Misalignment Spectrum"
+    parser.add_argument(
+        "--profile", choices=list(PROFILES), default=None,
+        help=f"scale profile of every experiment (default: ${PROFILE_ENV} or paper)",
+    )
+    return parser.parse_args(argv)
+
+
+def _save_run(index, experiment, results, started, duration, profile=None,
+              **save_kwargs):
+    """
+    Save one experiment's results and record the run in the index (run as
+    one `AsyncWriter` job, so the run is only indexed once it is on disk).
+
+    Every run gets its own artifact, results/<experiment>/<run id>.npz (or
+    the directory of that name for layout="npy_dir"), so an indexed run
+    always points at its own data.
+
+    `duration` is the wall time of the runner call that produced it (shared
+    by the equilibrium / misalignment pair of a family); `profile` is
+    indexed with the run's parameters.
+    """
+    run_id = new_run_id()
+    filename = f"{experiment}/{run_id}.npz"
+    save_results(results, filename, **save_kwargs)
+    index.record(
+        experiment, results,
+        artifact=result_path(filename, save_kwargs.get("layout", "npz")),
+        params=dict(results, profile=profile),
+        started=started, duration=duration, run_id=run_id,
     )
 
-    save_results(l_eq, "laplace_equilibrium.npz")
-    save_results(l_mis, "laplace_misalignment.npz")
-
-    # =========================================================
-    # GMM
-    # =========================================================
-    print("\n[3/4] GMM experiments...")
 
-    gmm_eq, gmm_mis = run_all_gmm()
+def main(argv=None):
+    args = parse_args(argv)
 
-    save_spectrum(
-        gmm_eq["lambdas"],
-        filename="gmm_equilibrium.png",
-        title="GMM – Equilibrium Spectrum"
-    )
-    save_spectrum(
-        gmm_mis["lambdas"],
-        filename="gmm_misalignment.png",
-        title="GMM – Misalignment Spectrum"
-    )
+    fig_dirs = get_fig_dirs()        # now two directories
+    res_dir = get_results_dir()
 
-    save_results(gmm_eq, "gmm_equilibrium.npz")
-    save_results(gmm_mis, "gmm_misalignment.npz")
+    if args.plots:
+        print("Guardando figuras en:")
+        for d in fig_dirs:
+            print("  →", d)
+        for d in fig_dirs:
+            os.makedirs(d, exist_ok=True)
 
-    # =========================================================
-    # MNIST
-    # =========================================================
-    print("\n[4/4] MNIST alignment experiment...")
+    print("Guardando resultados en:", res_dir)
+    os.makedirs(res_dir, exist_ok=True)
+    index = RunIndex()
 
-    mn_out = run_mnist_alignment()
+    # Figures and result files are written on a background thread while
+    # the next experiment computes; leaving the block waits for them and
+    # re-raises any write error.
+    with profile_scope(args.profile), AsyncWriter() as writer:
+        print("Perfil de escala:", get_profile())
+        _run_experiments(writer, index, args.only, args.plots)
 
-    save_spectrum(
-        mn_out["lambdas"],
-        filename="mnist_alignment.png",
-        title="MNIST – Alignment Spectrum"
-    )
+    print("\n✓ Todas las figuras y resultados generados correctamente.")
 
-    save_results(mn_out, "mnist_alignment.npz")
 
-    print("\n✓ Todas las figuras y resultados generados correctamente.")
+def _run_experiments(writer, index, names, plots=True):
+    profile = get_profile()
+    for step, name in enumerate(names, start=1):
+        label, _, _, outputs, save_kwargs = EXPERIMENTS[name]
+        print(f"\n[{step}/{len(names)}] {label}...")
+
+        runner = load_runner(name)
+        started = time.time()
+        results = runner()
+        duration = time.time() - started
+
+        # Paired runners return (equilibrium, misalignment); MNIST one dict
+        if isinstance(results, dict):
+            results = (results,)
+
+        for (experiment, title), out in zip(outputs, results):
+            if plots:
+                writer.save_spectrum(
+                    out["lambdas"],
+                    filename=f"{experiment}.png",
+                    title=title
+                )
+            writer.submit(_save_run, index, experiment, out, started, duration,
+                          profile=profile, **save_kwargs)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,9 @@
+from functools import cached_property
+
 import numpy as np
 
+from src.utils.array_backend import array_namespace
+
 
 # ============================================================================
 # Internal utility: stable inverse square root via eigendecomposition
@@ -16,37 +20,170 @@ def _inverse_sqrt(G, eps=1e-12):
 
     Parameters
     ----------
-    G : np.ndarray
+    G : np.ndarray or torch.Tensor
         Symmetric positive-definite matrix.
     eps : float
         Minimum allowed eigenvalue to avoid numerical instabilities.
 
     Returns
     -------
-    np.ndarray
+    np.ndarray or torch.Tensor
         The matrix G^{-1/2}, symmetric by construction.
     """
+    xp = array_namespace(G)
 
     # Enforce symmetry explicitly
     G = 0.5 * (G + G.T)
 
     # Eigen decomposition G = U Λ U^T
-    eigvals, U = np.linalg.eigh(G)
+    eigvals, U = xp.eigh(G)
+
+    return _inverse_sqrt_from_eigh(eigvals, U, eps)
+
+
+def _inverse_sqrt_from_eigh(eigvals, U, eps):
+    """G^{-1/2} = U Λ^{-1/2} U^T from an existing eigendecomposition of G."""
+    xp = array_namespace(U)
 
     # Regularize eigenvalues
-    eigvals = np.maximum(eigvals, eps)
+    eigvals = xp.maximum(eigvals, eps)
 
     # Build Λ^{-1/2}
-    inv_sqrt_vals = 1.0 / np.sqrt(eigvals)
-    Gm12 = U @ np.diag(inv_sqrt_vals) @ U.T
+    inv_sqrt_vals = 1.0 / xp.sqrt(eigvals)
+    Gm12 = U @ xp.diag(inv_sqrt_vals) @ U.T
 
     return Gm12
 
 
+# ============================================================================
+# Structured Fisher matrices: diagonal and block-diagonal kernels
+# ============================================================================
+def _resolve_structure(G, structure=None, xp=None):
+    """
+    Normalize a Fisher matrix and its declared structure.
+
+    Accepted representations of G:
+        - dense (D, D) array                      → "dense"
+        - 1D vector of diagonal entries (D,)       → "diagonal"
+        - list/tuple of square blocks              → "block" (contiguous,
+          in the order given)
+
+    `structure` may be None (infer from the container type only), "dense",
+    "diagonal", "block" or "auto" (additionally detect diagonal or
+    block-diagonal sparsity of a dense G).
+
+    Arrays are returned in float64 in the namespace `xp` (by default the
+    one of G: NumPy arrays or torch tensors).
+
+    Returns
+    -------
+    tuple(str, object):
+        ("dense", G) | ("diagonal", g) | ("block", [(idx, G_b), ...])
+        where idx are the integer indices covered by block G_b.
+    """
+    if structure not in (None, "dense", "diagonal", "block", "auto"):
+        raise ValueError(f"Unknown Fisher structure '{structure}'.")
+
+    xp = xp or array_namespace(G)
+
+    # Block-diagonal list of square blocks
+    if isinstance(G, (list, tuple)):
+        blocks, start = [], 0
+        for Gb in G:
+            Gb = xp.atleast_2d(Gb)
+            Gb = 0.5 * (Gb + Gb.T)
+            size = Gb.shape[0]
+            blocks.append((xp.arange(start, start + size), Gb))
+            start += size
+        return "block", blocks
+
+    G = xp.asarray(G)
+
+    # Diagonal vector
+    if G.ndim == 1:
+        return "diagonal", G
+
+    G = 0.5 * (G + G.T)
+
+    if structure in (None, "dense"):
+        return "dense", G
+
+    if structure == "diagonal":
+        return "diagonal", xp.copy(xp.diag(G))
+
+    offdiag = G - xp.diag(xp.diag(G))
+    if structure == "auto" and not xp.any(offdiag):
+        return "diagonal", xp.copy(xp.diag(G))
+
+    # Block detection: connected components of the sparsity pattern
+    from scipy.sparse.csgraph import connected_components
+
+    n_comp, labels = connected_components(xp.to_numpy(G != 0), directed=False)
+    if n_comp == 1:
+        return "dense", G
+
+    blocks = []
+    for k in range(n_comp):
+        idx = xp.index(np.flatnonzero(labels == k))
+        blocks.append((idx, G[idx[:, None], idx[None, :]]))
+    return "block", blocks
+
+
+def _fisher_spectrum(kind, data):
+    """
+    Eigendecomposition of G in the representation matching `kind`:
+
+        dense    → (eigvals, U)                    O(D³)
+        diagonal → the diagonal itself             free
+        block    → [(idx, (eigvals_b, U_b)), ...]  O(Σ_b D_b³)
+    """
+    if kind == "dense":
+        return array_namespace(data).eigh(0.5 * (data + data.T))
+    if kind == "diagonal":
+        return data
+    return [(idx, _fisher_spectrum("dense", Gb)) for idx, Gb in data]
+
+
+def _factor_from_spectrum(kind, spectrum, eps):
+    """G^{-1/2} from the output of `_fisher_spectrum`."""
+    if kind == "dense":
+        return _inverse_sqrt_from_eigh(*spectrum, eps)
+    if kind == "diagonal":
+        xp = array_namespace(spectrum)
+        return 1.0 / xp.sqrt(xp.maximum(spectrum, eps))
+    return [(idx, _inverse_sqrt_from_eigh(*sp, eps)) for idx, sp in spectrum]
+
+
+def _inverse_sqrt_factor(kind, data, eps):
+    """
+    G^{-1/2} in the representation matching `kind`:
+
+        dense    → (D, D) matrix          O(D³)
+        diagonal → (D,) vector            O(D)
+        block    → [(idx, B_b), ...]      O(Σ_b D_b³)
+    """
+    return _factor_from_spectrum(kind, _fisher_spectrum(kind, data), eps)
+
+
+def _sandwich(kind, factor, C):
+    """Compute F C F for F = G^{-1/2} in structured representation."""
+    if kind == "dense":
+        return factor @ C @ factor
+    if kind == "diagonal":
+        return factor[:, None] * C * factor[None, :]
+
+    H = array_namespace(C).copy(C)
+    for idx, B in factor:
+        H[idx, :] = B @ H[idx, :]
+    for idx, B in factor:
+        H[:, idx] = H[:, idx] @ B
+    return H
+
+
 # ============================================================================
 # Alignment operator H = G^{-1/2} C G^{-1/2}
 # ============================================================================
-def compute_alignment_operator(G, C, eps=1e-12):
+def compute_alignment_operator(G, C, eps=1e-12, structure=None):
     """
     Compute the Fisher-normalized alignment operator:
 
@@ -54,39 +191,195 @@ def compute_alignment_operator(G, C, eps=1e-12):
 
     Both G and C are symmetrized to eliminate numerical drift.
 
+    Structured Fisher matrices skip the dense eigendecomposition of G:
+    a diagonal G costs O(D) for G^{-1/2} and O(D²) for H, and a
+    block-diagonal G costs one small `eigh` per block.
+
+    NumPy arrays and torch tensors are both accepted; with tensors the
+    whole computation runs in torch (on the tensors' device) and H is
+    returned as a float64 tensor.
+
     Parameters
     ----------
-    G : np.ndarray
-        Fisher information matrix.
-    C : np.ndarray
+    G : np.ndarray, torch.Tensor or list of them
+        Fisher information matrix: dense (D, D), diagonal vector (D,),
+        or list of square diagonal blocks.
+    C : np.ndarray or torch.Tensor
         Empirical score covariance.
     eps : float
         Regularization parameter used in eigenvalue flooring.
+    structure : str or None
+        None (inferred from the type of G), "dense", "diagonal",
+        "block" or "auto" (detect sparsity of a dense G).
 
     Returns
     -------
-    np.ndarray
+    np.ndarray or torch.Tensor
         The symmetric alignment operator H.
     """
 
-    # Symmetrize inputs
-    G = 0.5 * (G + G.T)
-    C = 0.5 * (C + C.T)
+    return AlignmentResult(G, C, eps=eps, structure=structure).H
 
-    # Compute inverse square root
-    Gm12 = _inverse_sqrt(G, eps)
 
-    # Construct alignment operator
-    H = Gm12 @ C @ Gm12
+# ============================================================================
+# Cached diagnostics of one (G, C) pair
+# ============================================================================
+REGIMES = ("suppression", "equilibrium", "reinforcement")
+
+
+class AlignmentResult:
+    """
+    Alignment diagnostics of one (G, C) pair, each computed on first access
+    and cached, so no eigendecomposition is ever repeated:
 
-    # Final symmetric projection
-    return 0.5 * (H + H.T)
+        fisher_eigvals      spectrum of G (one `eigh`, or free for diagonal G)
+        inverse_sqrt_G      G^{-1/2}, from that same decomposition
+        H                   G^{-1/2} C G^{-1/2}
+        eigvals, eigvecs    spectrum of H (`eigvalsh`, or `eigh` once the
+                            eigenvectors are requested — eigvals then reuses it)
+        A, phi              Σ(λ_i − 1) and max{√A, 0}
+        condition_numbers   κ(G) (eigenvalues floored at eps) and κ(H)
+        regime              "suppression" / "equilibrium" / "reinforcement"
+
+    G accepts every representation of `compute_alignment_operator` and the
+    inputs may be NumPy arrays or torch tensors.
+
+    Parameters
+    ----------
+    G, C : np.ndarray or torch.Tensor
+        Fisher matrix (dense, diagonal vector or list of blocks) and
+        empirical covariance.
+    eps : float
+        Regularization parameter used in eigenvalue flooring.
+    structure : str or None
+        Structure of G (see `compute_alignment_operator`).
+    tol : float
+        Half-width of the band |A| ≤ tol classified as equilibrium.
+    """
+
+    def __init__(self, G, C, eps=1e-12, structure=None, tol=1e-2):
+        self.G = G
+        self.C = C
+        self.eps = eps
+        self.tol = tol
+        self._xp = array_namespace(G, C)
+        self._kind, self._fisher = _resolve_structure(G, structure, self._xp)
+
+    @property
+    def structure(self):
+        """Resolved Fisher structure: "dense", "diagonal" or "block"."""
+        return self._kind
+
+    @cached_property
+    def _spectrum(self):
+        return _fisher_spectrum(self._kind, self._fisher)
+
+    @cached_property
+    def fisher_eigvals(self):
+        """Eigenvalues of G, ascending."""
+        xp = self._xp
+        if self._kind == "dense":
+            return self._spectrum[0]
+        if self._kind == "diagonal":
+            return xp.sort(self._spectrum)
+        return xp.sort(xp.concatenate([sp[0] for _, sp in self._spectrum]))
+
+    @cached_property
+    def inverse_sqrt_G(self):
+        """G^{-1/2} in the structured representation of G."""
+        return _factor_from_spectrum(self._kind, self._spectrum, self.eps)
+
+    @cached_property
+    def H(self):
+        """The symmetric alignment operator H = G^{-1/2} C G^{-1/2}."""
+        C = self._xp.asarray(self.C)
+        C = 0.5 * (C + C.T)
+
+        H = _sandwich(self._kind, self.inverse_sqrt_G, C)
+
+        # Final symmetric projection
+        return 0.5 * (H + H.T)
+
+    @cached_property
+    def _eigh(self):
+        return self._xp.eigh(self.H)
+
+    @cached_property
+    def eigvals(self):
+        """Eigenvalues λ_i of H, ascending."""
+        if "_eigh" in self.__dict__:
+            return self._eigh[0]
+        return self._xp.eigvalsh(self.H)
+
+    @cached_property
+    def eigvecs(self):
+        """Eigenvectors of H (columns), matching `eigvals`."""
+        return self._eigh[1]
+
+    @cached_property
+    def A(self):
+        """Scalar alignment diagnostic A = Σ (λ_i − 1)."""
+        return float(self._xp.sum(self.eigvals - 1.0))
+
+    @cached_property
+    def phi(self):
+        """Rectified amplitude φ = max{√A, 0}."""
+        return compute_phi(self.A)
+
+    @cached_property
+    def condition_numbers(self):
+        """{"G": κ(G) with eigenvalues floored at eps, "H": κ(H)}."""
+        g, lam = self.fisher_eigvals, self.eigvals
+        lam_min, lam_max = float(lam[0]), float(lam[-1])
+        return {
+            "G": float(g[-1]) / max(float(g[0]), self.eps),
+            "H": lam_max / lam_min if lam_min > 0 else np.inf,
+        }
+
+    @cached_property
+    def regime(self):
+        """Sign of A outside the equilibrium band |A| ≤ tol."""
+        if self.A > self.tol:
+            return "reinforcement"
+        if self.A < -self.tol:
+            return "suppression"
+        return "equilibrium"
+
+    def to_dict(self, include=()):
+        """
+        Result entries shared by every experiment ("G", "C", "H",
+        "lambdas", "A", "phi"), ready for `save_results`. `include` adds
+        any of "eigvecs", "condition_numbers" (as "cond_G" / "cond_H") and
+        "regime".
+        """
+        out = {
+            "G": self.G,
+            "C": self.C,
+            "H": self.H,
+            "lambdas": self.eigvals,
+            "A": self.A,
+            "phi": self.phi,
+        }
+        for key in include:
+            if key == "eigvecs":
+                out["eigvecs"] = self.eigvecs
+            elif key == "condition_numbers":
+                out["cond_G"] = self.condition_numbers["G"]
+                out["cond_H"] = self.condition_numbers["H"]
+            elif key == "regime":
+                out["regime"] = self.regime
+            else:
+                raise ValueError(f"Unknown result entry '{key}'.")
+        return out
+
+    def __repr__(self):
+        return f"AlignmentResult(structure={self._kind!r}, D={self.H.shape[0]})"
 
 
 # ============================================================================
 # Alignment scalar A = Σ (λ_i - 1)
 # ============================================================================
-def alignment_scalar_numpy(G, C):
+def alignment_scalar_numpy(G, C, eps=1e-12, structure=None):
     """
     Compute the scalar alignment diagnostic using eigenvalues of H:
 
@@ -98,23 +391,71 @@ def alignment_scalar_numpy(G, C):
 
     Parameters
     ----------
-    G, C : np.ndarray
-        Fisher matrix and empirical covariance.
+    G, C : np.ndarray or torch.Tensor
+        Fisher matrix and empirical covariance. G accepts the same
+        structured representations as `compute_alignment_operator`.
+    eps : float
+        Regularization parameter used in eigenvalue flooring.
+    structure : str or None
+        Structure of G (see `compute_alignment_operator`).
 
     Returns
     -------
     tuple:
         A : float
             Alignment deviation from equilibrium.
-        eigvals : np.ndarray
-            Eigenvalues of H.
+        eigvals : np.ndarray or torch.Tensor
+            Eigenvalues of H, in the namespace of the inputs.
+    """
+
+    result = AlignmentResult(G, C, eps=eps, structure=structure)
+    return result.A, result.eigvals
+
+
+# ============================================================================
+# Alignment scalar from the trace: A = Tr(G^{-1} C) − D
+# ============================================================================
+def alignment_scalar_trace(G, C, eps=1e-12, structure=None):
+    """
+    Compute the scalar alignment diagnostic without any eigendecomposition
+    of H, using the identity:
+
+        A = Σ (λ_i - 1) = Tr(G^{-1/2} C G^{-1/2}) - D
+
+    Cost is O(D) for a diagonal G, O(Σ_b D_b³) for a block-diagonal G
+    (only the diagonal blocks of C are touched), and O(D³) otherwise.
+
+    Parameters
+    ----------
+    G, C : np.ndarray
+        Fisher matrix (any representation accepted by
+        `compute_alignment_operator`) and empirical covariance.
+    eps : float
+        Regularization parameter used in eigenvalue flooring.
+    structure : str or None
+        Structure of G.
+
+    Returns
+    -------
+    float
+        Scalar diagnostic A.
     """
+    xp = array_namespace(G, C)
+    kind, data = _resolve_structure(G, structure, xp)
+    C = xp.asarray(C)
+    factor = _inverse_sqrt_factor(kind, data, eps)
 
-    H = compute_alignment_operator(G, C)
-    eigvals = np.linalg.eigvalsh(H)
+    if kind == "diagonal":
+        trace = float(xp.sum(xp.diag(C) * factor**2))
+    elif kind == "block":
+        trace = 0.0
+        for idx, B in factor:
+            Cb = C[idx[:, None], idx[None, :]]
+            trace += float(xp.sum((B @ B) * Cb))
+    else:
+        trace = float(xp.sum((factor @ factor) * C))
 
-    A = float(np.sum(eigvals - 1.0))
-    return A, eigvals
+    return trace - C.shape[0]
 
 
 # ============================================================================
@@ -139,3 +480,156 @@ def compute_phi(A):
     """
 
     return np.sqrt(A) if A > 0 else 0.0
+
+
+# ============================================================================
+# Block-wise alignment decomposition
+# ============================================================================
+def _single_block_alignment(G, C, eps):
+    """Alignment diagnostics for one diagonal block (G_b, C_b)."""
+    result = AlignmentResult(G, C, eps=eps)
+    return {"H": result.H, "lambdas": result.eigvals, "A": result.A,
+            "phi": float(result.phi)}
+
+
+def compute_block_alignment(G_blocks, C_blocks, names=None, eps=1e-12,
+                            max_workers=None):
+    """
+    Compute alignment diagnostics independently on each diagonal block.
+
+    With G and C restricted to their diagonal blocks (e.g. one block per
+    network layer), the block-diagonal operator
+
+        H = diag(H_1, ..., H_B),   H_b = G_b^{-1/2} C_b G_b^{-1/2}
+
+    has spectrum ∪_b spec(H_b) and scalar diagnostic A = Σ_b A_b. Each block
+    costs O(D_b³) instead of O(D³) for the global problem, and blocks are
+    processed in parallel threads (LAPACK releases the GIL).
+
+    Parameters
+    ----------
+    G_blocks, C_blocks : list of np.ndarray or torch.Tensor
+        Matching lists of square diagonal blocks.
+    names : list of str or None
+        Block labels; defaults to "block_0", "block_1", ...
+    eps : float
+        Regularization parameter used in eigenvalue flooring.
+    max_workers : int or None
+        Thread-pool size (None lets the executor decide).
+
+    Returns
+    -------
+    dict:
+        "names":   block labels
+        "blocks":  list of per-block dicts with H, lambdas, A, phi
+        "lambdas": concatenated block spectra (sorted ascending)
+        "A":       block-diagonal total Σ_b A_b
+        "phi":     rectified amplitude of the total
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if len(G_blocks) != len(C_blocks):
+        raise ValueError("G_blocks and C_blocks must have the same length.")
+    if names is None:
+        names = [f"block_{i}" for i in range(len(G_blocks))]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        blocks = list(pool.map(
+            lambda gc: _single_block_alignment(gc[0], gc[1], eps),
+            zip(G_blocks, C_blocks),
+        ))
+
+    xp = array_namespace(G_blocks, C_blocks)
+    eigvals = xp.sort(xp.concatenate([b["lambdas"] for b in blocks]))
+    A = float(sum(b["A"] for b in blocks))
+
+    return {
+        "names": list(names),
+        "blocks": blocks,
+        "lambdas": eigvals,
+        "A": A,
+        "phi": float(compute_phi(A)),
+    }
+
+
+# ============================================================================
+# Regularization path A(ε) from a single eigendecomposition of G
+# ============================================================================
+def alignment_regularization_path(G, C, eps_values, mode="floor",
+                                  spectra=True, max_batch_elems=2**24):
+    """
+    Evaluate the alignment diagnostics for many regularization levels ε
+    from one eigendecomposition of G.
+
+    With G = U Λ U^T and C̃ = U^T C U (computed once), every regularized
+    operator is similar to
+
+        H_ε ≅ F_ε C̃ F_ε,     F_ε = diag(f_ε(Λ))
+
+    so that
+
+        A(ε) = Σ_i f_ε(λ_i)² C̃_ii − D
+
+    is a vectorized O(K·D) projection for K values of ε. Two regularizers
+    are supported:
+
+        "floor":     f_ε(λ) = 1 / sqrt(max(λ, ε))   (as in `_inverse_sqrt`)
+        "tikhonov":  f_ε(λ) = 1 / sqrt(λ + ε)        (G + ε I)
+
+    Parameters
+    ----------
+    G, C : np.ndarray or torch.Tensor
+        Fisher matrix and empirical covariance, shape (D, D).
+    eps_values : array_like
+        Regularization levels, shape (K,).
+    mode : str
+        "floor" or "tikhonov".
+    spectra : bool
+        Also return the full spectrum of every H_ε (batched `eigvalsh`,
+        O(K·D³)). A and φ never require it.
+    max_batch_elems : int
+        Upper bound on the number of matrix entries materialized per
+        batched `eigvalsh` call.
+
+    Returns
+    -------
+    dict:
+        "eps":     regularization levels, shape (K,)
+        "A":       A(ε), shape (K,)
+        "phi":     φ(ε), shape (K,)
+        "lambdas": eigenvalues of each H_ε, shape (K, D) (if spectra=True)
+    """
+    xp = array_namespace(G, C)
+    G, C = xp.asarray(G), xp.asarray(C)
+    G = 0.5 * (G + G.T)
+    C = 0.5 * (C + C.T)
+    eps = xp.asarray(np.atleast_1d(np.asarray(eps_values, dtype=np.float64)))
+
+    eigvals_G, U = xp.eigh(G)
+    C_rot = U.T @ C @ U
+
+    if mode == "floor":
+        scale2 = 1.0 / xp.maximum(eigvals_G[None, :], eps[:, None])
+    elif mode == "tikhonov":
+        scale2 = 1.0 / (eigvals_G[None, :] + eps[:, None])
+    else:
+        raise ValueError(f"Unknown regularization mode '{mode}'.")
+
+    D = G.shape[0]
+    A = scale2 @ xp.diag(C_rot) - D
+    phi = xp.sqrt(xp.maximum(A, 0.0))
+
+    out = {"eps": eps, "A": A, "phi": phi}
+
+    if spectra:
+        f = xp.sqrt(scale2)
+        K = eps.shape[0]
+        batch = max(1, int(max_batch_elems // max(D * D, 1)))
+        lambdas = xp.empty((K, D))
+        for start in range(0, K, batch):
+            fb = f[start:start + batch]
+            Hb = fb[:, :, None] * C_rot[None, :, :] * fb[:, None, :]
+            lambdas[start:start + batch] = xp.eigvalsh(Hb)
+        out["lambdas"] = lambdas
+
+    return out
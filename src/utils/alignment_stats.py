@@ -0,0 +1,414 @@
+import os
+import glob
+import socket
+import struct
+
+import numpy as np
+
+
+# ============================================================================
+# Binary format
+# ============================================================================
+#
+# Every serialized record is laid out as:
+#
+#     header   : magic (4s) | version (u16) | flags (u16) | dim (u64) | count (u64)
+#     payload  : score_sum    — D float64
+#                gram_sum     — D(D+1)/2 float64 (packed upper triangle)
+#                gram_sq_sum  — D(D+1)/2 float64 (only if FLAG_MOMENTS)
+#
+# All fields are little-endian, so shards written on one machine can be
+# reduced on any other.
+_MAGIC = b"CFAS"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHQQ")
+_FLAG_MOMENTS = 0x1
+_DTYPE = np.dtype("<f8")
+
+# Socket framing: each message is prefixed by its byte length.
+_FRAME = struct.Struct("<Q")
+
+STATS_SUFFIX = ".cfas"
+
+
+def pack_symmetric(M, dtype=np.float64):
+    """
+    Row-major upper triangle of a symmetric (n, n) matrix, as a flat array
+    of n(n+1)/2 entries of `dtype`. Shared by the binary stats format and
+    the packed result schema of `experiment_io`.
+    """
+    M = np.asarray(M)
+    return M[np.triu_indices(M.shape[0])].astype(dtype, copy=False)
+
+
+def unpack_symmetric(packed, n):
+    """Dense float64 (n, n) matrix from `pack_symmetric` output."""
+    M = np.empty((n, n), dtype=np.float64)
+    iu = np.triu_indices(n)
+    M[iu] = packed
+    M.T[iu] = packed
+    return M
+
+
+# ============================================================================
+# Mergeable sufficient statistics
+# ============================================================================
+class AlignmentStats:
+    """
+    Mergeable sufficient statistics of a batch of score vectors.
+
+    For scores v_n ∈ R^D the record stores:
+
+        count        N
+        score_sum    Σ_n v_n
+        gram_sum     Σ_n v_n v_n^T
+        gram_sq_sum  Σ_n (v_n v_n^T)∘(v_n v_n^T)   (optional)
+
+    Everything the experiments need — the empirical score covariance
+    C = E_q[v v^T], the score mean, and the Monte Carlo error of each entry
+    of C — is a function of these sums. Since sums are associative, shards
+    computed on different machines can be combined with `merge` in any order
+    and the result matches a single-node run up to floating-point
+    reassociation.
+
+    Parameters
+    ----------
+    count : int
+        Number of score vectors accumulated.
+    score_sum : np.ndarray
+        Sum of score vectors, shape (D,).
+    gram_sum : np.ndarray
+        Sum of outer products, shape (D, D).
+    gram_sq_sum : np.ndarray or None
+        Sum of squared per-sample outer-product entries, shape (D, D).
+        Only tracked when per-sample contribution moments are requested.
+    """
+
+    def __init__(self, count, score_sum, gram_sum, gram_sq_sum=None):
+        self.count = int(count)
+        self.score_sum = np.asarray(score_sum, dtype=np.float64)
+        self.gram_sum = np.asarray(gram_sum, dtype=np.float64)
+        self.gram_sq_sum = (
+            None if gram_sq_sum is None
+            else np.asarray(gram_sq_sum, dtype=np.float64)
+        )
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def zeros(cls, dim, moments=False):
+        """Empty record of dimension `dim` (the identity for `merge`)."""
+        return cls(
+            0,
+            np.zeros(dim),
+            np.zeros((dim, dim)),
+            np.zeros((dim, dim)) if moments else None,
+        )
+
+    @classmethod
+    def from_scores(cls, V, moments=False):
+        """
+        Build a record from a score matrix V of shape (D, N).
+
+        Parameters
+        ----------
+        V : np.ndarray
+            Score vectors stored column-wise, as returned by the
+            `*_scores` functions of every experiment family.
+        moments : bool
+            Also track per-sample contribution moments (gram_sq_sum).
+        """
+        stats = cls.zeros(np.shape(V)[0], moments=moments)
+        stats.update(V)
+        return stats
+
+    def update(self, V):
+        """
+        Accumulate a (D, N) block of score vectors in place.
+
+        Returns
+        -------
+        AlignmentStats
+            `self`, to allow chaining over streamed chunks.
+        """
+        V = np.asarray(V, dtype=np.float64)
+        self.count += V.shape[1]
+        self.score_sum += V.sum(axis=1)
+        self.gram_sum += V @ V.T
+        if self.gram_sq_sum is not None:
+            V2 = V * V
+            self.gram_sq_sum += V2 @ V2.T
+        return self
+
+    # ------------------------------------------------------------------
+    # Reduction
+    # ------------------------------------------------------------------
+    @property
+    def dim(self):
+        """Score dimension D."""
+        return self.score_sum.shape[0]
+
+    @property
+    def has_moments(self):
+        """Whether per-sample contribution moments are tracked."""
+        return self.gram_sq_sum is not None
+
+    def merge(self, other):
+        """
+        Combine two records into a new one.
+
+        The operation is associative and commutative, with
+        `AlignmentStats.zeros(D)` as identity. Contribution moments survive
+        only if both operands track them.
+        """
+        if self.dim != other.dim:
+            raise ValueError(
+                f"Cannot merge statistics of dimension {self.dim} and {other.dim}."
+            )
+
+        gram_sq_sum = None
+        if self.has_moments and other.has_moments:
+            gram_sq_sum = self.gram_sq_sum + other.gram_sq_sum
+
+        return AlignmentStats(
+            self.count + other.count,
+            self.score_sum + other.score_sum,
+            self.gram_sum + other.gram_sum,
+            gram_sq_sum,
+        )
+
+    __add__ = merge
+
+    # ------------------------------------------------------------------
+    # Derived quantities
+    # ------------------------------------------------------------------
+    def mean(self):
+        """Empirical score mean E_q[v]."""
+        return self.score_sum / float(self.count)
+
+    def second_moment(self):
+        """
+        Empirical score covariance as used throughout the experiments:
+
+            C = E_q[v v^T] ≈ (1 / N) Σ_n v_n v_n^T
+        """
+        return self.gram_sum / float(self.count)
+
+    def covariance(self):
+        """Centered covariance E_q[v v^T] − E_q[v] E_q[v]^T."""
+        m = self.mean()
+        return self.second_moment() - np.outer(m, m)
+
+    def standard_error(self):
+        """
+        Monte Carlo standard error of every entry of `second_moment()`.
+
+        Requires per-sample contribution moments.
+        """
+        if not self.has_moments:
+            raise ValueError("Contribution moments were not tracked.")
+        n = float(self.count)
+        var = self.gram_sq_sum / n - self.second_moment() ** 2
+        return np.sqrt(np.maximum(var, 0.0) / n)
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+    def to_bytes(self):
+        """Serialize into the compact little-endian binary format."""
+        flags = _FLAG_MOMENTS if self.has_moments else 0
+        parts = [
+            _HEADER.pack(_MAGIC, _VERSION, flags, self.dim, self.count),
+            self.score_sum.astype(_DTYPE).tobytes(),
+            pack_symmetric(self.gram_sum, _DTYPE).tobytes(),
+        ]
+        if self.has_moments:
+            parts.append(pack_symmetric(self.gram_sq_sum, _DTYPE).tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Inverse of `to_bytes`."""
+        magic, version, flags, dim, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError("Not an AlignmentStats record (bad magic).")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported AlignmentStats version {version}.")
+
+        n_tri = dim * (dim + 1) // 2
+        offset = _HEADER.size
+
+        def _read(n):
+            nonlocal offset
+            arr = np.frombuffer(data, dtype=_DTYPE, count=n, offset=offset)
+            offset += n * _DTYPE.itemsize
+            return arr.astype(np.float64)
+
+        score_sum = _read(dim)
+        gram_sum = unpack_symmetric(_read(n_tri), dim)
+        gram_sq_sum = None
+        if flags & _FLAG_MOMENTS:
+            gram_sq_sum = unpack_symmetric(_read(n_tri), dim)
+
+        return cls(count, score_sum, gram_sum, gram_sq_sum)
+
+    def save(self, path):
+        """
+        Write the record to `path`.
+
+        The file is written to a temporary name first and then renamed, so a
+        concurrent `reduce_directory` never sees a partially written shard.
+        """
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(self.to_bytes())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a record written by `save`."""
+        with open(path, "rb") as fh:
+            return cls.from_bytes(fh.read())
+
+    def __repr__(self):
+        return (
+            f"AlignmentStats(dim={self.dim}, count={self.count}, "
+            f"moments={self.has_moments})"
+        )
+
+
+# ============================================================================
+# Map step
+# ============================================================================
+def shard_bounds(num_samples, num_shards):
+    """
+    Split the index range [0, num_samples) into contiguous shards.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        (start, stop) pairs whose sizes differ by at most one.
+    """
+    edges = np.linspace(0, num_samples, num_shards + 1).astype(np.int64)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:])]
+
+
+def compute_shard_stats(score_fn, x, *params, moments=False):
+    """
+    Map step for any experiment family.
+
+    Evaluates `score_fn(x, *params)` — e.g. `gaussian_scores`,
+    `laplace_scores` or `gmm_scores` — on one shard of data and reduces the
+    resulting (D, N) score matrix to an `AlignmentStats` record.
+    """
+    return AlignmentStats.from_scores(score_fn(x, *params), moments=moments)
+
+
+# ============================================================================
+# Reduce step
+# ============================================================================
+def tree_reduce(stats_list):
+    """
+    Combine records by pairwise tree reduction.
+
+    Pairing neighbours level by level keeps the summation depth at
+    O(log S) for S shards, which bounds floating-point error growth
+    compared to a sequential fold.
+    """
+    level = list(stats_list)
+    if not level:
+        raise ValueError("tree_reduce() needs at least one record.")
+
+    while len(level) > 1:
+        nxt = [a.merge(b) for a, b in zip(level[0::2], level[1::2])]
+        if len(level) % 2:
+            nxt.append(level[-1])
+        level = nxt
+
+    return level[0]
+
+
+def reduce_directory(directory, pattern=f"*{STATS_SUFFIX}"):
+    """
+    Load every shard matching `pattern` in `directory` and tree-reduce them.
+
+    Files are processed in sorted order so the reduction is deterministic.
+    """
+    paths = sorted(glob.glob(os.path.join(directory, pattern)))
+    if not paths:
+        raise FileNotFoundError(f"No statistics shards found in {directory}.")
+    return tree_reduce([AlignmentStats.load(p) for p in paths])
+
+
+# ============================================================================
+# Socket transport
+# ============================================================================
+def _recv_exact(sock, n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("Socket closed before record was complete.")
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def send_stats(sock, stats):
+    """Send one length-prefixed record over a connected socket."""
+    payload = stats.to_bytes()
+    sock.sendall(_FRAME.pack(len(payload)) + payload)
+
+
+def recv_stats(sock):
+    """Receive one record sent with `send_stats`."""
+    (size,) = _FRAME.unpack(_recv_exact(sock, _FRAME.size))
+    return AlignmentStats.from_bytes(_recv_exact(sock, size))
+
+
+def push_stats(address, stats, timeout=30.0):
+    """Connect to a reducer listening on `address` and send one record."""
+    with socket.create_connection(address, timeout=timeout) as sock:
+        send_stats(sock, stats)
+
+
+def reduce_sockets(server, num_shards, timeout=30.0):
+    """
+    Accept `num_shards` records on a listening socket and tree-reduce them.
+
+    Parameters
+    ----------
+    server : socket.socket
+        Bound, listening socket (see `listen_local`).
+    num_shards : int
+        Number of records to wait for.
+    timeout : float
+        Per-connection timeout in seconds.
+
+    Returns
+    -------
+    AlignmentStats
+        The combined record. Shards are reduced in arrival order.
+    """
+    server.settimeout(timeout)
+    received = []
+    for _ in range(num_shards):
+        conn, _ = server.accept()
+        with conn:
+            conn.settimeout(timeout)
+            received.append(recv_stats(conn))
+    return tree_reduce(received)
+
+
+def listen_local(host="127.0.0.1", port=0, backlog=64):
+    """
+    Open a listening TCP socket for `reduce_sockets`.
+
+    With port=0 the OS picks a free port; read it back from
+    `server.getsockname()`.
+    """
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind((host, port))
+    server.listen(backlog)
+    return server
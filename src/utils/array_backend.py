@@ -0,0 +1,170 @@
+import numpy as np
+
+
+# ============================================================================
+# Array namespaces
+# ============================================================================
+#
+# The alignment kernels only need a handful of dense linear-algebra
+# primitives. Each namespace exposes them with identical signatures, so the
+# same code runs on NumPy arrays or on torch tensors (CPU or GPU) without
+# host round-trips. Results stay in float64 in both cases.
+
+class _NumpyNamespace:
+    name = "numpy"
+
+    def asarray(self, x):
+        return np.asarray(x, dtype=np.float64)
+
+    def copy(self, x):
+        return np.array(x, dtype=np.float64, copy=True)
+
+    def atleast_2d(self, x):
+        return np.atleast_2d(self.asarray(x))
+
+    def arange(self, start, stop):
+        return np.arange(start, stop)
+
+    def index(self, idx):
+        return np.asarray(idx)
+
+    def empty(self, shape):
+        return np.empty(shape)
+
+    def eye(self, n):
+        return np.eye(n)
+
+    def diag(self, x):
+        return np.diag(x)
+
+    def sqrt(self, x):
+        return np.sqrt(x)
+
+    def maximum(self, x, lo):
+        return np.maximum(x, lo)
+
+    def sum(self, x):
+        return np.sum(x)
+
+    def any(self, x):
+        return bool(np.any(x))
+
+    def sort(self, x):
+        return np.sort(x)
+
+    def concatenate(self, xs):
+        return np.concatenate(xs)
+
+    def eigh(self, M):
+        return np.linalg.eigh(M)
+
+    def eigvalsh(self, M):
+        return np.linalg.eigvalsh(M)
+
+    def inv(self, M):
+        return np.linalg.inv(M)
+
+    def to_numpy(self, x):
+        return np.asarray(x)
+
+
+class _TorchNamespace:
+    name = "torch"
+
+    def __init__(self, device=None):
+        import torch
+
+        self._torch = torch
+        self.device = device
+
+    def asarray(self, x):
+        return self._torch.as_tensor(x, dtype=self._torch.float64, device=self.device)
+
+    def copy(self, x):
+        return self.asarray(x).clone()
+
+    def atleast_2d(self, x):
+        return self._torch.atleast_2d(self.asarray(x))
+
+    def arange(self, start, stop):
+        return self._torch.arange(start, stop, device=self.device)
+
+    def index(self, idx):
+        return self._torch.as_tensor(idx, device=self.device)
+
+    def empty(self, shape):
+        return self._torch.empty(shape, dtype=self._torch.float64, device=self.device)
+
+    def eye(self, n):
+        return self._torch.eye(n, dtype=self._torch.float64, device=self.device)
+
+    def diag(self, x):
+        return self._torch.diag(x)
+
+    def sqrt(self, x):
+        return self._torch.sqrt(x)
+
+    def maximum(self, x, lo):
+        return self._torch.clamp(x, min=lo)
+
+    def sum(self, x):
+        return self._torch.sum(x)
+
+    def any(self, x):
+        return bool(self._torch.any(x))
+
+    def sort(self, x):
+        return self._torch.sort(x).values
+
+    def concatenate(self, xs):
+        return self._torch.cat(list(xs))
+
+    def eigh(self, M):
+        return self._torch.linalg.eigh(M)
+
+    def eigvalsh(self, M):
+        return self._torch.linalg.eigvalsh(M)
+
+    def inv(self, M):
+        return self._torch.linalg.inv(M)
+
+    def to_numpy(self, x):
+        return x.detach().cpu().numpy()
+
+
+_NUMPY = _NumpyNamespace()
+
+
+def is_torch(x):
+    """True for torch tensors, detected without importing torch."""
+    return type(x).__module__.split(".")[0] == "torch"
+
+
+def _find_tensor(arrays):
+    for a in arrays:
+        if isinstance(a, (list, tuple)):
+            found = _find_tensor(a)
+            if found is not None:
+                return found
+        elif is_torch(a):
+            return a
+    return None
+
+
+def array_namespace(*arrays):
+    """
+    Namespace for the given arrays: torch if any of them (or any element of
+    a list/tuple argument, e.g. Fisher blocks) is a tensor, NumPy otherwise.
+    Torch namespaces place new arrays on the device of that tensor.
+    """
+    tensor = _find_tensor(arrays)
+    if tensor is None:
+        return _NUMPY
+    return _TorchNamespace(tensor.device)
+
+
+def to_numpy(x):
+    """Convert a tensor (any device) or array-like to a NumPy array."""
+    if is_torch(x):
+        return x.detach().cpu().numpy()
+    return np.asarray(x)
@@ -0,0 +1,140 @@
+import numpy as np
+import torch
+from torch.func import grad, vmap
+
+from src.utils.alignment_core import AlignmentResult
+from src.utils.alignment_stats import AlignmentStats
+
+
+# ============================================================================
+# Batched per-sample scores via torch.func
+# ============================================================================
+def _per_sample_score(log_density):
+    """v(x | θ) = ∇_θ log p(x | θ), vectorized over the sample axis of x."""
+    return vmap(grad(log_density, argnums=1), in_dims=(0, None))
+
+
+def _iter_score_chunks(log_density, theta, x, chunk_size):
+    """
+    Yield (start, stop, V_chunk) with V_chunk of shape (n, D) as a torch
+    tensor. Input chunks are copied into one reused float64 buffer.
+    """
+    score = _per_sample_score(log_density)
+    theta_t = torch.as_tensor(np.asarray(theta, dtype=np.float64))
+
+    x = np.asarray(x)   # no copy for ndarray / memmap inputs
+    n = len(x)
+    buf = torch.empty((min(chunk_size, n),) + tuple(np.shape(x)[1:]),
+                      dtype=torch.float64)
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        xb = buf[:stop - start]
+        xb.copy_(torch.from_numpy(np.ascontiguousarray(x[start:stop], dtype=np.float64)))
+        yield start, stop, score(xb, theta_t)
+
+
+def autodiff_scores(log_density, theta, x, chunk_size=65_536, out=None):
+    """
+    Compute the score matrix of an arbitrary log-density with autodiff.
+
+    `log_density(x_i, theta)` is written in torch for a *single* sample x_i
+    and a parameter vector θ of shape (D,). Per-sample gradients are
+    obtained with `torch.func.vmap(grad(...))` one chunk at a time, so new
+    families (Student-t, mixtures, GLMs) need no hand-derived scores.
+
+    Parameters
+    ----------
+    log_density : callable
+        (x_i: Tensor, theta: Tensor) -> scalar Tensor.
+    theta : array_like
+        Parameter vector at which scores are evaluated, shape (D,).
+    x : np.ndarray
+        Samples, shape (N,) or (N, ...) (memmaps are read chunk by chunk).
+    chunk_size : int
+        Samples per vectorized gradient evaluation.
+    out : np.ndarray or None
+        Optional preallocated (D, N) float64 output buffer.
+
+    Returns
+    -------
+    np.ndarray
+        Score matrix of shape (D, N), matching the `*_scores` convention.
+    """
+    D = int(np.size(theta))
+    if out is None:
+        out = np.empty((D, len(x)), dtype=np.float64)
+
+    for start, stop, V in _iter_score_chunks(log_density, theta, x, chunk_size):
+        out[:, start:stop] = V.T.numpy()
+
+    return out
+
+
+def autodiff_score_stats(log_density, theta, x, chunk_size=65_536, moments=False):
+    """
+    Accumulate AlignmentStats of autodiff scores without storing (D, N).
+
+    Returns
+    -------
+    AlignmentStats
+        `second_moment()` gives the empirical covariance C.
+    """
+    stats = AlignmentStats.zeros(int(np.size(theta)), moments=moments)
+    for _, _, V in _iter_score_chunks(log_density, theta, x, chunk_size):
+        stats.update(V.T.numpy())
+    return stats
+
+
+def make_score_fn(log_density, chunk_size=65_536):
+    """
+    Wrap a torch log-density as a score function with the same calling
+    convention as `gaussian_scores(x, *params)`:
+
+        score_fn(x, θ_1, ..., θ_D) -> (D, N) array
+
+    so it can be passed anywhere a hand-written score function is expected
+    (e.g. `compute_shard_stats`).
+    """
+    def score_fn(x, *params):
+        return autodiff_scores(log_density, np.asarray(params, dtype=np.float64),
+                               x, chunk_size=chunk_size)
+
+    return score_fn
+
+
+# ============================================================================
+# Alignment pipeline for autodiff families
+# ============================================================================
+def compute_autodiff_alignment(log_density, theta, x_data, x_model=None, G=None,
+                               chunk_size=65_536, eps=1e-12):
+    """
+    Run the equilibrium/misalignment pipeline for an arbitrary log-density.
+
+    Exactly one source for the Fisher matrix must be given:
+
+        - G:        analytic Fisher matrix (any representation accepted by
+                    `compute_alignment_operator`), or
+        - x_model:  samples from p(x | θ), giving the empirical Fisher
+                    G = E_p[v v^T] as in the GMM experiments.
+
+    C = E_q[v v^T] is always estimated from `x_data`.
+
+    Returns
+    -------
+    dict with "G", "C", "H", "lambdas", "A", "phi", "theta", "num_samples".
+    """
+    if (G is None) == (x_model is None):
+        raise ValueError("Provide exactly one of G or x_model.")
+
+    if G is None:
+        G = autodiff_score_stats(log_density, theta, x_model, chunk_size).second_moment()
+
+    C = autodiff_score_stats(log_density, theta, x_data, chunk_size).second_moment()
+
+    result = AlignmentResult(G, C, eps=eps)
+    return {
+        **result.to_dict(),
+        "theta": np.asarray(theta, dtype=np.float64),
+        "num_samples": len(x_data),
+    }
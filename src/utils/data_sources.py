@@ -0,0 +1,210 @@
+import os
+import queue
+import threading
+from itertools import islice
+
+import numpy as np
+
+from src.utils.alignment_core import AlignmentResult
+from src.utils.alignment_stats import AlignmentStats
+
+
+# ============================================================================
+# Chunked readers
+# ============================================================================
+#
+# Every reader is a generator of in-memory arrays of at most `chunk_size`
+# rows, shaped (n,) for one feature per sample and (n, d) otherwise — the
+# layout the `*_scores` functions expect. Only one chunk is resident at a
+# time (two with `prefetch`).
+
+def _iter_rows(arr, chunk_size):
+    """Copy consecutive row blocks of an (memory-mapped) array into RAM."""
+    for start in range(0, len(arr), chunk_size):
+        yield np.array(arr[start:start + chunk_size])
+
+
+def iter_npy_chunks(path, chunk_size=1_000_000):
+    """Stream a `.npy` file through a read-only memory map."""
+    return _iter_rows(np.load(path, mmap_mode="r"), chunk_size)
+
+
+def iter_raw_chunks(path, dtype="<f8", num_features=None, chunk_size=1_000_000,
+                    offset=0):
+    """
+    Stream a headerless binary file of fixed-size records.
+
+    Args:
+        path (str): File path.
+        dtype (str | np.dtype): Element type, including byte order.
+        num_features (int | None): Values per sample; None for a flat
+            (N,) stream.
+        chunk_size (int): Samples per chunk.
+        offset (int): Bytes to skip at the start of the file.
+    """
+    dtype = np.dtype(dtype)
+    width = 1 if num_features is None else int(num_features)
+    num_samples = (os.path.getsize(path) - offset) // (dtype.itemsize * width)
+    shape = (num_samples,) if num_features is None else (num_samples, width)
+    if num_samples <= 0:
+        # np.memmap cannot map an empty file
+        return iter(())
+
+    mm = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+    return _iter_rows(mm, chunk_size)
+
+
+def iter_csv_chunks(path, chunk_size=100_000, columns=None, delimiter=",",
+                    skip_header=0):
+    """
+    Stream numeric columns of a delimited text file.
+
+    Args:
+        path (str): File path.
+        chunk_size (int): Rows per chunk.
+        columns (int | sequence[int] | None): Columns to keep; a single
+            int gives (n,) chunks.
+        delimiter (str): Field separator.
+        skip_header (int): Number of leading lines to skip.
+    """
+    with open(path, "r") as f:
+        for _ in range(skip_header):
+            next(f, None)
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            yield np.loadtxt(lines, delimiter=delimiter, usecols=columns,
+                             dtype=np.float64, ndmin=1 if np.isscalar(columns) else 2)
+
+
+def open_chunks(path, chunk_size=1_000_000, **kwargs):
+    """
+    Pick a reader from the file suffix: `.npy` → memmap, `.csv`/`.txt` →
+    text, anything else → raw binary. Extra keyword arguments go to the
+    selected reader.
+    """
+    suffix = os.path.splitext(str(path))[1].lower()
+    if suffix == ".npy":
+        return iter_npy_chunks(path, chunk_size=chunk_size)
+    if suffix in (".csv", ".txt"):
+        return iter_csv_chunks(path, chunk_size=chunk_size, **kwargs)
+    return iter_raw_chunks(path, chunk_size=chunk_size, **kwargs)
+
+
+# ============================================================================
+# Background prefetch
+# ============================================================================
+_DONE = object()
+
+
+def prefetch(chunks, depth=2):
+    """
+    Read chunks on a background thread, `depth` chunks ahead of the
+    consumer, so disk I/O and parsing overlap with score computation
+    (NumPy releases the GIL in both).
+
+    Exceptions raised by the reader are re-raised in the consumer. Closing
+    the returned generator early stops the reader thread.
+    """
+    q = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def _put(item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _reader():
+        try:
+            for chunk in chunks:
+                if not _put(chunk):
+                    return
+        except BaseException as exc:     # forwarded to the consumer
+            _put(exc)
+            return
+        _put(_DONE)
+
+    thread = threading.Thread(target=_reader, name="chunk-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = q.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+# ============================================================================
+# Streaming score statistics
+# ============================================================================
+def stream_score_stats(chunks, score_fn, *params, moments=False, prefetch_depth=2,
+                       source=None):
+    """
+    Accumulate AlignmentStats of `score_fn(x_chunk, *params)` over a chunk
+    stream (e.g. `open_chunks(path)`), never holding more than a few chunks.
+
+    Args:
+        chunks (iterable[np.ndarray]): Data chunks.
+        score_fn (callable): Score function returning (D, n) per chunk.
+        *params: Model parameters passed to `score_fn`.
+        moments (bool): Also accumulate fourth moments.
+        prefetch_depth (int): Chunks read ahead on a background thread;
+            0 reads synchronously.
+        source (str | None): Name of the data in error messages.
+
+    Returns:
+        AlignmentStats: `second_moment()` gives the empirical C.
+
+    Raises:
+        ValueError: if the stream holds no samples.
+    """
+    if prefetch_depth > 0:
+        chunks = prefetch(chunks, depth=prefetch_depth)
+
+    stats = None
+    for x in chunks:
+        V = score_fn(x, *params)
+        if stats is None:
+            stats = AlignmentStats.zeros(V.shape[0], moments=moments)
+        stats.update(V)
+    if stats is None or stats.count == 0:
+        raise ValueError(f"no samples in {source or 'the chunk stream'}")
+    return stats
+
+
+def compute_file_alignment(path, score_fn, params, G, chunk_size=1_000_000,
+                           prefetch_depth=2, eps=1e-12, **reader_kwargs):
+    """
+    Alignment diagnostics of a model against data stored on disk.
+
+    C = E_q[v vᵀ] is streamed from `path` (see `open_chunks`); G is the
+    model's Fisher matrix in any form accepted by `alignment_core`.
+
+    Returns:
+        dict: {"G", "C", "H", "lambdas", "A", "phi", "num_samples"}
+
+    Raises:
+        ValueError: if the file holds no samples.
+    """
+    stats = stream_score_stats(
+        open_chunks(path, chunk_size=chunk_size, **reader_kwargs),
+        score_fn, *params, prefetch_depth=prefetch_depth, source=path,
+    )
+    C = stats.second_moment()
+
+    result = AlignmentResult(G, C, eps=eps)
+
+    return {
+        **result.to_dict(),
+        "num_samples": stats.count,
+    }
@@ -1,7 +1,14 @@
+import json
 import os
+import queue
+import shutil
+import threading
+import uuid
+from contextlib import contextmanager
+
 import numpy as np
-import matplotlib.pyplot as plt
 
+from src.utils.alignment_stats import pack_symmetric, unpack_symmetric
 from src.utils.paths import (
     get_root_dir,
     get_fig_dirs,
@@ -9,6 +16,51 @@ from src.utils.paths import (
 )
 
 
+# ---------------------------------------------------------
+# Atomic writes
+# ---------------------------------------------------------
+
+def _temp_name(path, tag="tmp"):
+    """Unique hidden sibling of `path` (same filesystem, so renames are atomic)."""
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{uuid.uuid4().hex}.{tag}")
+
+
+@contextmanager
+def _atomic_file(path):
+    """
+    Yield a temporary path next to `path` and rename it over `path` once
+    the block succeeds, so readers never see a partially written file.
+    """
+    tmp = _temp_name(path)
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+@contextmanager
+def _atomic_dir(path):
+    """Directory counterpart of `_atomic_file` (swap in a fully written copy)."""
+    tmp = _temp_name(path)
+    os.makedirs(tmp)
+    try:
+        yield tmp
+        if os.path.isdir(path):
+            old = _temp_name(path, "old")
+            os.replace(path, old)
+            os.replace(tmp, path)
+            shutil.rmtree(old)
+        else:
+            os.replace(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
 # ---------------------------------------------------------
 # Image utilities
 # ---------------------------------------------------------
@@ -29,37 +81,314 @@ def ensure_min_resolution(fig, min_pixels=1200):
 def save_spectrum(eigvals, filename, title=None, dpi=300, min_pixels=1200):
     """
     Save an eigenvalue spectrum plot into both publication directories.
+
+    Uses a standalone Figure (no pyplot state), so it is safe to call from
+    the `AsyncWriter` thread. Matplotlib is imported on first use.
     """
-    fig = plt.figure(figsize=(5, 3), dpi=dpi)
-    plt.plot(eigvals, marker='o')
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(5, 3), dpi=dpi)
+    ax = fig.add_subplot()
+    ax.plot(eigvals, marker='o')
     if title:
-        plt.title(title)
-    plt.xlabel("Index")
-    plt.ylabel("Eigenvalue")
-    plt.tight_layout()
+        ax.set_title(title)
+    ax.set_xlabel("Index")
+    ax.set_ylabel("Eigenvalue")
+    fig.tight_layout()
 
     ensure_min_resolution(fig, min_pixels=min_pixels)
 
+    fmt = os.path.splitext(filename)[1][1:] or None
     for directory in get_fig_dirs():
         os.makedirs(directory, exist_ok=True)
-        fig.savefig(os.path.join(directory, filename), dpi=dpi)
-
-    plt.close(fig)
+        with _atomic_file(os.path.join(directory, filename)) as tmp:
+            fig.savefig(tmp, dpi=dpi, format=fmt)
 
 
 # ---------------------------------------------------------
 # Results saving
 # ---------------------------------------------------------
+#
+# Packed schema (save_results(..., packed=True)):
+#
+#   * the symmetric matrices in SYMMETRIC_KEYS are stored as their packed
+#     upper triangle (row-major, n(n+1)/2 entries), in float64 or float32;
+#   * derived arrays (DERIVED_KEYS: H = G^{-1/2} C G^{-1/2}) are dropped
+#     unless listed in `keep`;
+#   * a JSON entry SCHEMA_KEY records the packed shapes, stored dtypes,
+#     dropped keys and the eps needed to re-derive them.
+#
+# For MNIST (D = 3190) this stores two packed float64 triangles instead of
+# three dense matrices: 81 MB instead of 244 MB (41 MB in float32).
+# `load_results` restores the dense float64 matrices either way.
+
+SYMMETRIC_KEYS = ("G", "C", "H")
+DERIVED_KEYS = ("H",)
+SCHEMA_KEY = "__schema__"
 
-def save_results(results_dict, filename):
+
+def _pack_results(results_dict, dtype, keep, eps):
+    """Apply the packed schema to a results dict."""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float64, np.float32):
+        raise ValueError(f"Packed results support float64 or float32, got {dtype}.")
+
+    out = {}
+    schema = {"version": 1, "packed": {}, "dtype": dtype.name,
+              "dropped": [], "eps": eps}
+    for key, value in results_dict.items():
+        if key in DERIVED_KEYS and key not in keep:
+            schema["dropped"].append(key)
+            continue
+        M = np.asarray(value) if key in SYMMETRIC_KEYS else None
+        if M is not None and M.ndim == 2 and M.shape[0] == M.shape[1]:
+            scale = np.max(np.abs(M), initial=0.0)
+            if not np.allclose(M, M.T, rtol=1e-8, atol=1e-12 * scale):
+                raise ValueError(f"Result '{key}' is not symmetric; cannot pack it.")
+            out[key] = pack_symmetric(M, dtype)
+            schema["packed"][key] = M.shape[0]
+        else:
+            out[key] = value
+    out[SCHEMA_KEY] = json.dumps(schema)
+    return out
+
+
+# Directory layout (save_results(..., layout="npy_dir")):
+#
+#   results/<name>/results.json   scalars, packed schema and array index
+#   results/<name>/<key>.npy      one uncompressed array per entry
+#
+# Unlike the zipped NPZ archive, each array can be opened with
+# mmap_mode="r": reading A or plotting the spectrum of a large run touches
+# only the sidecar and the pages of `lambdas`, not G and C.
+
+RESULT_LAYOUTS = ("npz", "npy_dir")
+SIDECAR = "results.json"
+
+
+def result_path(filename, layout="npz"):
+    """Path of a result artifact inside 'results/' for the given layout."""
+    path = os.path.join(get_results_dir(), filename)
+    if layout == "npy_dir" and path.endswith(".npz"):
+        path = path[:-len(".npz")]
+    elif layout == "npz" and not path.endswith(".npz"):
+        path += ".npz"
+    return path
+
+
+def _save_npy_dir(path, results_dict):
+    sidecar = {"format": "npy_dir", "version": 1, "scalars": {}, "arrays": []}
+    for key, value in results_dict.items():
+        if key == SCHEMA_KEY:
+            sidecar["schema"] = json.loads(value)
+        elif np.ndim(value) == 0:
+            sidecar["scalars"][key] = np.asarray(value).item()
+        else:
+            if os.sep in key or key.startswith("."):
+                raise ValueError(f"Result key '{key}' is not a valid file name.")
+            sidecar["arrays"].append(key)
+
+    with _atomic_dir(path) as tmp:
+        for key in sidecar["arrays"]:
+            np.save(os.path.join(tmp, key + ".npy"), np.asarray(results_dict[key]))
+        with open(os.path.join(tmp, SIDECAR), "w", encoding="utf-8") as f:
+            json.dump(sidecar, f, indent=2)
+
+
+def _load_npy_dir(path, keys, mmap, allow_pickle):
+    with open(os.path.join(path, SIDECAR), encoding="utf-8") as f:
+        sidecar = json.load(f)
+
+    results = {}
+    for key, value in sidecar["scalars"].items():
+        if keys is None or key in keys:
+            results[key] = value
+    mmap_mode = "r" if mmap else None
+    for key in sidecar["arrays"]:
+        if keys is None or key in keys:
+            results[key] = np.load(os.path.join(path, key + ".npy"),
+                                   mmap_mode=mmap_mode, allow_pickle=allow_pickle)
+    return results, sidecar.get("schema")
+
+
+def save_results(results_dict, filename, packed=False, dtype=np.float64,
+                 keep=(), eps=1e-12, layout="npz"):
     """
-    Save NPZ experiment outputs into 'results/' directory.
+    Save experiment outputs into 'results/' directory.
+
+    Files (or the whole directory for "npy_dir") are written under a
+    temporary name and renamed into place.
 
     Parameters
     ----------
     results_dict : dict
     filename     : str
+    packed       : bool
+        Use the packed schema: symmetric G, C, H as upper triangles and
+        derived arrays dropped (see the notes above).
+    dtype        : np.float64 or np.float32
+        Storage dtype of the packed matrices.
+    keep         : iterable of str
+        Derived arrays to store anyway in packed mode.
+    eps          : float
+        Eigenvalue floor used by `load_results(..., derive=True)` to
+        rebuild dropped arrays.
+    layout       : str
+        "npz" (one archive) or "npy_dir" (a directory named after
+        `filename` without ".npz", holding one .npy per array and a JSON
+        sidecar for scalars).
     """
-    out_dir = get_results_dir()
-    os.makedirs(out_dir, exist_ok=True)
-    np.savez(os.path.join(out_dir, filename), **results_dict)
+    if layout not in RESULT_LAYOUTS:
+        raise ValueError(f"Unknown result layout '{layout}'. Expected one of {RESULT_LAYOUTS}.")
+    # `filename` may name a subdirectory of results/, e.g. "<experiment>/<run id>.npz"
+    os.makedirs(os.path.dirname(result_path(filename, layout)), exist_ok=True)
+    if packed:
+        results_dict = _pack_results(results_dict, dtype, set(keep), eps)
+    if layout == "npy_dir":
+        _save_npy_dir(result_path(filename, layout), results_dict)
+    else:
+        with _atomic_file(result_path(filename, layout)) as tmp:
+            with open(tmp, "wb") as f:
+                np.savez(f, **results_dict)
+
+
+def load_results(filename, derive=False, allow_pickle=False, keys=None, mmap=True):
+    """
+    Load a results file written by `save_results`, in either layout and
+    schema.
+
+    Packed matrices are returned dense in float64 and 0-d entries as
+    Python scalars, so every variant loads into the same dict. With
+    `derive=True`, dropped derived arrays (H) are recomputed from G and C.
+
+    Parameters
+    ----------
+    filename     : str
+        Name inside 'results/' (or an absolute path). For the directory
+        layout the ".npz" suffix is optional; when both layouts exist the
+        directory is read.
+    derive       : bool
+        Recompute arrays dropped by the packed schema (needs G and C).
+    allow_pickle : bool
+        Forwarded to `np.load` for files holding object arrays.
+    keys         : iterable of str or None
+        Load only these entries (all by default).
+    mmap         : bool
+        Open the arrays of a directory layout with mmap_mode="r".
+    """
+    keys = None if keys is None else set(keys)
+    path = result_path(filename, "npy_dir")
+    if os.path.isdir(path):
+        results, schema = _load_npy_dir(path, keys, mmap, allow_pickle)
+    else:
+        with np.load(result_path(filename, "npz"), allow_pickle=allow_pickle) as data:
+            results = {key: data[key] for key in data.files
+                       if keys is None or key in keys or key == SCHEMA_KEY}
+        schema = results.pop(SCHEMA_KEY, None)
+        schema = json.loads(schema.item()) if schema is not None else None
+
+    for key, value in results.items():
+        if schema and key in schema["packed"]:
+            results[key] = unpack_symmetric(value, schema["packed"][key])
+        elif isinstance(value, np.ndarray) and value.ndim == 0:
+            results[key] = value.item()
+
+    if derive and schema and "H" in schema["dropped"] and (keys is None or "H" in keys):
+        from src.utils.alignment_core import AlignmentResult
+
+        G, C = results.get("G"), results.get("C")
+        if G is None or C is None:
+            G, C = (load_results(filename, keys=("G", "C"))[k] for k in ("G", "C"))
+        results["H"] = AlignmentResult(G, C, eps=schema["eps"]).H
+    return results
+
+
+# ---------------------------------------------------------
+# Background writer
+# ---------------------------------------------------------
+
+class AsyncWriter:
+    """
+    Background executor for result and figure writes.
+
+    Jobs are queued (at most `max_pending` waiting; `submit` blocks beyond
+    that) and run in order on one worker thread, so the next experiment
+    computes while the previous one is rendered and written. NumPy's file
+    writes, zlib and the Agg renderer spend most of their time outside the
+    GIL. Arrays passed to a job must not be modified until `flush`.
+
+    The first error raised by a job is re-raised by `flush` / `close`; use
+    as a context manager to close (and surface errors) on exit.
+
+    Example
+    -------
+        with AsyncWriter() as writer:
+            writer.save_spectrum(out["lambdas"], "run.png")
+            writer.save_results(out, "run.npz")
+    """
+
+    def __init__(self, max_pending=4):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._errors = []
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="async-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                fn, args, kwargs = job
+                try:
+                    fn(*args, **kwargs)
+                except BaseException as exc:
+                    self._errors.append(exc)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue `fn(*args, **kwargs)`."""
+        if self._closed:
+            raise RuntimeError("AsyncWriter is closed.")
+        self._queue.put((fn, args, kwargs))
+
+    def save_results(self, results_dict, filename, **kwargs):
+        """Queue `save_results(results_dict, filename, **kwargs)`."""
+        self.submit(save_results, results_dict, filename, **kwargs)
+
+    def save_spectrum(self, eigvals, filename, **kwargs):
+        """Queue `save_spectrum(eigvals, filename, **kwargs)`."""
+        self.submit(save_spectrum, eigvals, filename, **kwargs)
+
+    def flush(self):
+        """Wait for every queued job and re-raise the first failure."""
+        self._queue.join()
+        if self._errors:
+            errors, self._errors = self._errors, []
+            raise errors[0]
+
+    def close(self):
+        """Flush, then stop the worker thread."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Keep the original exception; write errors are secondary here.
+            try:
+                self.close()
+            except Exception:
+                pass
@@ -1,6 +1,7 @@
-import numpy as np
 from scipy.linalg import fractional_matrix_power
 
+from src.utils.array_backend import array_namespace
+
 
 def enforce_symmetric(M):
     """
@@ -13,10 +14,10 @@ def enforce_symmetric(M):
     routines (e.g., eigvalsh, fractional_matrix_power).
 
     Args:
-        M (np.ndarray): Square matrix of shape (D, D).
+        M (np.ndarray | torch.Tensor): Square matrix of shape (D, D).
 
     Returns:
-        np.ndarray: Symmetric matrix (D, D).
+        np.ndarray | torch.Tensor: Symmetric matrix (D, D).
     """
     return 0.5 * (M + M.T)
 
@@ -31,7 +32,7 @@ def safe_inverse(M, eps=1e-8):
     singular or ill-conditioned.
 
     Args:
-        M (np.ndarray): Matrix to invert (D, D).
+        M (np.ndarray | torch.Tensor): Matrix to invert (D, D).
         eps (float): Small diagonal regularization. Defaults to 1e-8.
 
     Returns:
@@ -41,9 +42,10 @@ def safe_inverse(M, eps=1e-8):
         - Useful when computing G^{-1} where G may be nearly singular.
         - Ensures the output is symmetric up to numerical error.
     """
+    xp = array_namespace(M)
     M = enforce_symmetric(M)
-    reg = M + eps * np.eye(M.shape[0])
-    return np.linalg.inv(reg)
+    reg = M + eps * xp.eye(M.shape[0])
+    return xp.inv(reg)
 
 
 def fractional_power(M, alpha):
@@ -51,16 +53,25 @@ def fractional_power(M, alpha):
     Compute M^alpha (fractional matrix power) for a symmetric matrix M.
 
     Args:
-        M (np.ndarray): Symmetric positive semidefinite matrix (D, D).
+        M (np.ndarray | torch.Tensor): Symmetric positive semidefinite
+            matrix (D, D).
         alpha (float): Exponent (e.g., -1/2, 1/2).
 
     Returns:
-        np.ndarray: Matrix M^alpha of shape (D, D).
+        np.ndarray | torch.Tensor: Matrix M^alpha of shape (D, D).
 
     Notes:
         - M is symmetrized before exponentiation.
         - fractional_matrix_power requires M to be diagonalizable with
           non-negative eigenvalues when alpha is fractional.
+        - Torch tensors are handled through `eigh`, U diag(λ^alpha) U^T,
+          and stay on their device.
     """
+    xp = array_namespace(M)
     M = enforce_symmetric(M)
-    return fractional_matrix_power(M, alpha)
+    if xp.name == "numpy":
+        return fractional_matrix_power(M, alpha)
+
+    M = xp.asarray(M)
+    eigvals, U = xp.eigh(M)
+    return (U * eigvals**alpha) @ U.T
@@ -126,6 +126,37 @@ def plot_spectrum(eigvals, filename, title=None):
     save_clean(fig, filename)
 
 
+def plot_spectral_density(grid, density, filename, eigvals=None, title=None,
+                          bins=50):
+    """
+    Plot a smoothed eigenvalue density (e.g. from slq_spectral_density)
+    with publication-ready formatting. If exact eigenvalues are available,
+    their normalized histogram is drawn underneath for comparison.
+    Saves automatically to the figure directories.
+    """
+    set_global_style()
+
+    fig, ax = plt.subplots()
+
+    if eigvals is not None:
+        ax.hist(eigvals, bins=bins, density=True, alpha=0.3,
+                label="Exact eigenvalues")
+
+    ax.plot(grid, density, linestyle="-", label="Estimated density")
+    ax.axvline(1.0, color="0.4", linestyle="--", linewidth=1.0)
+    ax.set_xlabel(r"Eigenvalue $\lambda$")
+    ax.set_ylabel("Density")
+
+    if title:
+        ax.set_title(title)
+
+    if eigvals is not None:
+        ax.legend()
+
+    fig.tight_layout()
+    save_clean(fig, filename)
+
+
 def plot_curve(values, filename, xlabel="Step", ylabel="Value", title=None):
     """
     Plot a single curve with publication-quality style.
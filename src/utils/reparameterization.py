@@ -0,0 +1,227 @@
+import numpy as np
+
+
+# ============================================================================
+# Elementwise parameter transforms θ_i = f(ψ_i) and their derivatives
+# ============================================================================
+#
+# Each entry maps the *original* parameter value θ_i to dθ_i/dψ_i, so that a
+# Jacobian can be built from cached θ without ever materializing ψ:
+#
+#     "identity":  θ = ψ            → 1
+#     "log":       θ = exp(ψ)       → θ            (e.g. ψ = log σ, log b)
+#     "square":    θ = sqrt(ψ)      → 1 / (2θ)     (e.g. ψ = σ²)
+#     "logit":     θ = sigmoid(ψ)   → θ (1 − θ)    (e.g. ψ = logit w)
+_DERIVATIVES = {
+    "identity": lambda t: np.ones_like(t),
+    "log": lambda t: t,
+    "square": lambda t: 1.0 / (2.0 * t),
+    "logit": lambda t: t * (1.0 - t),
+}
+
+
+def elementwise_jacobian(theta, transforms):
+    """
+    Jacobian J = ∂θ/∂ψ of an elementwise reparameterization.
+
+    Parameters
+    ----------
+    theta : array_like
+        Original parameter vector θ, shape (D,).
+    transforms : dict[int, str]
+        Map from parameter index to one of "identity", "log", "square",
+        "logit". Unlisted indices are left unchanged.
+
+    Returns
+    -------
+    np.ndarray
+        Diagonal Jacobian of shape (D, D).
+
+    Example
+    -------
+    Gaussian θ = (μ, σ) reparameterized as ψ = (μ, log σ):
+
+        J = elementwise_jacobian([mu, sigma], {1: "log"})
+    """
+    theta = np.asarray(theta, dtype=np.float64)
+    diag = np.ones_like(theta)
+
+    for index, name in transforms.items():
+        try:
+            deriv = _DERIVATIVES[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown transform '{name}'. "
+                f"Expected one of {sorted(_DERIVATIVES)}."
+            ) from None
+        diag[index] = deriv(theta[index])
+
+    return np.diag(diag)
+
+
+def autodiff_jacobian(fn, psi):
+    """
+    Jacobian J = ∂θ/∂ψ of an arbitrary map θ = fn(ψ) via torch autodiff.
+
+    Parameters
+    ----------
+    fn : callable
+        Map from new parameters ψ to original parameters θ, written with
+        torch operations.
+    psi : array_like
+        Point at which to evaluate the Jacobian, shape (D',).
+
+    Returns
+    -------
+    np.ndarray
+        Jacobian of shape (D, D') in float64.
+    """
+    import torch
+    from torch.func import jacrev
+
+    psi_t = torch.as_tensor(np.asarray(psi, dtype=np.float64))
+    return jacrev(fn)(psi_t).detach().cpu().numpy()
+
+
+# ============================================================================
+# Metric transformation M' = Jᵀ M J
+# ============================================================================
+def transform_metric(M, J):
+    """
+    Pull back a symmetric (D, D) matrix through a Jacobian:
+
+        M' = Jᵀ M J
+
+    Both the Fisher matrix and the score covariance transform this way,
+    because the score itself transforms as v' = Jᵀ v.
+
+    Parameters
+    ----------
+    M : np.ndarray
+        Matrix of shape (D, D) or a stack of shape (K, D, D).
+    J : np.ndarray
+        Jacobian of shape (D, D') or a stack of shape (K, D, D').
+
+    Returns
+    -------
+    np.ndarray
+        Transformed matrix, shape (D', D') or (K, D', D').
+    """
+    M = np.asarray(M, dtype=np.float64)
+    J = np.asarray(J, dtype=np.float64)
+    out = np.einsum("...ji,...jk,...kl->...il", J, M, J, optimize=True)
+    return 0.5 * (out + np.swapaxes(out, -1, -2))
+
+
+def reparameterize(G, C, jacobians):
+    """
+    Transform cached G and C under one or many reparameterizations.
+
+    No new samples or score functions are needed: the cost is O(K·D³) for
+    K parameterizations instead of a fresh O(N·D²) Monte Carlo run each.
+
+    Parameters
+    ----------
+    G, C : np.ndarray
+        Fisher matrix and empirical score covariance, shape (D, D).
+    jacobians : np.ndarray or sequence of np.ndarray
+        Single Jacobian (D, D') or a batch of K Jacobians.
+
+    Returns
+    -------
+    tuple:
+        G_new, C_new : np.ndarray
+            Transformed matrices, shape (D', D') or (K, D', D').
+    """
+    J = np.asarray(jacobians, dtype=np.float64)
+    return transform_metric(G, J), transform_metric(C, J)
+
+
+# ============================================================================
+# Batched spectra and invariance check
+# ============================================================================
+def batched_alignment_spectra(G, C, eps=1e-12):
+    """
+    Eigenvalues of H = G^{-1/2} C G^{-1/2} for a stack of (G, C) pairs.
+
+    This is the batched counterpart of `alignment_scalar_numpy`: one
+    stacked `eigh` for G and one stacked `eigvalsh` for H.
+
+    Parameters
+    ----------
+    G, C : np.ndarray
+        Stacks of shape (K, D, D) (a single (D, D) pair is also accepted).
+    eps : float
+        Eigenvalue floor for G.
+
+    Returns
+    -------
+    tuple:
+        A : np.ndarray
+            Scalar diagnostics, shape (K,) (or float for a single pair).
+        eigvals : np.ndarray
+            Eigenvalues of each H, shape (K, D) (or (D,)).
+    """
+    G = np.asarray(G, dtype=np.float64)
+    C = np.asarray(C, dtype=np.float64)
+    single = G.ndim == 2
+    if single:
+        G, C = G[None], C[None]
+
+    G = 0.5 * (G + np.swapaxes(G, -1, -2))
+    C = 0.5 * (C + np.swapaxes(C, -1, -2))
+
+    w, U = np.linalg.eigh(G)
+    inv_sqrt = 1.0 / np.sqrt(np.maximum(w, eps))
+    Gm12 = (U * inv_sqrt[:, None, :]) @ np.swapaxes(U, -1, -2)
+
+    H = Gm12 @ C @ Gm12
+    eigvals = np.linalg.eigvalsh(0.5 * (H + np.swapaxes(H, -1, -2)))
+    A = np.sum(eigvals - 1.0, axis=-1)
+
+    if single:
+        return float(A[0]), eigvals[0]
+    return A, eigvals
+
+
+def invariance_check(G, C, jacobians, eps=1e-12):
+    """
+    Verify reparameterization invariance of the alignment spectrum.
+
+    For invertible Jacobians, H' = J^{-1} (G^{-1} C) J is similar to
+    G^{-1} C, so the eigenvalues λ_i and the scalar A must not change.
+
+    Parameters
+    ----------
+    G, C : np.ndarray
+        Cached Fisher matrix and score covariance, shape (D, D).
+    jacobians : np.ndarray or sequence of np.ndarray
+        Batch of K square Jacobians.
+    eps : float
+        Eigenvalue floor for G.
+
+    Returns
+    -------
+    dict:
+        "A":              A in the original parameterization
+        "lambdas":        eigenvalues in the original parameterization
+        "A_reparam":      A for each Jacobian, shape (K,)
+        "lambdas_reparam": eigenvalues for each Jacobian, shape (K, D)
+        "max_abs_dev":    max |λ'_i − λ_i| over all parameterizations
+    """
+    A0, lam0 = batched_alignment_spectra(G, C, eps)
+
+    J = np.asarray(jacobians, dtype=np.float64)
+    if J.ndim == 2:
+        J = J[None]
+
+    G_new, C_new = reparameterize(G, C, J)
+    A_new, lam_new = batched_alignment_spectra(G_new, C_new, eps)
+
+    return {
+        "A": A0,
+        "lambdas": lam0,
+        "A_reparam": A_new,
+        "lambdas_reparam": lam_new,
+        "max_abs_dev": float(np.max(np.abs(lam_new - lam0[None, :]))),
+    }
@@ -0,0 +1,183 @@
+import numpy as np
+from numpy.random import Generator, PCG64, Philox, SeedSequence
+
+
+# ============================================================================
+# Chunk-invariant sample streams
+# ============================================================================
+#
+# A sampler is described by a `draw(gens, n)` function that produces n
+# samples while consuming each generator in `gens` strictly sequentially
+# (sample i uses the i-th slice of every stream). Under that contract the
+# i-th sample depends only on (seed, i) and on where its stream starts, so
+# any chunking of [0, N) — and any split over workers — reproduces the same
+# array bit for bit, provided every chunk starts its generators at the
+# right position. Two layouts provide those positions:
+#
+#   block_size=None  ("legacy") one PCG64 seeded exactly like
+#                    `np.random.default_rng(seed)`, with stream k starting
+#                    after the N draws of streams 0..k−1. This is the layout
+#                    of the `*_sample` functions, so streamed runs reproduce
+#                    the published numbers. Starting mid-stream is a
+#                    jump-ahead (`advance`) for uniform streams and a
+#                    draw-and-discard for normal ones (O(offset)).
+#
+#   block_size=B     samples are grouped in blocks of B; stream k of block
+#                    b is an independent Philox generator keyed by
+#                    SeedSequence(seed, spawn_key=(b, k)). Workers that start
+#                    on block boundaries need no skipping at all, and the
+#                    stream does not depend on N.
+#
+# A "uniform" stream consumes exactly `width` 64-bit words per sample
+# (`random`, `uniform`, `choice(p=...)`), which is what makes jump-ahead
+# exact; "normal" streams (ziggurat) consume a variable number of words.
+#
+# `draw` is only ever called on whole tiles of `tile_size` samples aligned
+# to the block start; chunks are sliced out of those tiles. Transforms that
+# are not strictly row-local (e.g. a BLAS product with a Cholesky factor,
+# whose rounding may depend on the number of rows) therefore see the same
+# inputs whatever the chunking.
+
+STREAM_KINDS = ("uniform", "normal")
+
+_DISCARD_CHUNK = 1 << 16
+
+
+def _skip(bit_gen, gen, kind, width, count):
+    """Advance one stream by `count` samples of `width` values each."""
+    if count <= 0:
+        return
+    if kind == "uniform":
+        words = count * width
+        if isinstance(bit_gen, Philox):
+            # One Philox counter step yields four 64-bit words.
+            bit_gen.advance(words // 4)
+            gen.random(words % 4)
+        else:
+            bit_gen.advance(words)
+        return
+    for start in range(0, count, _DISCARD_CHUNK):
+        gen.standard_normal((min(_DISCARD_CHUNK, count - start), width))
+
+
+class SampleStream:
+    """
+    Reproducible, chunk-invariant stream of `num_samples` samples.
+
+    Parameters
+    ----------
+    draw : callable
+        `draw(gens, n)` returning n samples along the leading axis and
+        consuming each generator of `gens` sequentially.
+    streams : sequence of (kind, width)
+        One entry per generator passed to `draw`: kind "uniform" or
+        "normal", and the number of values drawn per sample.
+    num_samples : int
+        Length N of the stream.
+    seed : int, SeedSequence or None
+        Root seed.
+    block_size : int or None
+        None for the legacy single-generator layout, or the Philox block
+        length B (see the module notes).
+    tile_size : int
+        Samples per `draw` call. Part of the stream definition for draws
+        that are not row-local.
+    """
+
+    def __init__(self, draw, streams, num_samples, seed=None, block_size=None,
+                 tile_size=16_384):
+        self._draw = draw
+        self.streams = [(kind, int(width)) for kind, width in streams]
+        for kind, _ in self.streams:
+            if kind not in STREAM_KINDS:
+                raise ValueError(f"Unknown stream kind '{kind}'.")
+        if block_size is None and any(k != "uniform" for k, _ in self.streams[:-1]):
+            raise ValueError("The legacy layout needs uniform streams before the last one.")
+        if block_size is not None and block_size < 1:
+            raise ValueError("block_size must be positive.")
+        if tile_size < 1:
+            raise ValueError("tile_size must be positive.")
+
+        self.num_samples = int(num_samples)
+        self.block_size = None if block_size is None else int(block_size)
+        self.tile_size = int(tile_size)
+        self._seed_seq = seed if isinstance(seed, SeedSequence) else SeedSequence(seed)
+
+    @property
+    def _block_len(self):
+        return self.block_size or max(self.num_samples, 1)
+
+    def _open(self, block, offset):
+        """Generators positioned at sample `offset` of block `block`."""
+        gens, base = [], 0
+        for k, (kind, width) in enumerate(self.streams):
+            if self.block_size is None:
+                bit_gen = PCG64(self._seed_seq)
+                if base:
+                    bit_gen.advance(base)
+                base += self.num_samples * width
+            else:
+                ss = self._seed_seq
+                bit_gen = Philox(SeedSequence(
+                    ss.entropy, spawn_key=ss.spawn_key + (block, k), pool_size=ss.pool_size
+                ))
+            gen = Generator(bit_gen)
+            _skip(bit_gen, gen, kind, width, offset)
+            gens.append(gen)
+        return gens
+
+    def _tiles(self, start):
+        """Yield (offset, samples) for consecutive tiles from the one holding `start`."""
+        L = self._block_len
+        T = min(self.tile_size, L)
+        block = start // L
+        local = (start - block * L) // T * T
+        gens = self._open(block, local)
+
+        while True:
+            offset = block * L + local
+            if offset >= self.num_samples:
+                return
+            n = min(T, L - local, self.num_samples - offset)
+            yield offset, self._draw(gens, n)
+            local += n
+            if local >= L:
+                block, local = block + 1, 0
+                gens = self._open(block, 0)
+
+    def iter_chunks(self, chunk_size, start=0, stop=None):
+        """
+        Yield samples [start, stop) in chunks of at most `chunk_size`.
+
+        The concatenation is identical for every chunk size and every
+        split of the range, e.g. one `iter_chunks` per worker over
+        `shard_bounds(N, num_workers)`.
+        """
+        start = int(start)
+        stop = self.num_samples if stop is None else min(int(stop), self.num_samples)
+        chunk_size = int(chunk_size)
+        if start >= stop:
+            return
+
+        pieces, pending = [], 0
+        for offset, tile in self._tiles(start):
+            end = offset + len(tile)
+            tile = tile[max(start - offset, 0):min(len(tile), stop - offset)]
+            while len(tile):
+                take = min(chunk_size - pending, len(tile))
+                pieces.append(tile[:take])
+                pending += take
+                tile = tile[take:]
+                if pending == chunk_size:
+                    yield pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+                    pieces, pending = [], 0
+            if end >= stop:
+                break
+        if pieces:
+            yield pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+
+    def sample(self, start=0, stop=None):
+        """Samples [start, stop) as one array."""
+        stop = self.num_samples if stop is None else min(int(stop), self.num_samples)
+        chunks = list(self.iter_chunks(max(stop - start, 1), start, stop))
+        return chunks[0] if chunks else self._draw(self._open(0, 0), 0)
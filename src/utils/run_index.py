@@ -0,0 +1,219 @@
+import json
+import math
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+
+import numpy as np
+
+from src.utils.paths import get_results_dir
+
+
+# ============================================================================
+# Run index
+# ============================================================================
+#
+# One SQLite database in results/ with a row per experiment run: run id,
+# experiment name, scalar parameters (JSON), seed, start time, duration,
+# A, φ and the path of the result artifact. Queries over parameters and
+# diagnostics are answered from the index alone, without opening any array
+# file; parameters are filtered with SQLite's json_extract.
+
+INDEX_FILENAME = "runs.sqlite"
+
+_COLUMNS = ("run_id", "experiment", "seed", "started", "duration", "A", "phi", "artifact")
+_OPERATORS = ("=", "!=", "<", "<=", ">", ">=")
+_RESERVED = ("A", "phi", "seed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id     TEXT PRIMARY KEY,
+    experiment TEXT NOT NULL,
+    params     TEXT NOT NULL,
+    seed       INTEGER,
+    started    REAL NOT NULL,
+    duration   REAL,
+    A          REAL,
+    phi        REAL,
+    artifact   TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_experiment ON runs (experiment, started);
+"""
+
+
+def default_index_path():
+    """Path of the run index inside 'results/'."""
+    return os.path.join(get_results_dir(), INDEX_FILENAME)
+
+
+def run_params(results):
+    """
+    Scalar parameters of a results dict: every 0-d bool / number / string /
+    None entry except A, φ and the seed. Non-finite floats are kept as
+    strings so the JSON stays valid.
+    """
+    params = {}
+    for key, value in results.items():
+        if key in _RESERVED or isinstance(value, (list, tuple, dict)):
+            continue
+        if np.ndim(value) != 0:
+            continue
+        value = np.asarray(value).item()
+        if isinstance(value, float) and not math.isfinite(value):
+            value = str(value)
+        if value is None or isinstance(value, (bool, int, float, str)):
+            params[key] = value
+    return params
+
+
+def new_run_id():
+    """Fresh run id (32 hex characters)."""
+    return uuid.uuid4().hex
+
+
+def _optional_float(value):
+    return None if value is None else float(value)
+
+
+class RunIndex:
+    """
+    SQLite index of experiment runs.
+
+    Parameters
+    ----------
+    path : str or None
+        Database file; defaults to results/runs.sqlite.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or default_index_path()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._connect() as con:
+            con.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per operation, so an index can be used
+        # from several threads or processes.
+        con = sqlite3.connect(self.path, timeout=30)
+        con.row_factory = sqlite3.Row
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def record(self, experiment, results, artifact=None, params=None, seed=None,
+               started=None, duration=None, run_id=None):
+        """
+        Add one run and return its id.
+
+        Parameters
+        ----------
+        experiment : str
+            Experiment name, e.g. "laplace_misalignment".
+        results : dict
+            Runner output; A and φ are read from it.
+        artifact : str or None
+            Path of the saved result file or directory.
+        params : dict or None
+            Parameters to index; defaults to `run_params(results)`.
+        seed : int or None
+            Defaults to results["seed"] when present.
+        started, duration : float or None
+            Start time (Unix seconds, default now) and wall time in seconds.
+        run_id : str or None
+            Id of the run, e.g. one already used to name its artifact;
+            defaults to `new_run_id()`.
+        """
+        run_id = run_id or new_run_id()
+        params = run_params(results if params is None else params)
+        if seed is None:
+            seed = results.get("seed")
+        row = (
+            run_id,
+            experiment,
+            json.dumps(params, sort_keys=True),
+            None if seed is None else int(seed),
+            time.time() if started is None else float(started),
+            _optional_float(duration),
+            _optional_float(results.get("A")),
+            _optional_float(results.get("phi")),
+            artifact,
+        )
+        with self._connect() as con:
+            con.execute(
+                "INSERT INTO runs (run_id, experiment, params, seed, started, "
+                "duration, A, phi, artifact) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+        return run_id
+
+    @staticmethod
+    def _field(name):
+        """SQL expression and arguments for a column or a parameter name."""
+        if name in _COLUMNS:
+            return name, []
+        return "json_extract(params, ?)", ["$." + json.dumps(name)]
+
+    def query(self, experiment=None, where=None, order_by="started",
+              descending=False, limit=None):
+        """
+        Runs matching every condition, as dicts with decoded `params`.
+
+        `where` maps a column (seed, started, duration, A, phi, ...) or a
+        parameter name to a value (equality) or an (operator, value) pair,
+        e.g. all Laplace misalignment runs with b_data < 0.5 sorted by A:
+
+            index.query("laplace_misalignment",
+                        where={"b_data": ("<", 0.5)}, order_by="A")
+        """
+        clauses, args = [], []
+        if experiment is not None:
+            clauses.append("experiment = ?")
+            args.append(experiment)
+        for name, condition in (where or {}).items():
+            op, value = condition if isinstance(condition, tuple) else ("=", condition)
+            if op not in _OPERATORS:
+                raise ValueError(f"Unknown operator '{op}'. Expected one of {_OPERATORS}.")
+            expr, expr_args = self._field(name)
+            clauses.append(f"{expr} {op} ?")
+            args.extend(expr_args + [value])
+
+        sql = "SELECT * FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        expr, expr_args = self._field(order_by)
+        sql += f" ORDER BY {expr} {'DESC' if descending else 'ASC'}"
+        args.extend(expr_args)
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+
+        with self._connect() as con:
+            rows = con.execute(sql, args).fetchall()
+        return [self._decode(row) for row in rows]
+
+    def get(self, run_id):
+        """One run by id, or None."""
+        with self._connect() as con:
+            row = con.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return None if row is None else self._decode(row)
+
+    def experiments(self):
+        """Distinct experiment names in the index."""
+        with self._connect() as con:
+            rows = con.execute("SELECT DISTINCT experiment FROM runs ORDER BY experiment")
+            return [row[0] for row in rows]
+
+    def __len__(self):
+        with self._connect() as con:
+            return con.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    @staticmethod
+    def _decode(row):
+        run = dict(row)
+        run["params"] = json.loads(run["params"])
+        return run
@@ -0,0 +1,201 @@
+import numpy as np
+
+from src.utils.alignment_core import compute_phi
+
+
+# ============================================================================
+# Matrix-free building blocks for H v = G^{-1/2} C G^{-1/2} v
+# ============================================================================
+def score_covariance_matvec(V):
+    """
+    Matrix-free product with the empirical score covariance
+
+        C v = (1 / N) V (V^T v)
+
+    for a score matrix V of shape (D, N). Cost O(N·D) per product; the
+    D×D matrix is never formed.
+    """
+    V = np.asarray(V)
+    n = float(V.shape[1])
+    return lambda v: V @ (V.T @ v) / n
+
+
+def inverse_sqrt_diagonal_matvec(g, eps=1e-12):
+    """Product with G^{-1/2} for a diagonal Fisher vector g (O(D))."""
+    d = 1.0 / np.sqrt(np.maximum(np.asarray(g, dtype=np.float64), eps))
+    return lambda v: d * v
+
+
+def alignment_matvec(C_matvec, Gm12_matvec):
+    """
+    Compose H v = G^{-1/2} C G^{-1/2} v from the two factor products.
+
+    Parameters
+    ----------
+    C_matvec : callable
+        v ↦ C v (e.g. `score_covariance_matvec(V)` or `lambda v: C @ v`).
+    Gm12_matvec : callable
+        v ↦ G^{-1/2} v (e.g. `inverse_sqrt_diagonal_matvec(g)`).
+    """
+    return lambda v: Gm12_matvec(C_matvec(Gm12_matvec(v)))
+
+
+# ============================================================================
+# Lanczos tridiagonalization
+# ============================================================================
+def lanczos(matvec, v0, num_steps, reorthogonalize=True):
+    """
+    Run `num_steps` Lanczos iterations of a symmetric operator from v0.
+
+    Parameters
+    ----------
+    matvec : callable
+        Symmetric operator v ↦ H v on vectors of shape (D,).
+    v0 : np.ndarray
+        Starting vector (normalized internally).
+    num_steps : int
+        Maximum Krylov dimension m.
+    reorthogonalize : bool
+        Full reorthogonalization against all previous Lanczos vectors.
+        Costs one preallocated (m, D) basis but keeps the Ritz values free
+        of ghost copies.
+
+    Returns
+    -------
+    tuple:
+        alpha : np.ndarray
+            Diagonal of the tridiagonal matrix T, shape (m',).
+        beta : np.ndarray
+            Off-diagonal of T, shape (m' − 1,). m' < m on early breakdown
+            (an invariant subspace was found).
+    """
+    v = np.asarray(v0, dtype=np.float64)
+    v = v / np.linalg.norm(v)
+
+    # Lanczos vectors, filled row by row: reorthogonalizing against the
+    # view Q[:k + 1] avoids re-copying the basis at every step.
+    Q = np.empty((num_steps, v.size)) if reorthogonalize else None
+    alpha, beta = [], []
+    v_prev = np.zeros_like(v)
+    b = 0.0
+
+    for k in range(num_steps):
+        if reorthogonalize:
+            Q[k] = v
+        w = matvec(v) - b * v_prev
+        a = float(v @ w)
+        w -= a * v
+
+        if reorthogonalize:
+            Qk = Q[:k + 1]
+            w -= Qk.T @ (Qk @ w)
+
+        alpha.append(a)
+        b = float(np.linalg.norm(w))
+        if b < 1e-12 * max(1.0, abs(a)):
+            break
+
+        beta.append(b)
+        v_prev, v = v, w / b
+
+    return np.array(alpha), np.array(beta[:len(alpha) - 1])
+
+
+def _tridiag_eigh(alpha, beta):
+    """Ritz values θ_k and squared first components τ_k² of T."""
+    T = np.diag(alpha) + np.diag(beta, 1) + np.diag(beta, -1)
+    theta, S = np.linalg.eigh(T)
+    return theta, S[0, :] ** 2
+
+
+# ============================================================================
+# Stochastic Lanczos quadrature
+# ============================================================================
+def slq_spectral_density(matvec, dim, num_probes=16, num_steps=80,
+                         grid=None, num_grid=512, bandwidth=None, seed=0):
+    """
+    Estimate the eigenvalue density of a symmetric operator H with
+    stochastic Lanczos quadrature (SLQ), using only products v ↦ H v.
+
+    For each Rademacher probe z_p (normalized), m Lanczos steps give a
+    Gauss quadrature rule {θ_k, τ_k²} with
+
+        z_p^T f(H) z_p ≈ Σ_k τ_k² f(θ_k),
+
+    so the spectral measure (1/D) Σ_i δ(x − λ_i) is approximated by the
+    probe average of Σ_k τ_k² δ(x − θ_k), smoothed with a Gaussian kernel.
+    Taking f(λ) = λ yields the trace and hence
+
+        A = Tr(H) − D ≈ D · mean_p Σ_k τ_k² θ_k − D.
+
+    Cost is num_probes · num_steps operator products — no eigendecomposition
+    of a D×D matrix — which makes spectra of 10^6-parameter models feasible.
+
+    Parameters
+    ----------
+    matvec : callable
+        Symmetric operator v ↦ H v (see `alignment_matvec`).
+    dim : int
+        Operator dimension D.
+    num_probes : int
+        Number of random probe vectors.
+    num_steps : int
+        Lanczos steps per probe (quadrature nodes per probe).
+    grid : np.ndarray or None
+        Evaluation points for the density. Defaults to `num_grid` points
+        spanning the Ritz values with a small margin.
+    num_grid : int
+        Grid size if `grid` is None.
+    bandwidth : float or None
+        Gaussian kernel width. Defaults to 1% of the Ritz-value range.
+    seed : int
+        RNG seed for the probes.
+
+    Returns
+    -------
+    dict:
+        "grid":    evaluation points
+        "density": smoothed spectral density (integrates to ≈ 1)
+        "nodes":   Ritz values of every probe, list of arrays
+        "weights": quadrature weights τ_k² of every probe, list of arrays
+        "trace":   estimate of Tr(H)
+        "A":       estimate of Σ_i (λ_i − 1)
+        "phi":     rectified amplitude of the estimate
+    """
+    rng = np.random.default_rng(seed)
+    nodes, weights = [], []
+
+    for _ in range(num_probes):
+        z = rng.choice([-1.0, 1.0], size=dim)
+        alpha, beta = lanczos(matvec, z, min(num_steps, dim))
+        theta, tau2 = _tridiag_eigh(alpha, beta)
+        nodes.append(theta)
+        weights.append(tau2)
+
+    all_nodes = np.concatenate(nodes)
+    all_weights = np.concatenate(weights) / num_probes
+
+    lo, hi = float(all_nodes.min()), float(all_nodes.max())
+    span = max(hi - lo, 1e-12)
+    if bandwidth is None:
+        bandwidth = 0.01 * span
+    if grid is None:
+        grid = np.linspace(lo - 0.1 * span, hi + 0.1 * span, num_grid)
+
+    grid = np.asarray(grid, dtype=np.float64)
+    z = (grid[:, None] - all_nodes[None, :]) / bandwidth
+    kernel = np.exp(-0.5 * z**2) / (np.sqrt(2.0 * np.pi) * bandwidth)
+    density = kernel @ all_weights
+
+    trace = dim * float(all_weights @ all_nodes)
+    A = trace - dim
+
+    return {
+        "grid": grid,
+        "density": density,
+        "nodes": nodes,
+        "weights": weights,
+        "trace": trace,
+        "A": A,
+        "phi": float(compute_phi(A)),
+    }
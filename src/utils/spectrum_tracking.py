@@ -0,0 +1,157 @@
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse.linalg import LinearOperator, lobpcg
+
+
+# ============================================================================
+# Warm-started eigen tracking of H across checkpoints
+# ============================================================================
+class SpectrumTracker:
+    """
+    Track the top-k eigenpairs of a sequence of alignment operators
+    H_1, H_2, ... (e.g. one per training checkpoint).
+
+    The eigenvectors found at checkpoint t seed LOBPCG at checkpoint t + 1.
+    Since consecutive operators are close, the warm-started block is almost
+    an invariant subspace already and converges in a handful of iterations
+    instead of a cold solve from random vectors.
+
+    Modes are matched across checkpoints by maximizing the eigenvector
+    overlaps |U_t^T U_{t+1}| (Hungarian assignment), so the recorded
+    trajectories follow the same physical direction even when eigenvalues
+    cross.
+
+    Parameters
+    ----------
+    k : int
+        Number of tracked eigenpairs.
+    largest : bool
+        Track the largest (reinforcement) or smallest (suppression) modes.
+    tol : float
+        LOBPCG residual tolerance.
+    maxiter : int
+        Maximum LOBPCG iterations per checkpoint.
+    seed : int
+        Seed for the random initial block of the first checkpoint.
+    """
+
+    def __init__(self, k, largest=True, tol=1e-8, maxiter=500, seed=0):
+        self.k = int(k)
+        self.largest = bool(largest)
+        self.tol = tol
+        self.maxiter = maxiter
+        self._rng = np.random.default_rng(seed)
+
+        self.eigvecs = None
+        self.eigvals_history = []
+        self.overlap_history = []
+        self.iterations = []
+        self.labels = []
+
+    # ------------------------------------------------------------------
+    def _initial_block(self, dim):
+        if self.eigvecs is not None and self.eigvecs.shape[0] == dim:
+            return self.eigvecs.copy()
+        return self._rng.normal(size=(dim, self.k))
+
+    def update(self, H, label=None):
+        """
+        Compute the tracked eigenpairs of a new operator.
+
+        Parameters
+        ----------
+        H : np.ndarray or scipy.sparse.linalg.LinearOperator
+            Symmetric alignment operator of shape (D, D). A LinearOperator
+            built from matrix-free products (see `spectral_density`) works
+            as well.
+        label : object
+            Optional checkpoint identifier (step, epoch, file name, ...).
+
+        Returns
+        -------
+        dict:
+            "lambdas":    tracked eigenvalues in track order, shape (k,)
+            "eigvecs":    matching eigenvectors, shape (D, k)
+            "overlaps":   |<u_prev, u_new>| per track (1.0 on first call)
+            "iterations": LOBPCG iterations used
+        """
+        if isinstance(H, np.ndarray):
+            H = 0.5 * (H + H.T)
+            op = H
+        else:
+            op = H if isinstance(H, LinearOperator) else LinearOperator(
+                H.shape, matvec=H, dtype=np.float64
+            )
+
+        dim = op.shape[0]
+        X0 = self._initial_block(dim)
+
+        vals, vecs, history = lobpcg(
+            op, X0, tol=self.tol, maxiter=self.maxiter,
+            largest=self.largest, retResidualNormsHistory=True,
+        )
+
+        if self.eigvecs is None or self.eigvecs.shape[0] != dim:
+            order = np.argsort(vals)[::-1] if self.largest else np.argsort(vals)
+            overlaps = np.ones(self.k)
+        else:
+            M = np.abs(self.eigvecs.T @ vecs)
+            _, order = linear_sum_assignment(-M)
+            overlaps = M[np.arange(self.k), order]
+
+        vals, vecs = vals[order], vecs[:, order]
+
+        # Fix signs so that tracked vectors vary continuously.
+        if self.eigvecs is not None and self.eigvecs.shape[0] == dim:
+            signs = np.sign(np.sum(self.eigvecs * vecs, axis=0))
+            vecs = vecs * np.where(signs == 0, 1.0, signs)
+
+        self.eigvecs = vecs
+        self.eigvals_history.append(vals)
+        self.overlap_history.append(overlaps)
+        self.iterations.append(len(history))
+        self.labels.append(label)
+
+        return {
+            "lambdas": vals,
+            "eigvecs": vecs,
+            "overlaps": overlaps,
+            "iterations": len(history),
+        }
+
+    # ------------------------------------------------------------------
+    @property
+    def trajectories(self):
+        """Eigenvalue trajectories, shape (num_checkpoints, k)."""
+        return np.array(self.eigvals_history)
+
+    def reset(self):
+        """Forget the warm start and all recorded history."""
+        self.eigvecs = None
+        self.eigvals_history.clear()
+        self.overlap_history.clear()
+        self.iterations.clear()
+        self.labels.clear()
+
+
+def track_spectra(operators, k, labels=None, **kwargs):
+    """
+    Convenience wrapper: track the top-k spectrum over a list of operators.
+
+    Returns
+    -------
+    dict:
+        "trajectories": eigenvalue trajectories, shape (T, k)
+        "overlaps":     mode-matching overlaps, shape (T, k)
+        "iterations":   LOBPCG iterations per checkpoint, shape (T,)
+    """
+    tracker = SpectrumTracker(k, **kwargs)
+    labels = labels if labels is not None else [None] * len(operators)
+    for H, label in zip(operators, labels):
+        tracker.update(H, label)
+
+    return {
+        "trajectories": tracker.trajectories,
+        "overlaps": np.array(tracker.overlap_history),
+        "iterations": np.array(tracker.iterations),
+    }
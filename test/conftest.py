@@ -0,0 +1,33 @@
+import pytest
+
+
+# =========================================================
+# Session-scoped experiment runs
+# =========================================================
+#
+# Each runner pair is executed once per test session under the "smoke"
+# profile (see src/utils/profiles.py) and shared by every test that only
+# inspects its output. Tests must treat the returned dicts as read-only.
+
+@pytest.fixture(scope="session")
+def gaussian_runs():
+    from src.experiments.gaussian.run_gaussian import run_all_gaussian
+    return run_all_gaussian(profile="smoke")
+
+
+@pytest.fixture(scope="session")
+def laplace_runs():
+    from src.experiments.laplace.run_laplace import run_all_laplace
+    return run_all_laplace(profile="smoke")
+
+
+@pytest.fixture(scope="session")
+def gmm_runs():
+    from src.experiments.gmm.run_gmm import run_all_gmm
+    return run_all_gmm(profile="smoke")
+
+
+@pytest.fixture(scope="session")
+def mvgaussian_runs():
+    from src.experiments.mvgaussian.run_mvgaussian import run_all_mvgaussian
+    return run_all_mvgaussian(profile="smoke")
@@ -118,3 +118,18 @@ def test_gaussian_misalignment_H_symmetric():
 
     H = result["H"]
     assert_allclose(H, H.T, atol=1e-6)
+
+
+def test_gaussian_misalignment_quadrature_exact():
+    """
+    With estimator="quadrature" C is computed by Gauss–Hermite quadrature,
+    which is exact for the polynomial Gaussian scores. For a unit mean shift
+    (Δ = 1, σ = τ = 1) the closed form is
+
+        C = [[2, 3], [3, 7]],   A = 2 + 7/2 − 2 = 3.5.
+    """
+    result = compute_gaussian_misalignment(estimator="quadrature")
+
+    assert_allclose(result["C"], [[2.0, 3.0], [3.0, 7.0]], atol=1e-12)
+    assert_allclose(result["A"], 3.5, atol=1e-12)
+    assert result["estimator"] == "quadrature"
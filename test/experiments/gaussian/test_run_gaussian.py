@@ -1,7 +1,4 @@
-from src.experiments.gaussian.run_gaussian import run_all_gaussian
-
-
-def test_run_all_gaussian_basic():
+def test_run_all_gaussian_basic(gaussian_runs):
     """
     The run_all_gaussian() interface is a high-level orchestration function that
     executes two canonical Gaussian experiments:
@@ -21,7 +18,7 @@ def test_run_all_gaussian_basic():
     This test verifies correct structural output and ensures downstream
     diagnostics can rely on run_all_gaussian() as a stable API boundary.
     """
-    eq, mis = run_all_gaussian()
+    eq, mis = gaussian_runs
 
     assert isinstance(eq, dict)
     assert isinstance(mis, dict)
@@ -31,7 +28,7 @@ def test_run_all_gaussian_basic():
             assert key in result
 
 
-def test_run_all_gaussian_equilibrium_vs_misalignment():
+def test_run_all_gaussian_equilibrium_vs_misalignment(gaussian_runs):
     """
     Qualitative alignment behavior for Gaussian models:
 
@@ -56,7 +53,7 @@ def test_run_all_gaussian_equilibrium_vs_misalignment():
     This ensures that run_all_gaussian() produces outputs consistent with the
     theoretical alignment structure of the Gaussian family.
     """
-    eq, mis = run_all_gaussian()
+    eq, mis = gaussian_runs
 
     # Equilibrium must be close to zero, within reasonable sampling noise.
     assert abs(eq["A"]) < 0.2
@@ -117,3 +117,16 @@ def test_gmm_equilibrium_A_and_phi():
 
     assert abs(A) < 0.05
     assert phi == 0.0
+
+
+def test_gmm_equilibrium_quadrature_matches_monte_carlo():
+    """
+    Deterministic quadrature gives G = C = E_p[v v^T], hence A = 0 up to
+    quadrature tolerance, and agrees with the Monte Carlo estimate of G
+    within sampling error.
+    """
+    quad = compute_gmm_equilibrium(estimator="quadrature")
+    mc = compute_gmm_equilibrium(num_samples=150_000)
+
+    assert abs(quad["A"]) < 1e-10
+    assert_allclose(quad["G"], mc["G"], atol=0.02)
@@ -0,0 +1,98 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from src.experiments.gmm.fit import (
+    compute_gmm_fit_alignment,
+    fit_gmm_em,
+    fit_gmm_stepwise,
+)
+from src.experiments.gmm.model import gmm_mixture_sample
+from src.experiments.gmm.score import gmm_score_stats
+
+
+MEANS = np.array([-2.0, 0.0, 3.0])
+SCALES = np.array([0.5, 1.0, 0.7])
+WEIGHTS = np.array([0.3, 0.3, 0.4])
+INIT = dict(means=[-1.0, 0.5, 2.0], scales=1.0, weights=np.full(3, 1 / 3))
+
+
+def _data(n=20_000, seed=1):
+    return gmm_mixture_sample(MEANS, SCALES, WEIGHTS, n, seed=seed)
+
+
+def test_em_recovers_parameters_and_is_monotone():
+    """EM on a well-specified mixture recovers θ; log-likelihood never drops."""
+    fit = fit_gmm_em(_data(), tol=1e-10, max_iter=500, **INIT)
+
+    assert fit["converged"]
+    assert np.all(np.diff(fit["log_likelihood"]) > -1e-12)
+    assert_allclose(fit["means"], MEANS, atol=0.05)
+    assert_allclose(fit["scales"], SCALES, atol=0.05)
+    assert_allclose(fit["weights"], WEIGHTS, atol=0.02)
+
+
+def test_em_is_chunk_invariant_and_streams_from_memmap(tmp_path):
+    """Chunking only changes summation order, also for memmapped input."""
+    x = _data(5_000)
+    path = tmp_path / "x.npy"
+    np.save(path, x)
+    x_mm = np.load(path, mmap_mode="r")
+
+    a = fit_gmm_em(x, chunk_size=5_000, max_iter=30, **INIT)
+    b = fit_gmm_em(x_mm, chunk_size=777, max_iter=30, **INIT)
+
+    assert_allclose(b["means"], a["means"], rtol=1e-9)
+    assert_allclose(b["log_likelihood"], a["log_likelihood"], rtol=1e-12)
+
+
+def test_em_score_stats_vanish_at_mle():
+    """The final pass's score statistics have zero mean at the fitted θ."""
+    x = _data()
+    fit = fit_gmm_em(x, tol=1e-12, max_iter=1000, **INIT)
+
+    assert fit["stats"].count == x.size
+    assert np.max(np.abs(fit["stats"].mean())) < 1e-4
+
+
+def test_em_stats_match_returned_parameters_without_convergence():
+    """
+    When max_iter runs out, the returned θ is the one the last pass was
+    evaluated at, so `stats` equals the score statistics recomputed there.
+    """
+    x = _data(5_000)
+    fit = fit_gmm_em(x, max_iter=3, tol=1e-14, **INIT)
+    assert not fit["converged"] and fit["num_iter"] == 3
+
+    again = gmm_score_stats(x, fit["means"], fit["scales"], fit["weights"])
+    assert_allclose(fit["stats"].score_sum, again.score_sum, rtol=1e-10, atol=1e-8)
+    assert_allclose(fit["stats"].gram_sum, again.gram_sum, rtol=1e-10, atol=1e-8)
+
+
+def test_stepwise_em_approaches_batch_em():
+    """One-pass-style stepwise EM lands near batch EM on separated components."""
+    x = gmm_mixture_sample([-4.0, 0.0, 4.0], 0.7, WEIGHTS, 20_000, seed=3)
+    init = dict(means=[-3.0, 0.5, 3.0], scales=1.0, weights=np.full(3, 1 / 3))
+
+    batch = fit_gmm_em(x, tol=1e-10, max_iter=500, **init)
+    online = fit_gmm_stepwise(x, batch_size=1_000, num_epochs=5, **init)
+
+    assert online["num_steps"] == 100
+    assert_allclose(online["means"], batch["means"], atol=0.05)
+    assert_allclose(online["weights"], batch["weights"], atol=0.02)
+
+
+def test_fit_alignment_near_equilibrium_for_well_specified_model():
+    """
+    Fitting the right family to its own samples leaves the model at
+    equilibrium: H ≈ I and A ≈ 0. The redundant softmax logit is dropped,
+    so H has 3K − 1 eigenvalues.
+    """
+    result = compute_gmm_fit_alignment(
+        _data(), num_components=3, num_model_samples=100_000,
+        tol=1e-10, max_iter=500, **INIT,
+    )
+
+    assert result["converged"]
+    assert result["lambdas"].shape == (8,)
+    assert np.max(np.abs(result["mean_score"])) < 1e-3
+    assert abs(result["A"]) < 0.2
@@ -1,7 +1,7 @@
 import numpy as np
 from numpy.testing import assert_allclose
 
-from src.experiments.gmm.model import gmm_sample
+from src.experiments.gmm.model import gmm_sample, gmm_mixture_sample
 
 
 def test_gmm_sample_shape():
@@ -98,3 +98,17 @@ def test_gmm_sample_mean_close_to_theory():
     empirical_mean = np.mean(x)
 
     assert abs(empirical_mean - expected_mean) < 0.05
+
+
+def test_gmm_mixture_sample_shapes_and_weights():
+    """
+    The K-component sampler must return (N,) for univariate means and
+    (N, d) for multivariate means, with component frequencies matching the
+    mixture weights.
+    """
+    x1 = gmm_mixture_sample([0.0, 100.0], 1.0, [0.25, 0.75], 40_000, seed=0)
+    assert x1.shape == (40_000,)
+    assert abs(np.mean(x1 > 50.0) - 0.75) < 0.01
+
+    x2 = gmm_mixture_sample(np.zeros((3, 2)), 1.0, [0.2, 0.3, 0.5], 100, seed=0)
+    assert x2.shape == (100, 2)
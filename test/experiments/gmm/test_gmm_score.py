@@ -1,7 +1,14 @@
 import numpy as np
 from numpy.testing import assert_allclose
 
-from src.experiments.gmm.score import gmm_scores, _gaussian_pdf
+from src.experiments.gmm.score import (
+    gmm_scores,
+    _gaussian_pdf,
+    gmm_log_responsibilities,
+    gmm_mixture_scores,
+    gmm_score_stats,
+)
+from src.experiments.gmm.model import gmm_mixture_sample
 
 
 def test_gmm_scores_shape():
@@ -142,3 +149,118 @@ def test_gmm_scores_expected_value_near_zero_in_equilibrium():
     means = V.mean(axis=1)
 
     assert np.all(np.abs(means) < 0.03)
+
+
+# ---------------------------------------------------
+# K-component log-space kernel
+# ---------------------------------------------------
+
+def test_mixture_scores_reduce_to_two_component_means():
+    """
+    For K = 2, d = 1 and a shared σ, the mean rows of the log-space kernel
+    must coincide with the linear-space two-component implementation:
+
+        ∂/∂μ_k log p = r_k (x − μ_k) / σ²
+    """
+    x = np.linspace(-3, 7, 200)
+    V_old = gmm_scores(x, 0.0, 4.0, 1.2, 0.3)
+    V_new = gmm_mixture_scores(x, [0.0, 4.0], 1.2, [0.3, 0.7])
+
+    assert V_new.shape == (2 + 2 + 2, 200)
+    assert_allclose(V_new[:2], V_old[:2], rtol=1e-10, atol=1e-12)
+
+
+def test_mixture_scores_stable_for_separated_components():
+    """
+    Far in the tail of a well-separated mixture every linear-space density
+    underflows to zero. Log-space responsibilities must remain finite and
+    normalized, and the dominant component must take full responsibility.
+    """
+    x = np.array([60.0, -60.0])
+    log_r, log_p = gmm_log_responsibilities(x, [0.0, 4.0], 1.0, [0.5, 0.5])
+    r = np.exp(log_r)
+
+    assert np.all(np.isfinite(log_p))
+    assert_allclose(r.sum(axis=0), 1.0, atol=1e-12)
+    assert r[1, 0] > 0.999999 and r[0, 1] > 0.999999
+
+    V = gmm_mixture_scores(x, [0.0, 4.0], 1.0, [0.5, 0.5])
+    assert np.all(np.isfinite(V))
+
+
+def test_mixture_scores_match_finite_differences():
+    """
+    Every row of the (mean, scale, logit) block must equal the numerical
+    derivative of log p(x) for a multivariate mixture.
+    """
+    rng = np.random.default_rng(0)
+    K, d = 3, 2
+    means = rng.normal(size=(K, d))
+    scales = rng.uniform(0.5, 1.5, size=(K, d))
+    logits = rng.normal(size=K)
+    x = rng.normal(size=(5, d))
+
+    def log_p(theta):
+        m = theta[:K * d].reshape(K, d)
+        s = theta[K * d:2 * K * d].reshape(K, d)
+        eta = theta[2 * K * d:]
+        w = np.exp(eta - eta.max()); w /= w.sum()
+        return gmm_log_responsibilities(x, m, s, w)[1]
+
+    theta = np.concatenate([means.ravel(), scales.ravel(), logits])
+    w = np.exp(logits - logits.max()); w /= w.sum()
+    V = gmm_mixture_scores(x, means, scales, w)
+
+    h = 1e-6
+    for i in range(theta.size):
+        e = np.zeros_like(theta); e[i] = h
+        fd = (log_p(theta + e) - log_p(theta - e)) / (2 * h)
+        assert_allclose(V[i], fd, rtol=1e-5, atol=1e-7)
+
+
+def test_mixture_scores_zero_mean_under_model():
+    """E_p[v] = 0 for every parameter of a K = 4 bivariate mixture."""
+    means = np.array([[0.0, 0.0], [3.0, 0.0], [0.0, 3.0], [3.0, 3.0]])
+    weights = np.array([0.1, 0.2, 0.3, 0.4])
+    x = gmm_mixture_sample(means, 0.8, weights, 200_000, seed=1)
+
+    V = gmm_mixture_scores(x, means, 0.8, weights)
+
+    assert np.all(np.abs(V.mean(axis=1)) < 0.03)
+
+
+def test_score_stats_are_chunk_invariant():
+    """
+    Chunked accumulation must reproduce the covariance of the full score
+    matrix regardless of the chunk size.
+    """
+    x = gmm_mixture_sample([0.0, 2.0, 5.0], [1.0, 0.5, 1.0], [0.3, 0.3, 0.4],
+                           10_001, seed=2)
+    args = ([0.0, 2.0, 5.0], [1.0, 0.5, 1.0], [0.3, 0.3, 0.4])
+
+    V = gmm_mixture_scores(x, *args)
+    C_ref = (V @ V.T) / x.size
+
+    for chunk in (1_000, 4_096, 20_000):
+        stats = gmm_score_stats(x, *args, chunk_size=chunk)
+        assert stats.count == x.size
+        assert_allclose(stats.second_moment(), C_ref, rtol=1e-10)
+
+
+def test_scores_out_and_work_buffers():
+    """
+    Both GMM kernels accept preallocated buffers; results are unchanged and
+    repeated calls reuse the same memory.
+    """
+    x = gmm_mixture_sample([0.0, 4.0], 1.0, [0.3, 0.7], 2_000, seed=4)
+
+    out, work = np.empty((3, x.size)), np.empty((3, x.size))
+    V = gmm_scores(x, 0.0, 4.0, 1.0, 0.3, out=out, work=work)
+    assert V is out
+    np.testing.assert_array_equal(V, gmm_scores(x, 0.0, 4.0, 1.0, 0.3))
+
+    means, scales, weights = [0.0, 4.0], [1.0, 0.8], [0.3, 0.7]
+    out = np.empty((6, x.size))
+    V = gmm_mixture_scores(x, means, scales, weights, out=out)
+    assert V is out
+    assert_allclose(V, gmm_mixture_scores(x, means, scales, weights), rtol=1e-14)
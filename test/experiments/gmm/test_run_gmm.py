@@ -1,7 +1,4 @@
-from src.experiments.gmm.run_gmm import run_all_gmm
-
-
-def test_run_all_gmm_returns_two_dicts():
+def test_run_all_gmm_returns_two_dicts(gmm_runs):
     """
     The high-level GMM runner must execute the two canonical experiments:
 
@@ -20,7 +17,7 @@ def test_run_all_gmm_returns_two_dicts():
     This structural guarantee ensures that downstream experiments, spectral
     analysis, and visualization tools can treat run_all_gmm() as a stable API.
     """
-    eq, mis = run_all_gmm()
+    eq, mis = gmm_runs
 
     assert isinstance(eq, dict)
     assert isinstance(mis, dict)
@@ -31,7 +28,7 @@ def test_run_all_gmm_returns_two_dicts():
             assert key in result
 
 
-def test_run_all_gmm_equilibrium_vs_misalignment():
+def test_run_all_gmm_equilibrium_vs_misalignment(gmm_runs):
     """
     Qualitative expected behavior for Gaussian Mixture Models:
 
@@ -55,7 +52,7 @@ def test_run_all_gmm_equilibrium_vs_misalignment():
     rather than requiring exact numerical values, which would depend on
     Monte Carlo variance, sampling scale, and parameter configuration.
     """
-    eq, mis = run_all_gmm()
+    eq, mis = gmm_runs
 
     A_eq = eq["A"]
     A_mis = mis["A"]
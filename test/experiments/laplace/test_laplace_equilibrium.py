@@ -119,3 +119,16 @@ def test_laplace_equilibrium_H_symmetric():
     H = result["H"]
 
     assert_allclose(H, H.T, atol=1e-6)
+
+
+def test_laplace_equilibrium_quadrature_exact():
+    """
+    The quadrature estimator splits the integral at the kink x = μ and
+    recovers the exact score covariance C = diag(1/b², 1/b²), so the
+    structural suppression A = −1/2 holds without sampling noise.
+    """
+    b = 2.0
+    result = compute_laplace_equilibrium(mu=0.3, b=b, estimator="quadrature")
+
+    assert_allclose(result["C"], np.diag([1 / b**2, 1 / b**2]), atol=1e-12)
+    assert_allclose(result["A"], -0.5, atol=1e-10)
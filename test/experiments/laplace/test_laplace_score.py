@@ -105,3 +105,14 @@ def test_laplace_scores_mean_zero_in_equilibrium():
 
     assert abs(v_mu_mean) < 0.01
     assert abs(v_b_mean) < 0.01
+
+
+def test_laplace_scores_out_buffer():
+    """`out=` is filled in place with values identical to the default path."""
+    x = np.random.default_rng(0).laplace(size=1_000)
+    buf = np.empty((2, 1_000))
+
+    out = laplace_scores(x, 0.3, 1.7, out=buf)
+
+    assert out is buf
+    np.testing.assert_array_equal(out, laplace_scores(x, 0.3, 1.7))
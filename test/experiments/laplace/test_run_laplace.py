@@ -1,14 +1,11 @@
-from src.experiments.laplace.run_laplace import run_all_laplace
-
-
-def test_run_all_laplace_returns_two_dicts():
+def test_run_all_laplace_returns_two_dicts(laplace_runs):
     """
     The run_all_laplace() interface must return two dictionaries:
     one for the equilibrium experiment and one for the misalignment
     experiment. Each dictionary must contain the key diagnostic
     quantities used throughout the alignment pipeline.
     """
-    eq, mis = run_all_laplace()
+    eq, mis = laplace_runs
 
     assert isinstance(eq, dict)
     assert isinstance(mis, dict)
@@ -19,7 +16,7 @@ def test_run_all_laplace_returns_two_dicts():
             assert key in result
 
 
-def test_run_all_laplace_equilibrium_vs_misalignment():
+def test_run_all_laplace_equilibrium_vs_misalignment(laplace_runs):
     """
     Correct theoretical behavior of the Laplace distribution under the
     alignment diagnostic:
@@ -41,7 +38,7 @@ def test_run_all_laplace_equilibrium_vs_misalignment():
     consistent with the analytical predictions and the behavior shown
     in the paper.
     """
-    eq, mis = run_all_laplace()
+    eq, mis = laplace_runs
 
     A_eq = eq["A"]
     A_mis = mis["A"]
@@ -1,7 +1,8 @@
+import pytest
 import torch
 from torch import nn
 
-from src.experiments.mnist.score import compute_scores
+from src.experiments.mnist.score import compute_scores, parameter_blocks
 from src.experiments.mnist.model import MLP
 
 
@@ -115,3 +116,34 @@ def test_compute_scores_different_batch_produces_different_gradients():
 
     # Distinct batches should yield non-identical gradient signatures
     assert not torch.allclose(g1, g2)
+
+
+def test_parameter_blocks_default_per_tensor():
+    """
+    Without explicit groups, every parameter tensor of the MLP forms one
+    block, in the same order as the flattened gradient:
+
+        fc1.weight (784·4), fc1.bias (4), fc2.weight (4·10), fc2.bias (10)
+
+    and the blocks tile the full score vector of dimension 3190.
+    """
+    blocks = parameter_blocks(MLP())
+
+    assert [name for name, _ in blocks] == [
+        "fc1.weight", "fc1.bias", "fc2.weight", "fc2.bias"
+    ]
+    assert blocks[0][1] == slice(0, 3136)
+    assert blocks[-1][1].stop == 3190
+
+
+def test_parameter_blocks_module_grouping():
+    """
+    Prefix groups merge tensors into module-level blocks; groups that leave
+    parameters uncovered are rejected.
+    """
+    blocks = parameter_blocks(MLP(), {"fc1": ["fc1."], "fc2": ["fc2."]})
+
+    assert blocks == [("fc1", slice(0, 3140)), ("fc2", slice(3140, 3190))]
+
+    with pytest.raises(ValueError):
+        parameter_blocks(MLP(), {"fc1": ["fc1."]})
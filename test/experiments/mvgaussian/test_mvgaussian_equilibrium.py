@@ -0,0 +1,44 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from src.experiments.mvgaussian.equilibrium import compute_mvgaussian_equilibrium
+
+
+def test_mvgaussian_equilibrium_returns_expected_keys():
+    result = compute_mvgaussian_equilibrium(num_samples=20_000, dim=5)
+    for key in ("G", "C", "H", "lambdas", "A", "phi",
+                "dim", "parameterization", "num_samples"):
+        assert key in result
+
+
+def test_mvgaussian_equilibrium_shapes_scale_with_dimension():
+    """
+    D = 2d for the diagonal parameterization and d + d(d+1)/2 for the
+    full one; G, C and H must all be D×D.
+    """
+    diag = compute_mvgaussian_equilibrium(num_samples=5_000, dim=20)
+    assert diag["G"].shape == diag["C"].shape == diag["H"].shape == (40, 40)
+
+    full = compute_mvgaussian_equilibrium(num_samples=5_000, dim=6,
+                                          parameterization="full")
+    assert full["G"].shape == (27, 27)
+
+
+def test_mvgaussian_equilibrium_H_close_to_identity():
+    """
+    Under q = p the Gaussian is an exponential family: C → G exactly, so
+    every eigenvalue of H must approach 1 and A must be small relative to D.
+    """
+    result = compute_mvgaussian_equilibrium(num_samples=200_000, dim=10)
+    assert_allclose(result["lambdas"], 1.0, atol=0.05)
+    assert abs(result["A"]) < 0.1
+
+
+def test_mvgaussian_equilibrium_full_covariance():
+    """The full (μ, vech Σ) parameterization must also sit at equilibrium."""
+    d = 4
+    cov = np.eye(d) + 0.3 * np.ones((d, d))
+    result = compute_mvgaussian_equilibrium(
+        num_samples=200_000, dim=d, parameterization="full", cov=cov
+    )
+    assert_allclose(result["lambdas"], 1.0, atol=0.05)
@@ -0,0 +1,13 @@
+def test_run_all_mvgaussian_returns_equilibrium_and_misalignment(mvgaussian_runs):
+    """
+    The runner must return (eq, mis) dictionaries with the standard
+    diagnostic fields, with misalignment clearly above equilibrium.
+    """
+    eq, mis = mvgaussian_runs
+
+    for result in (eq, mis):
+        for key in ("A", "phi", "G", "C", "H", "lambdas"):
+            assert key in result
+
+    assert abs(eq["A"]) < 0.5
+    assert mis["A"] > eq["A"]
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from src.experiments.fused_kernels import (
+    NUMBA_AVAILABLE,
+    fused_score_stats,
+    resolve_backend,
+    score_second_moment,
+)
+from src.experiments.gaussian.misalignment import compute_gaussian_misalignment
+from src.experiments.gmm.misalignment import compute_gmm_misalignment
+
+CASES = [
+    ("gaussian", (0.3, 1.4)),
+    ("laplace", (-0.2, 0.8)),
+    ("gmm", (0.0, 4.0, 1.0, 0.3)),
+]
+
+requires_numba = pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+
+
+def _x(n=20_001):
+    return np.random.default_rng(0).normal(1.0, 2.0, size=n)
+
+
+@pytest.mark.parametrize("family,params", CASES)
+def test_numpy_stream_matches_materialized(family, params):
+    """The chunked NumPy fallback reproduces V Vᵀ / N and Σ v."""
+    x = _x()
+    stats = fused_score_stats(family, x, *params, backend="numpy", chunk_size=3_000)
+
+    assert stats.count == x.size
+    assert_allclose(stats.second_moment(),
+                    score_second_moment(family, x, *params), rtol=1e-12)
+
+
+@requires_numba
+@pytest.mark.parametrize("family,params", CASES)
+def test_numba_kernel_matches_numpy(family, params):
+    x = _x()
+    a = fused_score_stats(family, x, *params, backend="numba", chunk_size=4_096)
+    b = fused_score_stats(family, x, *params, backend="numpy")
+
+    assert a.count == b.count
+    assert_allclose(a.score_sum, b.score_sum, rtol=1e-10, atol=1e-9)
+    assert_allclose(a.gram_sum, b.gram_sum, rtol=1e-12)
+
+
+@requires_numba
+def test_runners_accept_backend():
+    """Same samples, same G and C up to summation order."""
+    for run in (compute_gaussian_misalignment, compute_gmm_misalignment):
+        ref = run(num_samples=30_000)
+        out = run(num_samples=30_000, backend="numba")
+        assert_allclose(out["C"], ref["C"], rtol=1e-11)
+        assert_allclose(out["A"], ref["A"], rtol=1e-10)
+
+
+def test_backend_validation():
+    assert resolve_backend("auto") == ("numba" if NUMBA_AVAILABLE else "numpy")
+    with pytest.raises(ValueError):
+        resolve_backend("cuda")
+    with pytest.raises(ValueError):
+        fused_score_stats("student_t", _x(10), 0.0, 1.0)
+
+
+@requires_numba
+def test_numba_rejects_float32_precision():
+    with pytest.raises(ValueError):
+        fused_score_stats("gaussian", _x(10), 0.0, 1.0, backend="numba",
+                          precision="float32_kahan")
+
+
+@pytest.mark.parametrize("precision", ["float32_pairwise", "float32_kahan"])
+def test_auto_backend_uses_numpy_under_float32_precision(precision):
+    """"auto" never picks the float64-only numba kernels for float32 policies."""
+    x = _x()
+    auto = fused_score_stats("gaussian", x, 0.0, 1.0, backend="auto", precision=precision)
+    ref = fused_score_stats("gaussian", x, 0.0, 1.0, backend="numpy", precision=precision)
+
+    assert auto.count == ref.count
+    assert_allclose(auto.score_sum, ref.score_sum, rtol=0, atol=0)
+    assert_allclose(auto.gram_sum, ref.gram_sum, rtol=0, atol=0)
+
+    out = compute_gaussian_misalignment(num_samples=10_000, backend="auto", precision=precision)
+    assert out["precision"] == precision
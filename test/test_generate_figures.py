@@ -1,4 +1,12 @@
 import inspect
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
 import src.generate_figures as gf
 
 
@@ -82,3 +90,136 @@ def test_save_functions_importable():
 
     assert callable(save_results)
     assert callable(save_spectrum)
+
+
+
+# Wall-clock budget for importing the pipeline and the analytic runners in a
+# fresh interpreter (about 0.2 s locally; mostly NumPy itself).
+IMPORT_BUDGET_S = 1.5
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import src.generate_figures
+import src.experiments.gaussian.run_gaussian
+import src.experiments.laplace.run_laplace
+import src.experiments.gmm.run_gmm
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in ("torch", "torchvision", "matplotlib", "scipy", "numba")
+               if m in sys.modules)
+print(json.dumps({"elapsed": elapsed, "heavy": heavy}))
+"""
+
+
+def test_analytic_path_import_budget():
+    """
+    Importing the pipeline and the Gaussian / Laplace / GMM runners must not
+    load torch, torchvision, matplotlib, scipy or numba, and must stay within
+    IMPORT_BUDGET_S, so analytic-only batch jobs start fast.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE],
+        cwd=root, capture_output=True, text=True, check=True,
+    )
+    probe = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    assert probe["heavy"] == []
+    assert probe["elapsed"] < IMPORT_BUDGET_S
+
+
+def test_cli_selection():
+    args = gf.parse_args(["--only", "gaussian, gmm", "--no-plots"])
+    assert args.only == ["gaussian", "gmm"]
+    assert args.plots is False
+
+    args = gf.parse_args([])
+    assert args.only == list(gf.EXPERIMENTS) and args.plots is True
+
+    with pytest.raises(SystemExit):
+        gf.parse_args(["--only", "gaussian,cifar"])
+
+
+def test_main_runs_only_selected_experiments(tmp_path, monkeypatch):
+    """
+    `main(["--only", "gaussian", "--no-plots"])` must run just the Gaussian
+    runner, write and index its two results, and produce no figures.
+    """
+    monkeypatch.setattr(
+        "src.utils.paths.get_root_dir",
+        lambda: str(tmp_path).replace("\\", "/")
+    )
+
+    def fake_runner():
+        out = {"lambdas": np.array([1.0, 1.0]), "A": 0.0, "phi": 0.0, "seed": 1}
+        return out, dict(out, A=0.5)
+
+    loaded = []
+    monkeypatch.setattr(gf, "load_runner", lambda name: loaded.append(name) or fake_runner)
+
+    gf.main(["--only", "gaussian", "--no-plots"])
+
+    assert loaded == ["gaussian"]
+    results = sorted(os.listdir(tmp_path / "results"))
+    assert results == ["gaussian_equilibrium", "gaussian_misalignment", "runs.sqlite"]
+    assert not (tmp_path / "paper").exists()
+
+    from src.utils.run_index import RunIndex
+    runs = RunIndex().query("gaussian_misalignment")
+    assert [r["A"] for r in runs] == [0.5]
+
+
+def test_each_run_keeps_its_own_artifact(tmp_path, monkeypatch):
+    """A second run must not overwrite the artifact of an indexed earlier run."""
+    monkeypatch.setattr(
+        "src.utils.paths.get_root_dir",
+        lambda: str(tmp_path).replace("\\", "/")
+    )
+    values = iter([0.25, 0.75])
+
+    def fake_runner():
+        A = next(values)
+        out = {"lambdas": np.array([1.0, 1.0 + A]), "A": A, "phi": A**0.5, "seed": 1}
+        return out, out
+
+    monkeypatch.setattr(gf, "load_runner", lambda name: fake_runner)
+    gf.main(["--only", "gaussian", "--no-plots"])
+    gf.main(["--only", "gaussian", "--no-plots"])
+
+    from src.utils.experiment_io import load_results
+    from src.utils.run_index import RunIndex
+    runs = RunIndex().query("gaussian_equilibrium")
+    assert len({r["artifact"] for r in runs}) == 2
+    for run in runs:
+        assert run["artifact"].endswith(f"{run['run_id']}.npz")
+        assert load_results(run["artifact"])["A"] == run["A"]
+
+
+def test_cli_profile_is_indexed(tmp_path, monkeypatch):
+    """`--profile smoke` is active while the runners execute and indexed."""
+    monkeypatch.setattr(
+        "src.utils.paths.get_root_dir",
+        lambda: str(tmp_path).replace("\\", "/")
+    )
+    assert gf.parse_args([]).profile is None
+    with pytest.raises(SystemExit):
+        gf.parse_args(["--profile", "huge"])
+
+    from src.utils.profiles import get_profile
+
+    seen = []
+
+    def fake_runner():
+        seen.append(get_profile())
+        out = {"lambdas": np.array([1.0]), "A": 0.0, "phi": 0.0}
+        return out, out
+
+    monkeypatch.setattr(gf, "load_runner", lambda name: fake_runner)
+    gf.main(["--only", "laplace", "--no-plots", "--profile", "smoke"])
+
+    assert seen == ["smoke"]
+    from src.utils.run_index import RunIndex
+    runs = RunIndex().query(where={"profile": "smoke"})
+    assert sorted(r["experiment"] for r in runs) == [
+        "laplace_equilibrium", "laplace_misalignment"
+    ]
@@ -1,9 +1,14 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 
 from src.utils.alignment_core import (
+    AlignmentResult,
     compute_alignment_operator,
+    alignment_regularization_path,
     alignment_scalar_numpy,
+    alignment_scalar_trace,
+    compute_block_alignment,
     compute_phi,
 )
 
@@ -147,3 +152,213 @@ def test_phi_behavior():
     assert compute_phi(-5.0) == 0.0
     assert compute_phi(0.0) == 0.0
     assert compute_phi(4.0) == 2.0
+
+
+def _random_spd(rng, D, shift=1.0):
+    M = rng.normal(size=(D, D))
+    return M @ M.T + shift * np.eye(D)
+
+
+def test_diagonal_structure_matches_dense():
+    """
+    Structured kernels.
+
+    A diagonal Fisher matrix passed either as a vector or with
+    structure="diagonal" must reproduce the dense eigendecomposition path:
+
+        H = diag(g)^{-1/2} C diag(g)^{-1/2}
+    """
+    rng = np.random.default_rng(0)
+    g = np.array([0.5, 2.0, 3.0])
+    C = _random_spd(rng, 3)
+
+    H_dense = compute_alignment_operator(np.diag(g), C)
+
+    assert_allclose(compute_alignment_operator(g, C), H_dense, rtol=1e-12)
+    assert_allclose(
+        compute_alignment_operator(np.diag(g), C, structure="diagonal"),
+        H_dense,
+        rtol=1e-12,
+    )
+
+    A_dense, lam_dense = alignment_scalar_numpy(np.diag(g), C)
+    A_diag, lam_diag = alignment_scalar_numpy(g, C)
+    assert_allclose(lam_diag, lam_dense, rtol=1e-12)
+    assert abs(A_diag - A_dense) < 1e-12
+
+
+def test_block_structure_matches_dense():
+    """
+    A block-diagonal G given as a list of blocks, or detected automatically
+    from a dense matrix (even with non-contiguous blocks), must produce the
+    same H as the dense path.
+    """
+    rng = np.random.default_rng(1)
+    blocks = [_random_spd(rng, 2), _random_spd(rng, 3), np.array([[4.0]])]
+    G = np.zeros((6, 6))
+    G[:2, :2], G[2:5, 2:5], G[5:, 5:] = blocks
+    C = _random_spd(rng, 6)
+
+    H_dense = compute_alignment_operator(G, C)
+
+    assert_allclose(compute_alignment_operator(blocks, C), H_dense, atol=1e-12)
+    assert_allclose(
+        compute_alignment_operator(G, C, structure="auto"), H_dense, atol=1e-12
+    )
+
+    perm = rng.permutation(6)
+    Gp, Cp = G[np.ix_(perm, perm)], C[np.ix_(perm, perm)]
+    assert_allclose(
+        compute_alignment_operator(Gp, Cp, structure="block"),
+        compute_alignment_operator(Gp, Cp),
+        atol=1e-12,
+    )
+
+
+def test_alignment_scalar_trace_agrees_with_spectrum():
+    """
+    A = Tr(G^{-1/2} C G^{-1/2}) − D must equal Σ (λ_i − 1) for dense,
+    diagonal and block-diagonal Fisher representations.
+    """
+    rng = np.random.default_rng(2)
+    G = _random_spd(rng, 4)
+    C = _random_spd(rng, 4)
+    A_ref, _ = alignment_scalar_numpy(G, C)
+    assert abs(alignment_scalar_trace(G, C) - A_ref) < 1e-10
+
+    g = np.array([1.0, 2.0, 0.5, 4.0])
+    A_ref, _ = alignment_scalar_numpy(np.diag(g), C)
+    assert abs(alignment_scalar_trace(g, C) - A_ref) < 1e-10
+
+    blocks = [G[:2, :2], G[2:, 2:]]
+    Gb = np.zeros((4, 4))
+    Gb[:2, :2], Gb[2:, 2:] = blocks
+    A_ref, _ = alignment_scalar_numpy(Gb, C)
+    assert abs(alignment_scalar_trace(blocks, C) - A_ref) < 1e-10
+
+
+def test_unknown_structure_rejected():
+    with pytest.raises(ValueError):
+        compute_alignment_operator(np.eye(2), np.eye(2), structure="banded")
+
+
+def test_block_alignment_decomposes_block_diagonal_problem():
+    """
+    For block-diagonal G and C, the per-block diagnostics must add up to the
+    global ones:
+
+        spec(H) = ∪_b spec(H_b),    A = Σ_b A_b
+    """
+    rng = np.random.default_rng(3)
+    G_blocks = [_random_spd(rng, 3), _random_spd(rng, 2)]
+    C_blocks = [_random_spd(rng, 3, 2.0), _random_spd(rng, 2, 2.0)]
+
+    G = np.zeros((5, 5))
+    C = np.zeros((5, 5))
+    G[:3, :3], G[3:, 3:] = G_blocks
+    C[:3, :3], C[3:, 3:] = C_blocks
+
+    out = compute_block_alignment(G_blocks, C_blocks, names=["a", "b"], max_workers=2)
+    A_ref, lam_ref = alignment_scalar_numpy(G, C)
+
+    assert out["names"] == ["a", "b"]
+    assert_allclose(out["lambdas"], lam_ref, rtol=1e-10)
+    assert abs(out["A"] - A_ref) < 1e-10
+    assert abs(out["A"] - sum(b["A"] for b in out["blocks"])) < 1e-12
+    assert out["phi"] == compute_phi(out["A"])
+
+
+def test_regularization_path_matches_pointwise_runs():
+    """
+    Regularization path.
+
+    A(ε) computed for many ε from one eigendecomposition must agree with
+    separate runs of the full pipeline at each ε (eigenvalue floor), and the
+    Tikhonov variant must agree with an explicit G + ε I.
+    """
+    rng = np.random.default_rng(4)
+    M = rng.normal(size=(4, 2))
+    G = M @ M.T + np.diag([0.0, 0.0, 1e-4, 1e-2])   # nearly singular
+    C = _random_spd(rng, 4)
+    eps_values = np.logspace(-8, 0, 9)
+
+    path = alignment_regularization_path(G, C, eps_values)
+    for k, eps in enumerate(eps_values):
+        A_ref, lam_ref = alignment_scalar_numpy(G, C, eps=eps)
+        assert_allclose(path["A"][k], A_ref, rtol=1e-8)
+        assert_allclose(path["lambdas"][k], lam_ref, rtol=1e-8, atol=1e-8)
+        assert path["phi"][k] == pytest.approx(compute_phi(A_ref), rel=1e-8)
+
+    tik = alignment_regularization_path(G, C, eps_values, mode="tikhonov",
+                                        spectra=False)
+    assert "lambdas" not in tik
+    for k, eps in enumerate(eps_values):
+        A_ref, _ = alignment_scalar_numpy(G + eps * np.eye(4), C, eps=0.0)
+        assert_allclose(tik["A"][k], A_ref, rtol=1e-8)
+
+    with pytest.raises(ValueError):
+        alignment_regularization_path(G, C, eps_values, mode="spectral")
+
+
+def test_alignment_result_matches_functions_and_caches(monkeypatch):
+    """
+    AlignmentResult must reproduce the functional API exactly, decompose G
+    and H at most once each, and reuse eigh's eigenvalues once the
+    eigenvectors have been requested.
+    """
+    rng = np.random.default_rng(5)
+    G = _random_spd(rng, 4)
+    C = _random_spd(rng, 4, 2.0)
+
+    calls = {"eigh": 0, "eigvalsh": 0}
+    eigh, eigvalsh = np.linalg.eigh, np.linalg.eigvalsh
+
+    def counting(name, fn):
+        def wrapped(M):
+            calls[name] += 1
+            return fn(M)
+        return wrapped
+
+    H_ref = compute_alignment_operator(G, C)
+    A_ref, lam_ref = alignment_scalar_numpy(G, C)
+
+    monkeypatch.setattr(np.linalg, "eigh", counting("eigh", eigh))
+    monkeypatch.setattr(np.linalg, "eigvalsh", counting("eigvalsh", eigvalsh))
+
+    res = AlignmentResult(G, C)
+    assert np.array_equal(res.H, H_ref)
+    assert np.array_equal(res.eigvals, lam_ref)
+    assert res.A == A_ref and res.phi == compute_phi(A_ref)
+    res.condition_numbers, res.fisher_eigvals, res.regime, res.to_dict()
+    assert calls == {"eigh": 1, "eigvalsh": 1}
+
+    res = AlignmentResult(G, C)
+    U = res.eigvecs
+    assert_allclose(res.H @ U, U * res.eigvals, atol=1e-10)
+    assert calls == {"eigh": 3, "eigvalsh": 1}
+
+
+def test_alignment_result_diagnostics():
+    """Condition numbers, regime classification and dict export."""
+    G = np.diag([1.0, 4.0, 1e-16])
+    res = AlignmentResult(G, np.diag([2.0, 4.0, 1e-16]), eps=1e-12)
+
+    assert res.structure == "dense"
+    assert res.condition_numbers["G"] == pytest.approx(4.0 / 1e-12)
+    assert res.condition_numbers["H"] == pytest.approx(2.0 / 1e-4)
+
+    assert AlignmentResult(np.eye(2), 2 * np.eye(2)).regime == "reinforcement"
+    assert AlignmentResult(np.eye(2), 0.5 * np.eye(2)).regime == "suppression"
+    assert AlignmentResult(np.eye(2), 1.001 * np.eye(2)).regime == "equilibrium"
+    assert AlignmentResult(np.eye(2), np.diag([1.0, 0.0])).condition_numbers["H"] == np.inf
+
+    diag = AlignmentResult(np.array([1.0, 4.0]), np.diag([2.0, 4.0]), structure="diagonal")
+    assert_allclose(diag.fisher_eigvals, [1.0, 4.0])
+    assert diag.condition_numbers["G"] == pytest.approx(4.0)
+
+    out = diag.to_dict(include=("eigvecs", "condition_numbers", "regime"))
+    assert set(out) == {"G", "C", "H", "lambdas", "A", "phi",
+                        "eigvecs", "cond_G", "cond_H", "regime"}
+    assert out["regime"] == "reinforcement"
+    with pytest.raises(ValueError):
+        diag.to_dict(include=("trace",))
@@ -0,0 +1,221 @@
+import multiprocessing as mp
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from src.utils.alignment_stats import (
+    AlignmentStats,
+    compute_shard_stats,
+    listen_local,
+    push_stats,
+    reduce_directory,
+    reduce_sockets,
+    shard_bounds,
+    tree_reduce,
+)
+from src.experiments.gaussian.model import gaussian_stream
+from src.experiments.gaussian.score import gaussian_scores
+from src.experiments.gaussian.misalignment import compute_gaussian_misalignment
+from src.experiments.laplace.model import laplace_stream
+from src.experiments.laplace.score import laplace_scores
+from src.experiments.laplace.misalignment import compute_laplace_misalignment
+
+
+# ---------------------------------------------------
+# Multi-process helpers (module level so they can be pickled)
+# ---------------------------------------------------
+
+def _write_gaussian_shard(args):
+    directory, index, start, stop, N, seed = args
+    x = gaussian_stream(1.0, 1.0, N, seed).sample(start, stop)
+    stats = compute_shard_stats(gaussian_scores, x, 0.0, 1.0, moments=True)
+    stats.save(os.path.join(directory, f"shard_{index:03d}.cfas"))
+
+
+def _push_laplace_shard(args):
+    address, start, stop, N, seed = args
+    x = laplace_stream(0.0, 0.5, N, seed).sample(start, stop)
+    push_stats(address, compute_shard_stats(laplace_scores, x, 0.0, 1.0))
+
+
+# Workers are started with "spawn": a forked child of a process that has
+# already run numba's parallel (TBB) kernels keeps the parent from exiting.
+START_METHOD = "spawn"
+
+
+# ---------------------------------------------------
+# Record semantics
+# ---------------------------------------------------
+
+def test_from_scores_matches_direct_second_moment():
+    """
+    The record must reproduce the empirical covariance used in every
+    experiment, C = (V @ V.T) / N, together with the score mean.
+    """
+    rng = np.random.default_rng(0)
+    V = rng.normal(size=(3, 500))
+
+    stats = AlignmentStats.from_scores(V)
+
+    assert stats.count == 500
+    assert_allclose(stats.second_moment(), (V @ V.T) / 500)
+    assert_allclose(stats.mean(), V.mean(axis=1))
+
+
+def test_merge_is_associative_and_has_identity():
+    """
+    merge() must be associative with zeros(D) as identity, so any reduction
+    tree yields the same record up to floating-point reassociation.
+    """
+    rng = np.random.default_rng(1)
+    a, b, c = (
+        AlignmentStats.from_scores(rng.normal(size=(2, n)), moments=True)
+        for n in (10, 20, 30)
+    )
+
+    left = (a + b) + c
+    right = a + (b + c)
+
+    assert left.count == right.count == 60
+    assert_allclose(left.gram_sum, right.gram_sum, rtol=1e-12)
+    assert_allclose(left.gram_sq_sum, right.gram_sq_sum, rtol=1e-12)
+
+    ident = a + AlignmentStats.zeros(2, moments=True)
+    assert_allclose(ident.gram_sum, a.gram_sum)
+
+
+def test_merge_rejects_dimension_mismatch():
+    """Records of different score dimension cannot be combined."""
+    with pytest.raises(ValueError):
+        AlignmentStats.zeros(2).merge(AlignmentStats.zeros(3))
+
+
+def test_binary_roundtrip_is_exact():
+    """
+    to_bytes()/from_bytes() must be lossless, including the optional
+    contribution moments, and store the Gram matrices as packed triangles.
+    """
+    rng = np.random.default_rng(2)
+    stats = AlignmentStats.from_scores(rng.normal(size=(4, 100)), moments=True)
+
+    blob = stats.to_bytes()
+    back = AlignmentStats.from_bytes(blob)
+
+    assert back.count == stats.count
+    assert_allclose(back.score_sum, stats.score_sum, rtol=0, atol=0)
+    assert_allclose(back.gram_sum, stats.gram_sum, rtol=0, atol=0)
+    assert_allclose(back.gram_sq_sum, stats.gram_sq_sum, rtol=0, atol=0)
+
+    # header + D + 2 packed triangles of D(D+1)/2 float64 each
+    assert len(blob) == 24 + 8 * (4 + 2 * 10)
+
+
+def test_from_bytes_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        AlignmentStats.from_bytes(b"XXXX" + bytes(20))
+
+
+def test_standard_error_shrinks_with_samples():
+    """
+    Contribution moments give the Monte Carlo error of C, which must decay
+    like 1/sqrt(N).
+    """
+    rng = np.random.default_rng(3)
+    small = AlignmentStats.from_scores(rng.normal(size=(2, 1_000)), moments=True)
+    large = AlignmentStats.from_scores(rng.normal(size=(2, 100_000)), moments=True)
+
+    assert np.all(large.standard_error() < small.standard_error())
+
+    with pytest.raises(ValueError):
+        AlignmentStats.zeros(2).standard_error()
+
+
+def test_tree_reduce_matches_sequential_fold():
+    rng = np.random.default_rng(4)
+    shards = [AlignmentStats.from_scores(rng.normal(size=(3, 50))) for _ in range(7)]
+
+    total = tree_reduce(shards)
+
+    fold = shards[0]
+    for s in shards[1:]:
+        fold = fold + s
+
+    assert total.count == 350
+    assert_allclose(total.gram_sum, fold.gram_sum, rtol=1e-12)
+
+
+def test_shard_bounds_cover_range():
+    bounds = shard_bounds(10, 3)
+    assert bounds[0][0] == 0 and bounds[-1][1] == 10
+    assert sum(b - a for a, b in bounds) == 10
+
+
+# ---------------------------------------------------
+# Multi-process map-reduce against single-node experiments
+# ---------------------------------------------------
+
+def test_directory_reduction_matches_single_node_gaussian(tmp_path):
+    """
+    Shards written by separate processes and reduced from a directory must
+    reproduce the single-node Gaussian misalignment covariance C.
+    """
+    N, seed = 40_000, 321
+    jobs = [
+        (str(tmp_path), i, a, b, N, seed)
+        for i, (a, b) in enumerate(shard_bounds(N, 5))
+    ]
+
+    with mp.get_context(START_METHOD).Pool(3) as pool:
+        pool.map(_write_gaussian_shard, jobs)
+
+    stats = reduce_directory(str(tmp_path))
+    single = compute_gaussian_misalignment(num_samples=N, seed=seed)
+
+    assert stats.count == N
+    assert_allclose(stats.second_moment(), single["C"], rtol=1e-12)
+
+
+def test_socket_reduction_matches_single_node_laplace():
+    """
+    Shards pushed over local sockets by separate processes must reproduce
+    the single-node Laplace misalignment covariance C.
+    """
+    N, seed = 30_000, 222
+    server = listen_local()
+    address = server.getsockname()
+    bounds = shard_bounds(N, 4)
+
+    ctx = mp.get_context(START_METHOD)
+    procs = [
+        ctx.Process(target=_push_laplace_shard, args=((address, a, b, N, seed),))
+        for a, b in bounds
+    ]
+    for p in procs:
+        p.start()
+
+    try:
+        stats = reduce_sockets(server, len(bounds))
+    finally:
+        server.close()
+        for p in procs:
+            p.join()
+
+    single = compute_laplace_misalignment(num_samples=N, seed=seed)
+
+    assert stats.count == N
+    assert_allclose(stats.second_moment(), single["C"], rtol=1e-12)
+
+
+def test_binary_format_and_result_schema_share_packing():
+    """The .cfas payload uses the same packed triangle as packed results."""
+    from src.utils.alignment_stats import pack_symmetric
+    from src.utils import experiment_io
+
+    assert experiment_io.pack_symmetric is pack_symmetric
+    V = np.random.default_rng(3).normal(size=(4, 100))
+    stats = AlignmentStats.from_scores(V)
+    header = 24                                   # magic, version, flags, dim, count
+    payload = np.frombuffer(stats.to_bytes()[header:], dtype="<f8")
+    assert np.array_equal(payload[4:], pack_symmetric(stats.gram_sum))
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from src.utils.alignment_core import (
+    AlignmentResult,
+    compute_alignment_operator,
+    alignment_regularization_path,
+    alignment_scalar_numpy,
+    alignment_scalar_trace,
+    compute_block_alignment,
+)
+from src.utils.array_backend import array_namespace, is_torch, to_numpy
+from src.utils.matrix_utils import fractional_power, safe_inverse
+
+torch = pytest.importorskip("torch")
+
+
+def _random_spd(rng, d, shift=0.5):
+    M = rng.normal(size=(d, d))
+    return M @ M.T / d + shift * np.eye(d)
+
+
+def test_namespace_detection():
+    x = np.ones(3)
+    t = torch.ones(3)
+    assert array_namespace(x).name == "numpy"
+    assert array_namespace(x, t).name == "torch"
+    assert array_namespace([x, t]).name == "torch"
+    assert is_torch(t) and not is_torch(x)
+    assert isinstance(to_numpy(t), np.ndarray)
+
+
+def test_torch_inputs_match_numpy_for_all_structures():
+    """
+    Dense, diagonal, auto-detected block and explicit block Fisher matrices
+    give the same H and spectrum on torch tensors as on NumPy arrays, and
+    the results stay torch tensors.
+    """
+    rng = np.random.default_rng(0)
+    blocks = [_random_spd(rng, 2), _random_spd(rng, 3)]
+    G = np.zeros((5, 5))
+    G[:2, :2], G[2:, 2:] = blocks
+    C = _random_spd(rng, 5, 1.0)
+    g = np.array([1.0, 2.0, 0.5, 4.0, 3.0])
+
+    Gt, Ct = torch.from_numpy(G), torch.from_numpy(C)
+    cases = [
+        (G, Gt, None),
+        (G, Gt, "auto"),
+        (g, torch.from_numpy(g), None),
+        (blocks, [torch.from_numpy(b) for b in blocks], None),
+    ]
+    for G_np, G_t, structure in cases:
+        H = compute_alignment_operator(G_t, Ct, structure=structure)
+        assert is_torch(H) and H.dtype == torch.float64
+        assert_allclose(
+            H.numpy(), compute_alignment_operator(G_np, C, structure=structure),
+            atol=1e-12,
+        )
+
+        A_t, lam_t = alignment_scalar_numpy(G_t, Ct, structure=structure)
+        A_n, lam_n = alignment_scalar_numpy(G_np, C, structure=structure)
+        assert is_torch(lam_t)
+        assert_allclose(lam_t.numpy(), lam_n, rtol=1e-10)
+        assert abs(A_t - A_n) < 1e-10
+        assert abs(alignment_scalar_trace(G_t, Ct, structure=structure) - A_n) < 1e-10
+
+
+def test_torch_float32_and_mixed_inputs_are_promoted():
+    rng = np.random.default_rng(1)
+    G, C = _random_spd(rng, 4), _random_spd(rng, 4)
+
+    H = compute_alignment_operator(torch.from_numpy(G).float(), C)
+    assert H.dtype == torch.float64
+    assert_allclose(H.numpy(), compute_alignment_operator(G, C), atol=1e-6)
+
+
+def test_torch_block_alignment_and_regularization_path():
+    rng = np.random.default_rng(2)
+    G_blocks = [_random_spd(rng, 3), _random_spd(rng, 2)]
+    C_blocks = [_random_spd(rng, 3, 2.0), _random_spd(rng, 2, 2.0)]
+    to_t = lambda xs: [torch.from_numpy(x) for x in xs]
+
+    out_t = compute_block_alignment(to_t(G_blocks), to_t(C_blocks))
+    out_n = compute_block_alignment(G_blocks, C_blocks)
+    assert is_torch(out_t["lambdas"])
+    assert_allclose(out_t["lambdas"].numpy(), out_n["lambdas"], rtol=1e-10)
+    assert abs(out_t["A"] - out_n["A"]) < 1e-10
+
+    G, C = _random_spd(rng, 4, 1e-3), _random_spd(rng, 4)
+    eps_values = np.logspace(-6, 0, 5)
+    path_t = alignment_regularization_path(
+        torch.from_numpy(G), torch.from_numpy(C), eps_values
+    )
+    path_n = alignment_regularization_path(G, C, eps_values)
+    for key in ("eps", "A", "phi", "lambdas"):
+        assert is_torch(path_t[key])
+        assert_allclose(path_t[key].numpy(), path_n[key], rtol=1e-8, atol=1e-10)
+
+
+def test_matrix_utils_on_torch():
+    rng = np.random.default_rng(3)
+    M = _random_spd(rng, 4)
+    Mt = torch.from_numpy(M)
+
+    inv = safe_inverse(Mt)
+    assert is_torch(inv)
+    assert_allclose(inv.numpy(), safe_inverse(M), rtol=1e-10)
+
+    for alpha in (-0.5, 0.5, 2.0):
+        P = fractional_power(Mt, alpha)
+        assert is_torch(P)
+        assert_allclose(P.numpy(), np.real(fractional_power(M, alpha)), rtol=1e-8)
+
+
+def test_alignment_result_on_torch():
+    rng = np.random.default_rng(4)
+    G, C = _random_spd(rng, 4), _random_spd(rng, 4)
+    res_t = AlignmentResult(torch.from_numpy(G), torch.from_numpy(C))
+    res_n = AlignmentResult(G, C)
+
+    for name in ("H", "eigvals", "eigvecs", "fisher_eigvals"):
+        assert is_torch(getattr(res_t, name))
+    assert_allclose(res_t.H.numpy(), res_n.H, rtol=1e-10)
+    assert_allclose(res_t.eigvals.numpy(), res_n.eigvals, rtol=1e-10)
+    assert res_t.A == pytest.approx(res_n.A, rel=1e-10)
+    assert res_t.condition_numbers["G"] == pytest.approx(res_n.condition_numbers["G"])
+    assert res_t.regime == res_n.regime
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from src.utils.data_sources import (
+    compute_file_alignment,
+    iter_csv_chunks,
+    iter_npy_chunks,
+    iter_raw_chunks,
+    open_chunks,
+    prefetch,
+    stream_score_stats,
+)
+from src.experiments.gaussian.misalignment import compute_gaussian_misalignment
+from src.experiments.gaussian.model import gaussian_sample
+from src.experiments.gaussian.score import gaussian_scores
+from src.experiments.mvgaussian.score import mvgaussian_scores
+
+
+def test_readers_reproduce_array(tmp_path):
+    """npy, raw and CSV streams must concatenate back to the source data."""
+    x = np.random.default_rng(0).normal(size=(1_003, 3))
+
+    np.save(tmp_path / "x.npy", x)
+    x.astype("<f4").tofile(tmp_path / "x.bin")
+    np.savetxt(tmp_path / "x.csv", x, delimiter=",", header="a,b,c", comments="")
+
+    npy = list(iter_npy_chunks(tmp_path / "x.npy", chunk_size=100))
+    raw = list(iter_raw_chunks(tmp_path / "x.bin", dtype="<f4", num_features=3,
+                               chunk_size=100))
+    csv = list(iter_csv_chunks(tmp_path / "x.csv", chunk_size=100, skip_header=1))
+
+    assert len(npy) == 11 and npy[-1].shape == (3, 3)
+    assert_allclose(np.concatenate(npy), x)
+    assert_allclose(np.concatenate(raw), x, rtol=1e-6)
+    assert_allclose(np.concatenate(csv), x, rtol=1e-12)
+
+    col = np.concatenate(list(iter_csv_chunks(tmp_path / "x.csv", 64,
+                                              columns=1, skip_header=1)))
+    assert col.shape == (1_003,)
+    assert_allclose(col, x[:, 1], rtol=1e-12)
+
+
+def test_prefetch_preserves_order_and_forwards_errors():
+    assert [c.item() for c in prefetch((np.array(i) for i in range(20)), depth=3)] \
+        == list(range(20))
+
+    def failing():
+        yield np.zeros(2)
+        raise OSError("disk gone")
+
+    with pytest.raises(OSError):
+        list(prefetch(failing()))
+
+
+def test_stream_stats_match_in_memory(tmp_path):
+    """Streaming C equals the in-memory covariance, with or without prefetch."""
+    x = np.random.default_rng(1).normal(size=(5_000, 4))
+    np.save(tmp_path / "x.npy", x)
+
+    V = mvgaussian_scores(x, np.zeros(4), np.ones(4))
+    C = V @ V.T / len(x)
+
+    for depth in (0, 2):
+        stats = stream_score_stats(
+            open_chunks(tmp_path / "x.npy", chunk_size=512),
+            mvgaussian_scores, np.zeros(4), np.ones(4), prefetch_depth=depth,
+        )
+        assert stats.count == len(x)
+        assert_allclose(stats.second_moment(), C, rtol=1e-12)
+
+
+def test_file_alignment_matches_gaussian_misalignment(tmp_path):
+    ref = compute_gaussian_misalignment(num_samples=30_000)
+    gaussian_sample(1.0, 1.0, 30_000, seed=321).tofile(tmp_path / "x.f64")
+
+    out = compute_file_alignment(
+        tmp_path / "x.f64", gaussian_scores, (0.0, 1.0), ref["G"], chunk_size=4_096
+    )
+
+    assert out["num_samples"] == 30_000
+    assert_allclose(out["A"], ref["A"], rtol=1e-10)
+
+
+@pytest.mark.parametrize("name", ["x.f64", "x.npy", "x.csv"])
+def test_file_alignment_rejects_empty_file(tmp_path, name):
+    path = tmp_path / name
+    if name.endswith(".npy"):
+        np.save(path, np.empty(0))
+    else:
+        path.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="no samples in"):
+        compute_file_alignment(path, gaussian_scores, (0.0, 1.0), np.diag([1.0, 2.0]))
@@ -1,5 +1,7 @@
 import os
+import threading
 import numpy as np
+import pytest
 import shutil
 
 from src.utils.experiment_io import (
@@ -7,7 +9,12 @@ from src.utils.experiment_io import (
     get_fig_dirs,
     save_spectrum,
     save_results,
+    load_results,
+    AsyncWriter,
+    pack_symmetric,
+    unpack_symmetric,
 )
+from src.utils.alignment_core import AlignmentResult
 
 
 # ---------------------------------------------------
@@ -156,3 +163,158 @@ def test_save_spectrum_does_not_crash_with_small_figures(tmp_path, monkeypatch):
 
     # Correct behavior: no exception is raised
     save_spectrum(eigvals, filename)
+
+
+def test_packed_results_roundtrip(tmp_path, monkeypatch):
+    """
+    The packed schema must store G and C as upper triangles, drop H unless
+    kept, and load back into the same dict as the dense schema (H rebuilt
+    on request with the stored eps).
+    """
+    monkeypatch.setattr(
+        "src.utils.paths.get_root_dir",
+        lambda: str(tmp_path).replace("\\", "/")
+    )
+
+    rng = np.random.default_rng(0)
+    M = rng.normal(size=(6, 6))
+    G = M @ M.T + np.eye(6)
+    C = np.cov(rng.normal(size=(6, 50)))
+    res = AlignmentResult(G, C, eps=1e-3)
+    data = {**res.to_dict(), "estimator": "mc", "num_samples": 50}
+
+    assert np.array_equal(unpack_symmetric(pack_symmetric(G), 6), G)
+    assert np.array_equal(pack_symmetric(G)[:6], G[0])           # row-major
+    assert pack_symmetric(G, np.float32).dtype == np.float32
+
+    save_results(data, "dense.npz")
+    save_results(data, "packed.npz", packed=True, eps=1e-3)
+    save_results(data, "packed32.npz", packed=True, dtype=np.float32, keep=("H",))
+
+    dense = load_results("dense.npz")
+    packed = load_results("packed.npz")
+    assert "H" not in packed
+    assert set(dense) == set(packed) | {"H"}
+    for key in ("G", "C", "lambdas"):
+        assert np.array_equal(packed[key], dense[key])
+    assert packed["A"] == res.A and packed["estimator"] == "mc"
+
+    derived = load_results("packed.npz", derive=True)
+    assert np.array_equal(derived["H"], res.H)
+
+    small = load_results("packed32.npz")
+    assert small["G"].dtype == np.float64
+    np.testing.assert_allclose(small["H"], res.H, rtol=1e-6, atol=1e-6)
+
+    sizes = {name: os.path.getsize(tmp_path / "results" / name)
+             for name in ("dense.npz", "packed.npz")}
+    assert sizes["packed.npz"] < sizes["dense.npz"]
+
+
+def test_packed_results_reject_asymmetric(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "src.utils.paths.get_root_dir",
+        lambda: str(tmp_path).replace("\\", "/")
+    )
+    with pytest.raises(ValueError):
+        save_results({"C": np.arange(4.0).reshape(2, 2)}, "bad.npz", packed=True)
+    with pytest.raises(ValueError):
+        save_results({"G": np.eye(2)}, "bad.npz", packed=True, dtype=np.int32)
+
+
+def test_npy_dir_layout_roundtrip_and_mmap(tmp_path, monkeypatch):
+    """
+    The directory layout must load into the same dict as the NPZ archive,
+    keep scalars in the JSON sidecar, memory-map arrays and honour `keys`.
+    """
+    monkeypatch.setattr(
+        "src.utils.paths.get_root_dir",
+        lambda: str(tmp_path).replace("\\", "/")
+    )
+
+    rng = np.random.default_rng(1)
+    M = rng.normal(size=(5, 5))
+    res = AlignmentResult(M @ M.T + np.eye(5), np.eye(5))
+    data = {**res.to_dict(), "estimator": "mc", "precision": None,
+            "names": np.array(["fc1", "fc2"])}
+
+    save_results(data, "run.npz")
+    save_results(data, "run.npz", layout="npy_dir")
+    save_results(data, "run_packed", layout="npy_dir", packed=True)
+
+    out_dir = tmp_path / "results" / "run"
+    assert (out_dir / "results.json").exists()
+    assert (out_dir / "lambdas.npy").exists() and not (out_dir / "A.npy").exists()
+
+    ref = load_results("run.npz", allow_pickle=True)
+    loaded = load_results("run")
+    assert set(loaded) == set(ref)
+    for key, value in ref.items():
+        if isinstance(value, np.ndarray):
+            assert np.array_equal(loaded[key], value)
+        else:
+            assert loaded[key] == value
+    assert isinstance(loaded["lambdas"], np.memmap)
+
+    partial = load_results("run", keys=("A", "lambdas"))
+    assert set(partial) == {"A", "lambdas"}
+
+    packed = load_results("run_packed", keys=("H", "A"), derive=True)
+    assert np.array_equal(packed["H"], res.H)
+    assert np.array_equal(load_results("run_packed")["G"], ref["G"])
+
+    with pytest.raises(ValueError):
+        save_results(data, "run", layout="hdf5")
+
+
+def test_async_writer_writes_in_background_and_surfaces_errors(tmp_path, monkeypatch):
+    """
+    AsyncWriter must run queued saves on its worker thread, leave no
+    temporary files behind, and re-raise a failed job on flush / exit.
+    """
+    monkeypatch.setattr(
+        "src.utils.paths.get_root_dir",
+        lambda: str(tmp_path).replace("\\", "/")
+    )
+
+    threads = []
+    with AsyncWriter(max_pending=1) as writer:
+        for k in range(3):
+            writer.save_results({"A": float(k), "lambdas": np.arange(k + 1.0)}, f"run_{k}.npz")
+        writer.save_results({"A": 1.0, "x": np.ones(3)}, "run_dir", layout="npy_dir")
+        writer.save_spectrum(np.array([1.0, 2.0]), "spectrum.png")
+        writer.submit(lambda: threads.append(threading.current_thread().name))
+        writer.flush()
+        assert load_results("run_2.npz")["A"] == 2.0
+        assert load_results("run_dir")["A"] == 1.0
+
+    assert threads == ["async-writer"]
+    assert (tmp_path / "paper/figures/generated/spectrum.png").exists()
+    leftovers = [p for p in (tmp_path / "results").iterdir() if p.name.startswith(".")]
+    assert leftovers == []
+
+    writer = AsyncWriter()
+    writer.save_results({"A": 3.0}, "after.npz")
+    writer.submit(_fail)
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()
+    assert load_results("after.npz")["A"] == 3.0
+    with pytest.raises(RuntimeError):
+        writer.submit(print)
+
+
+def _fail():
+    raise OSError("disk full")
+
+
+def test_save_results_replaces_existing_artifacts(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "src.utils.paths.get_root_dir",
+        lambda: str(tmp_path).replace("\\", "/")
+    )
+    for layout in ("npz", "npy_dir"):
+        save_results({"A": 1.0, "x": np.zeros(2), "y": np.ones(2)}, "run.npz", layout=layout)
+        save_results({"A": 2.0, "x": np.ones(4)}, "run.npz", layout=layout)
+        out = load_results("run.npz", mmap=False)
+        assert out["A"] == 2.0 and set(out) == {"A", "x"}
+    assert sorted(p.name for p in (tmp_path / "results").iterdir()) == ["run", "run.npz"]
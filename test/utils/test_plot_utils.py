@@ -8,6 +8,7 @@ from src.utils.plot_utils import (
     set_global_style,
     save_clean,
     plot_spectrum,
+    plot_spectral_density,
     plot_curve,
     plot_multiple_curves,
 )
@@ -154,3 +155,25 @@ def test_plot_multiple_curves_saves(tmp_path, monkeypatch):
 
     assert (fake_dir1 / "multi.png").exists()
     assert (fake_dir2 / "multi.png").exists()
+
+
+def test_plot_spectral_density_saves(tmp_path, monkeypatch):
+    """
+    plot_spectral_density(grid, density, filename) must render a smoothed
+    spectral density (optionally over an exact-eigenvalue histogram) and
+    save it into every figure directory.
+    """
+    fake_dir = tmp_path / "generated"
+
+    monkeypatch.setattr(
+        "src.utils.plot_utils.get_fig_dirs",
+        lambda: [str(fake_dir)]
+    )
+
+    grid = np.linspace(0, 2, 50)
+    density = np.exp(-0.5 * (grid - 1.0) ** 2 / 0.01)
+
+    plot_spectral_density(grid, density, "density.png",
+                          eigvals=np.array([0.9, 1.0, 1.1]))
+
+    assert (fake_dir / "density.png").exists()
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from src.experiments.gaussian.equilibrium import compute_gaussian_equilibrium
+from src.experiments.gaussian.misalignment import compute_gaussian_misalignment
+from src.experiments.laplace.equilibrium import compute_laplace_equilibrium
+from src.experiments.laplace.misalignment import compute_laplace_misalignment
+from src.experiments.gmm.equilibrium import compute_gmm_equilibrium
+from src.experiments.gmm.misalignment import compute_gmm_misalignment
+from src.experiments.mvgaussian.equilibrium import compute_mvgaussian_equilibrium
+from src.experiments.mvgaussian.misalignment import compute_mvgaussian_misalignment
+from src.utils.alignment_stats import AlignmentStats
+from src.utils.precision import (
+    Float32ScoreStats,
+    get_precision,
+    precision_scope,
+    resolve_precision,
+    score_stats_accumulator,
+    set_precision,
+)
+
+
+# Documented float32 tolerances (see src/utils/precision.py):
+# (runner, max |ΔC| / max |C|, |ΔA|)
+RUNNERS = [
+    (compute_gaussian_equilibrium, 1e-6, 1e-6),
+    (compute_gaussian_misalignment, 1e-6, 1e-6),
+    (compute_laplace_equilibrium, 1e-6, 1e-6),
+    (compute_laplace_misalignment, 1e-6, 1e-6),
+    (compute_gmm_equilibrium, 1e-6, 1e-6),
+    (compute_gmm_misalignment, 1e-6, 1e-6),
+    (compute_mvgaussian_equilibrium, 1e-6, 1e-5),
+    (compute_mvgaussian_misalignment, 1e-6, 1e-5),
+]
+
+
+@pytest.mark.parametrize("precision", ["float32_pairwise", "float32_kahan"])
+@pytest.mark.parametrize("runner, tol_C, tol_A", RUNNERS)
+def test_float32_policies_match_float64_results(runner, tol_C, tol_A, precision):
+    ref = runner()
+    out = runner(precision=precision)
+
+    assert ref["precision"] == "float64" and out["precision"] == precision
+    for key in ("G", "C"):
+        err = np.abs(out[key] - ref[key]).max() / np.abs(ref[key]).max()
+        assert err <= tol_C, (key, err)
+    assert abs(out["A"] - ref["A"]) <= tol_A
+    assert out["H"].dtype == np.float64
+
+
+def test_compensated_reductions_beat_naive_float32():
+    """
+    On a long stream of blocks with a large common offset, a naive float32
+    running sum drifts while pairwise and Kahan reductions stay at float32
+    rounding of the block sums.
+    """
+    rng = np.random.default_rng(0)
+    V = (100.0 + rng.normal(size=(2, 400_000))).astype(np.float32)
+    exact = AlignmentStats.from_scores(V.astype(np.float64)).gram_sum
+
+    naive = np.zeros((2, 2), np.float32)
+    for start in range(0, V.shape[1], 256):
+        Vb = V[:, start:start + 256]
+        naive += Vb @ Vb.T
+    err_naive = np.abs(naive - exact).max() / np.abs(exact).max()
+
+    for precision in ("float32_pairwise", "float32_kahan"):
+        acc = Float32ScoreStats(2, precision, block_size=256)
+        for start in range(0, V.shape[1], 10_000):
+            acc.update(V[:, start:start + 10_000])
+        stats = acc.to_stats()
+        err = np.abs(stats.gram_sum - exact).max() / np.abs(exact).max()
+
+        assert stats.count == V.shape[1]
+        assert stats.gram_sum.dtype == np.float64
+        assert err < 1e-6 < err_naive
+        assert_allclose(stats.score_sum, V.astype(np.float64).sum(axis=1), rtol=1e-6)
+
+
+def test_global_policy_and_scope():
+    assert get_precision() == "float64"
+    with precision_scope("float32_kahan"):
+        assert resolve_precision(None) == "float32_kahan"
+        assert resolve_precision("float64") == "float64"
+        assert compute_gaussian_equilibrium(num_samples=1000)["precision"] == "float32_kahan"
+    assert get_precision() == "float64"
+
+    with pytest.raises(ValueError):
+        set_precision("float16")
+    with pytest.raises(ValueError):
+        score_stats_accumulator(3, "float32_pairwise", moments=True)
+    assert isinstance(score_stats_accumulator(3), AlignmentStats)
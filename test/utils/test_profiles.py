@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from src.experiments.fused_kernels import score_second_moment
+from src.experiments.gaussian.equilibrium import compute_gaussian_equilibrium
+from src.experiments.gaussian.model import gaussian_sample
+from src.utils.precision import PRECISIONS, get_precision, precision_scope
+from src.utils.profiles import (
+    PROFILE_ENV,
+    PROFILES,
+    get_profile,
+    profile_scope,
+    profile_settings,
+    resolve_setting,
+    set_profile,
+)
+
+
+def test_profiles_define_every_setting():
+    keys = set(PROFILES["paper"])
+    for settings in PROFILES.values():
+        assert set(settings) == keys
+        assert settings["precision"] in PRECISIONS
+    assert PROFILES["smoke"]["num_samples"] < PROFILES["paper"]["num_samples"] \
+        < PROFILES["production"]["num_samples"]
+
+
+def test_selection_order(monkeypatch):
+    """Explicit argument > set_profile / profile_scope > environment > paper."""
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+    assert get_profile() == "paper"
+
+    monkeypatch.setenv(PROFILE_ENV, "smoke")
+    assert get_profile() == "smoke"
+    assert resolve_setting("num_samples") == PROFILES["smoke"]["num_samples"]
+    assert resolve_setting("num_samples", 123) == 123
+
+    with profile_scope("production"):
+        assert get_profile() == "production"
+        with profile_scope(None):
+            assert get_profile() == "production"
+    assert get_profile() == "smoke"
+
+    set_profile("paper")
+    try:
+        assert get_profile() == "paper"
+    finally:
+        set_profile(None)
+    assert get_profile() == "smoke"
+
+    monkeypatch.setenv(PROFILE_ENV, "huge")
+    with pytest.raises(ValueError):
+        get_profile()
+    with pytest.raises(ValueError):
+        profile_settings("huge")
+
+
+def test_profile_drives_runner_defaults():
+    """
+    Runner defaults follow the active profile (samples, precision);
+    explicit arguments and an explicit precision policy still win.
+    """
+    paper = compute_gaussian_equilibrium()
+    assert paper["num_samples"] == 200_000 and paper["precision"] == "float64"
+
+    with profile_scope("smoke"):
+        smoke = compute_gaussian_equilibrium()
+        assert compute_gaussian_equilibrium(num_samples=1_000)["num_samples"] == 1_000
+    assert smoke["num_samples"] == PROFILES["smoke"]["num_samples"]
+
+    with profile_scope("production"):
+        assert get_precision() == "float32_pairwise"
+        with precision_scope("float64"):
+            assert get_precision() == "float64"
+        assert get_precision() == "float32_pairwise"
+    assert get_precision() == "float64"
+
+
+def test_chunked_second_moment_matches_reference():
+    x = gaussian_sample(0.3, 1.2, 50_000, seed=5)
+    reference = score_second_moment("gaussian", x, 0.0, 1.0)
+    chunked = score_second_moment("gaussian", x, 0.0, 1.0, chunk_size=4_096)
+    np.testing.assert_allclose(chunked, reference, rtol=1e-12)
+
+
+def test_profile_chunk_size_reaches_mvgaussian(monkeypatch):
+    """The multivariate runners stream with the profile's chunk size."""
+    import src.experiments.mvgaussian.equilibrium as mv
+
+    seen = []
+    original = mv.mvgaussian_score_stats
+
+    def spy(x, mu, cov, parameterization, chunk_size, **kwargs):
+        seen.append(chunk_size)
+        return original(x, mu, cov, parameterization, chunk_size, **kwargs)
+
+    monkeypatch.setattr(mv, "mvgaussian_score_stats", spy)
+    mv.compute_mvgaussian_equilibrium(num_samples=1_000, dim=3)
+    with profile_scope("production"):
+        mv.compute_mvgaussian_equilibrium(num_samples=1_000, dim=3)
+    mv.compute_mvgaussian_equilibrium(num_samples=1_000, dim=3, chunk_size=100)
+
+    assert seen == [mv.DEFAULT_CHUNK_SIZE, PROFILES["production"]["chunk_size"], 100]
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from src.utils.quadrature import (
+    check_estimator,
+    expected_score_outer,
+    gauss_hermite_outer,
+)
+from src.experiments.gaussian.score import gaussian_scores
+from src.experiments.gmm.misalignment import compute_gmm_misalignment
+from src.experiments.gmm.model import gmm_pdf
+from src.experiments.gmm.score import gmm_scores
+from src.experiments.laplace.misalignment import compute_laplace_misalignment
+
+
+def _normal_pdf(x, mu, sigma):
+    return np.exp(-0.5 * ((x - mu) / sigma) ** 2) / (np.sqrt(2 * np.pi) * sigma)
+
+
+def test_gauss_kronrod_matches_gauss_hermite_on_gaussian():
+    """Both rules must agree on E_q[v vᵀ] for Gaussian scores and data."""
+    params = (0.2, 1.3)
+    C_gh = gauss_hermite_outer(gaussian_scores, params, 1.0, 0.8)
+    C_gk = expected_score_outer(
+        gaussian_scores, params, lambda t: _normal_pdf(t, 1.0, 0.8)
+    )
+    assert_allclose(C_gk, C_gh, rtol=1e-10, atol=1e-12)
+
+
+def test_truncated_refinement_warns_with_error_estimate():
+    """Hitting max_segments before convergence must not pass silently."""
+    pdf = lambda t: _normal_pdf(t, 1.0, 0.8)
+    with pytest.warns(RuntimeWarning, match="error estimate .* exceeds tolerance"):
+        expected_score_outer(gaussian_scores, (0.2, 1.3), pdf, max_segments=2)
+
+
+def test_laplace_misalignment_quadrature_closed_form():
+    """
+    For μ_model = μ_data and b_data = b_model / 2, E_q|x − μ| = b_data and
+    E_q|x − μ|² = 2 b_data², giving C = diag(1, 1/2) and A = −3/4.
+    """
+    result = compute_laplace_misalignment(estimator="quadrature")
+    assert_allclose(result["C"], np.diag([1.0, 0.5]), atol=1e-12)
+    assert_allclose(result["A"], -0.75, atol=1e-10)
+
+
+def test_gmm_quadrature_is_converged_and_close_to_monte_carlo():
+    """Tightening the tolerance must not move the default result."""
+    theta = (0.0, 4.0, 1.0, 0.5)
+    pdf = lambda t: gmm_pdf(t, 0.0, 5.0, 1.0, 0.7)
+    C = expected_score_outer(gmm_scores, theta, pdf, breakpoints=[0, 4, 5])
+    C_ref = expected_score_outer(gmm_scores, theta, pdf, breakpoints=[0, 4, 5],
+                                 epsabs=1e-15, epsrel=1e-14)
+    assert_allclose(C, C_ref, atol=1e-10)
+
+    quad = compute_gmm_misalignment(estimator="quadrature")
+    mc = compute_gmm_misalignment(num_samples=100_000)
+    assert_allclose(quad["C"], mc["C"], atol=0.05)
+
+
+def test_unknown_estimator_rejected():
+    with pytest.raises(ValueError):
+        check_estimator("bootstrap")
@@ -0,0 +1,109 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from src.utils.reparameterization import (
+    autodiff_jacobian,
+    batched_alignment_spectra,
+    elementwise_jacobian,
+    invariance_check,
+    reparameterize,
+    transform_metric,
+)
+from src.utils.alignment_core import alignment_scalar_numpy
+from src.experiments.gaussian.model import gaussian_sample
+from src.experiments.gaussian.score import gaussian_scores
+from src.experiments.gaussian.misalignment import compute_gaussian_misalignment
+from src.experiments.laplace.misalignment import compute_laplace_misalignment
+from src.experiments.gmm.misalignment import compute_gmm_misalignment
+
+
+def test_transform_matches_resampled_log_sigma_scores():
+    """
+    Under ψ = (μ, log σ) the score transforms as v' = Jᵀ v with
+    J = diag(1, σ). Transforming the cached C must therefore reproduce the
+    covariance of scores recomputed directly in the new parameterization.
+    """
+    mu, sigma = 0.0, 1.7
+    x = gaussian_sample(1.0, 1.0, 20_000, seed=5)
+    V = gaussian_scores(x, mu, sigma)
+    C = (V @ V.T) / x.size
+
+    # Direct log σ score: ∂/∂log σ log p = σ · ∂/∂σ log p
+    V_log = np.vstack([V[0], sigma * V[1]])
+    C_direct = (V_log @ V_log.T) / x.size
+
+    J = elementwise_jacobian([mu, sigma], {1: "log"})
+    assert_allclose(transform_metric(C, J), C_direct, rtol=1e-12)
+
+
+def test_elementwise_jacobian_values():
+    """Each elementwise transform must produce the analytic dθ/dψ."""
+    J = elementwise_jacobian([2.0, 0.25, 0.5], {0: "log", 1: "logit", 2: "square"})
+    assert_allclose(np.diag(J), [2.0, 0.25 * 0.75, 1.0])
+
+
+def test_autodiff_jacobian_matches_analytic():
+    """torch autodiff must agree with the analytic (μ, σ²) Jacobian."""
+    import torch
+
+    psi = np.array([0.3, 2.25])  # (μ, σ²) with σ = 1.5
+    J_ad = autodiff_jacobian(lambda p: torch.stack([p[0], torch.sqrt(p[1])]), psi)
+    J_an = elementwise_jacobian([0.3, 1.5], {1: "square"})
+
+    assert_allclose(J_ad, J_an, rtol=1e-12)
+
+
+def test_batched_spectra_match_alignment_core():
+    """The batched path must agree with alignment_scalar_numpy per item."""
+    rng = np.random.default_rng(0)
+    Gs, Cs = [], []
+    for _ in range(4):
+        M = rng.normal(size=(3, 3))
+        N = rng.normal(size=(3, 3))
+        Gs.append(M @ M.T + 3 * np.eye(3))
+        Cs.append(N @ N.T + np.eye(3))
+
+    A, lam = batched_alignment_spectra(np.array(Gs), np.array(Cs))
+
+    for k in range(4):
+        A_ref, lam_ref = alignment_scalar_numpy(Gs[k], Cs[k])
+        assert_allclose(A[k], A_ref, rtol=1e-10)
+        assert_allclose(lam[k], lam_ref, rtol=1e-10)
+
+
+def test_invariance_across_family_parameterizations():
+    """
+    The paper's invariance claim: (μ, log σ) and (μ, σ²) for the Gaussian,
+    (μ, log b) for Laplace and logit-w for the GMM must all leave the
+    spectrum of H unchanged, without any resampling.
+    """
+    g = compute_gaussian_misalignment(num_samples=20_000)
+    s = g["sigma_model"]
+    Js = [
+        elementwise_jacobian([g["mu_model"], s], {1: "log"}),
+        elementwise_jacobian([g["mu_model"], s], {1: "square"}),
+    ]
+    out = invariance_check(g["G"], g["C"], Js)
+    assert out["max_abs_dev"] < 1e-10
+    assert_allclose(out["A_reparam"], g["A"], atol=1e-10)
+
+    lap = compute_laplace_misalignment(num_samples=20_000)
+    J = elementwise_jacobian([lap["mu_model"], lap["b_model"]], {1: "log"})
+    assert invariance_check(lap["G"], lap["C"], J)["max_abs_dev"] < 1e-10
+
+    gmm = compute_gmm_misalignment(num_samples=20_000)
+    theta = [gmm["mu1_model"], gmm["mu2_model"], gmm["w_model"]]
+    J = elementwise_jacobian(theta, {2: "logit"})
+    assert invariance_check(gmm["G"], gmm["C"], J)["max_abs_dev"] < 1e-8
+
+
+def test_reparameterize_batch_shapes():
+    G = np.diag([1.0, 2.0])
+    C = np.eye(2)
+    J = np.stack([np.eye(2), 2 * np.eye(2), np.diag([1.0, 3.0])])
+
+    G_new, C_new = reparameterize(G, C, J)
+
+    assert G_new.shape == (3, 2, 2)
+    assert_allclose(G_new[1], 4 * G)
+    assert_allclose(C_new[2], np.diag([1.0, 9.0]))
@@ -0,0 +1,118 @@
+import multiprocessing as mp
+
+import numpy as np
+import pytest
+
+from src.experiments.gaussian.model import gaussian_sample, gaussian_stream
+from src.experiments.laplace.model import laplace_sample, laplace_stream
+from src.experiments.gmm.model import (
+    gmm_mixture_sample,
+    gmm_mixture_stream,
+    gmm_sample,
+    gmm_stream,
+)
+from src.experiments.mvgaussian.model import mvgaussian_sample, mvgaussian_stream
+from src.utils.alignment_stats import shard_bounds
+from src.utils.rng_streams import SampleStream
+
+N, SEED = 20_011, 77
+
+MEANS = np.array([[0.0, 1.0], [3.0, -1.0], [-2.0, 0.5]])
+COV = np.array([[2.0, 0.3, 0.0], [0.3, 1.0, 0.2], [0.0, 0.2, 0.5]])
+
+# (stream factory, reference sampler) for every family
+FAMILIES = {
+    "gaussian": (
+        lambda **kw: gaussian_stream(0.5, 1.5, N, SEED, **kw),
+        lambda: gaussian_sample(0.5, 1.5, N, SEED),
+    ),
+    "laplace": (
+        lambda **kw: laplace_stream(-0.2, 0.7, N, SEED, **kw),
+        lambda: laplace_sample(-0.2, 0.7, N, SEED),
+    ),
+    "gmm": (
+        lambda **kw: gmm_stream(-2.0, 2.0, 1.0, 0.3, N, SEED, **kw),
+        lambda: gmm_sample(-2.0, 2.0, 1.0, 0.3, N, SEED),
+    ),
+    "gmm_mixture": (
+        lambda **kw: gmm_mixture_stream(MEANS, 0.5, [0.2, 0.5, 0.3], N, SEED, **kw),
+        lambda: gmm_mixture_sample(MEANS, 0.5, [0.2, 0.5, 0.3], N, SEED),
+    ),
+    "mvgaussian": (
+        lambda **kw: mvgaussian_stream(np.ones(3), COV, N, SEED, **kw),
+        lambda: mvgaussian_sample(np.ones(3), COV, N, SEED),
+    ),
+}
+
+
+def _sharded(stream, num_workers, chunk_size):
+    return np.concatenate([
+        chunk
+        for start, stop in shard_bounds(stream.num_samples, num_workers)
+        for chunk in stream.iter_chunks(chunk_size, start, stop)
+    ])
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+def test_legacy_stream_reproduces_sampler_for_any_chunking(family):
+    """
+    With block_size=None every chunking and worker split concatenates to
+    exactly the array of the family's `*_sample` function.
+    """
+    make, reference = FAMILIES[family]
+    ref = reference()
+    stream = make()
+
+    for chunk_size in (1_000, 4_097, N):
+        assert np.array_equal(np.concatenate(list(stream.iter_chunks(chunk_size))), ref)
+    for workers, chunk_size in ((2, 3_333), (7, 1_024)):
+        assert np.array_equal(_sharded(stream, workers, chunk_size), ref)
+    assert np.array_equal(stream.sample(5_000, 5_001), ref[5_000:5_001])
+
+
+@pytest.mark.parametrize("family", sorted(FAMILIES))
+def test_blocked_stream_is_chunk_and_worker_invariant(family):
+    make, reference = FAMILIES[family]
+    stream = make(block_size=4_096)
+    full = stream.sample()
+
+    assert full.shape == reference().shape
+    assert not np.array_equal(full, reference())
+    for workers, chunk_size in ((1, 777), (3, 4_096), (8, 10_000)):
+        assert np.array_equal(_sharded(stream, workers, chunk_size), full)
+
+    # Blocks do not depend on the stream length.
+    head = make(block_size=4_096)
+    assert np.array_equal(full[:4_096], head.sample(0, 4_096))
+
+
+def test_blocked_streams_differ_across_seeds_and_blocks():
+    a = gaussian_stream(0.0, 1.0, 8_192, seed=1, block_size=4_096).sample()
+    b = gaussian_stream(0.0, 1.0, 8_192, seed=2, block_size=4_096).sample()
+    assert not np.array_equal(a, b)
+    assert not np.array_equal(a[:4_096], a[4_096:])
+
+
+def test_stream_validation():
+    draw = lambda gens, n: gens[0].random(n)
+    with pytest.raises(ValueError):
+        SampleStream(draw, [("poisson", 1)], 10)
+    with pytest.raises(ValueError):
+        SampleStream(draw, [("normal", 1), ("uniform", 1)], 10)
+    with pytest.raises(ValueError):
+        SampleStream(draw, [("uniform", 1)], 10, block_size=0)
+    assert SampleStream(draw, [("uniform", 1)], 10).sample(4, 4).shape == (0,)
+
+
+def _worker_chunk(args):
+    start, stop = args
+    return gaussian_stream(0.5, 1.5, N, SEED, block_size=2_048).sample(start, stop)
+
+
+def test_process_pool_reproduces_single_process_stream():
+    single = gaussian_stream(0.5, 1.5, N, SEED, block_size=2_048).sample()
+    for workers in (2, 5):
+        # "spawn", not "fork": see test_alignment_stats.START_METHOD
+        with mp.get_context("spawn").Pool(workers) as pool:
+            parts = pool.map(_worker_chunk, shard_bounds(N, workers))
+        assert np.array_equal(np.concatenate(parts), single)
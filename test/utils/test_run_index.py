@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from src.utils.run_index import RunIndex, default_index_path, run_params
+
+
+def _laplace_run(b_data, A, seed):
+    return {
+        "G": np.eye(2),
+        "lambdas": np.array([1.0, 1.0 + A]),
+        "A": A,
+        "phi": np.sqrt(max(A, 0.0)),
+        "mu_data": 0.0,
+        "b_data": b_data,
+        "estimator": "mc",
+        "precision": "float64",
+        "seed": seed,
+    }
+
+
+def test_run_params_keeps_scalars_only():
+    params = run_params({
+        **_laplace_run(0.3, 0.5, 7),
+        "num_samples": np.int64(10),
+        "cond": np.inf,
+        "names": ["a", "b"],
+    })
+    assert params == {
+        "mu_data": 0.0, "b_data": 0.3, "estimator": "mc",
+        "precision": "float64", "num_samples": 10, "cond": "inf",
+    }
+
+
+def test_default_index_lives_in_results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "src.utils.paths.get_root_dir",
+        lambda: str(tmp_path).replace("\\", "/")
+    )
+    index = RunIndex()
+    assert index.path == default_index_path()
+    assert (tmp_path / "results" / "runs.sqlite").exists()
+
+
+def test_query_filters_parameters_and_sorts(tmp_path):
+    """
+    Runs are recorded with their scalar parameters and answered from the
+    index alone: filter on a parameter, sort by A, restrict by experiment.
+    """
+    index = RunIndex(str(tmp_path / "runs.sqlite"))
+    ids = {}
+    for b_data, A, seed in [(0.2, 0.9, 1), (0.8, -0.1, 2), (0.4, 0.3, 3)]:
+        ids[seed] = index.record(
+            "laplace_misalignment", _laplace_run(b_data, A, seed),
+            artifact=f"results/run_{seed}.npz", duration=1.5,
+        )
+    index.record("gaussian_equilibrium", {"A": 0.0, "phi": 0.0, "mu": 0.0})
+
+    assert len(index) == 4
+    assert index.experiments() == ["gaussian_equilibrium", "laplace_misalignment"]
+
+    runs = index.query("laplace_misalignment", where={"b_data": ("<", 0.5)}, order_by="A")
+    assert [r["seed"] for r in runs] == [3, 1]
+    assert runs[0]["params"]["b_data"] == 0.4
+    assert runs[0]["artifact"] == "results/run_3.npz"
+    assert runs[0]["duration"] == 1.5
+
+    top = index.query(where={"A": (">", -1.0)}, order_by="A", descending=True, limit=1)
+    assert top[0]["run_id"] == ids[1]
+    assert index.query(where={"estimator": "mc", "seed": 2})[0]["A"] == -0.1
+
+    assert index.get(ids[2])["params"]["b_data"] == 0.8
+    assert index.get("missing") is None
+
+    with pytest.raises(ValueError):
+        index.query(where={"A": ("LIKE", 1)})
@@ -0,0 +1,83 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from scipy.sparse.linalg import aslinearoperator
+
+from src.utils.spectrum_tracking import SpectrumTracker, track_spectra
+
+
+def _checkpoint_operators(D=300, T=5, step=1e-3, seed=0):
+    """
+    Slowly drifting alignment operators H_t = Q_t diag(λ_t) Q_t^T with a few
+    well-separated outlier modes on top of a bulk near 1.
+    """
+    rng = np.random.default_rng(seed)
+    Q, _ = np.linalg.qr(rng.normal(size=(D, D)))
+    base = np.concatenate([[12.0, 8.0, 5.0, 3.0], rng.uniform(0.5, 1.5, D - 4)])
+
+    ops = []
+    for t in range(T):
+        lam = base.copy()
+        lam[:4] += 0.05 * t
+        E = rng.normal(size=(D, D)) * step
+        Qt, _ = np.linalg.qr(Q + E)
+        ops.append((Qt * lam) @ Qt.T)
+        Q = Qt
+    return ops
+
+
+def test_tracker_recovers_top_eigenvalues():
+    """Tracked eigenvalues must match the dense top-k spectrum."""
+    ops = _checkpoint_operators()
+    tracker = SpectrumTracker(k=4)
+
+    for H in ops:
+        out = tracker.update(H)
+        exact = np.sort(np.linalg.eigvalsh(H))[::-1][:4]
+        assert_allclose(np.sort(out["lambdas"])[::-1], exact, rtol=1e-6)
+
+    assert tracker.trajectories.shape == (len(ops), 4)
+
+
+def test_warm_start_converges_faster_than_cold_solve():
+    """
+    Seeding LOBPCG with the previous eigenvectors must need fewer
+    iterations than a cold random start on the same operator.
+    """
+    ops = _checkpoint_operators()
+    warm = SpectrumTracker(k=4)
+    for H in ops:
+        warm.update(H)
+
+    cold_iters = []
+    for H in ops[1:]:
+        cold = SpectrumTracker(k=4, seed=1)
+        cold.update(H)
+        cold_iters.append(cold.iterations[0])
+
+    assert np.mean(warm.iterations[1:]) < np.mean(cold_iters)
+
+
+def test_mode_matching_follows_eigenvectors_through_crossing():
+    """
+    When two eigenvalues cross between checkpoints, tracks must follow the
+    eigenvectors (overlap ≈ 1) rather than the sorted eigenvalue order.
+    """
+    D = 50
+    e = np.eye(D)
+    bulk = np.full(D, 1.0)
+
+    lam1 = bulk.copy(); lam1[0], lam1[1] = 5.0, 4.0
+    lam2 = bulk.copy(); lam2[0], lam2[1] = 4.0, 5.0   # crossing
+
+    out = track_spectra([np.diag(lam1), np.diag(lam2)], k=2)
+
+    assert_allclose(out["trajectories"][0], [5.0, 4.0], rtol=1e-8)
+    assert_allclose(out["trajectories"][1], [4.0, 5.0], rtol=1e-8)
+    assert np.all(out["overlaps"][1] > 0.99)
+
+
+def test_tracker_accepts_linear_operators():
+    H = _checkpoint_operators(D=120, T=1)[0]
+    out = SpectrumTracker(k=2).update(aslinearoperator(H))
+    exact = np.sort(np.linalg.eigvalsh(H))[::-1][:2]
+    assert_allclose(np.sort(out["lambdas"])[::-1], exact, rtol=1e-6)